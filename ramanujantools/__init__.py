@@ -2,6 +2,7 @@ from .position import Position
 from .integer_relation import IntegerRelation
 from .matrix import Matrix
 from .limit import Limit
+from .checkpoint_store import CheckpointStore
 from .generic_polynomial import GenericPolynomial
 from .linear_recurrence import LinearRecurrence
 from .simplify_object import simplify
@@ -14,6 +15,7 @@ __all__ = [
     "Position",
     "Matrix",
     "Limit",
+    "CheckpointStore",
     "GenericPolynomial",
     "LinearRecurrence",
     "simplify",
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Hashable, NamedTuple, Optional
+
+import sys
+import hashlib
+import numbers
+import functools
+import threading
+from collections import OrderedDict
+
+import flint
+import sympy as sp
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+"""The default approximate size limit of every cache, in bytes."""
+
+
+def digest(content: str) -> str:
+    """
+    Returns a deterministic digest of `content`, which is stable across processes and runs.
+    """
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def approximate_size(value, seen: Optional[set] = None) -> int:
+    """
+    Returns the approximate amount of memory held by `value`, in bytes.
+
+    Integers (python, gmpy2 and flint) are measured by their bit length,
+    sympy expressions and matrices by their atoms, and polynomials by their coefficients.
+    Other objects are measured recursively through their attributes, counting every object once.
+    """
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, (bool, float, str, type(None))):
+        return sys.getsizeof(value)
+    if isinstance(value, sp.Integer):
+        return 32 + (int(value).bit_length() + 7) // 8
+    if isinstance(value, sp.Rational):
+        return 32 + (int(value.p).bit_length() + int(value.q).bit_length() + 14) // 8
+    if isinstance(value, sp.Basic):
+        return 64 + sum(approximate_size(arg, seen) for arg in value.args)
+    if isinstance(value, sp.MatrixBase):
+        return 64 + sum(approximate_size(cell, seen) for cell in value)
+    if hasattr(value, "bit_length"):
+        return 32 + (int(value).bit_length() + 7) // 8
+    if isinstance(value, (numbers.Rational, flint.fmpq)):
+        numerator, denominator = int(value.numerator), int(value.denominator)
+        return 32 + (numerator.bit_length() + denominator.bit_length() + 14) // 8
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            approximate_size(k, seen) + approximate_size(v, seen)
+            for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(approximate_size(v, seen) for v in value)
+    if callable(getattr(value, "coeffs", None)):
+        return 64 + sum(approximate_size(c, seen) for c in value.coeffs())
+    attributes = getattr(value, "__dict__", None)
+    if attributes is None:
+        attributes = {
+            name: getattr(value, name)
+            for name in getattr(type(value), "__slots__", ())
+            if hasattr(value, name)
+        }
+    return sys.getsizeof(value) + sum(
+        approximate_size(v, seen) for v in attributes.values()
+    )
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+    max_bytes: int
+    max_entries: Optional[int]
+
+
+class BoundedCache:
+    """
+    A least recently used cache, bounded by the approximate size of its values (see `approximate_size`)
+    and optionally by its number of entries.
+    Values larger than the size limit on their own are not stored.
+
+    All caches are registered by name, such that they can be inspected, cleared and resized together,
+    using `cache_info`, `clear_caches` and `resize_caches`.
+    """
+
+    registry: Dict[str, BoundedCache] = {}
+
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: Optional[int] = None,
+    ) -> BoundedCache:
+        self.name = name
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.entries: OrderedDict[Hashable, tuple] = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.RLock()
+        BoundedCache.registry[name] = self
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable, default=None):
+        """
+        Returns the value of `key` and marks it as recently used, or `default` if it is not cached.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value) -> None:
+        """
+        Caches `value` under `key`, evicting the least recently used values as needed.
+        """
+        size = approximate_size(value)
+        with self.lock:
+            if key in self.entries:
+                self.size -= self.entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self.entries[key] = (value, size)
+            self.size += size
+            self._evict()
+
+    def _evict(self) -> None:
+        while self.entries and (
+            self.size > self.max_bytes
+            or (self.max_entries is not None and len(self.entries) > self.max_entries)
+        ):
+            _, (_, size) = self.entries.popitem(last=False)
+            self.size -= size
+            self.evictions += 1
+
+    def resize(
+        self, max_bytes: Optional[int] = None, max_entries: Optional[int] = None
+    ) -> None:
+        """
+        Changes the limits of the cache, evicting values as needed.
+        Limits that are not given are kept as they are.
+        """
+        with self.lock:
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            if max_entries is not None:
+                self.max_entries = max_entries
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Removes all values from the cache and resets its counters.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self.lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                len(self.entries),
+                self.size,
+                self.max_bytes,
+                self.max_entries,
+            )
+
+
+_MISSING = object()
+
+
+def cached(
+    name: str, max_bytes: int = DEFAULT_MAX_BYTES, max_entries: Optional[int] = None
+) -> Callable:
+    """
+    Memoizes a function (or method) in a `BoundedCache` called `name`.
+    Like `functools.lru_cache`, all arguments must be hashable,
+    and the decorated function exposes `cache_clear` and `cache_info`, as well as the `cache` itself.
+    """
+    cache = BoundedCache(name, max_bytes, max_entries)
+
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = function(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_info = cache.info
+        return wrapper
+
+    return decorator
+
+
+def cache_info() -> Dict[str, CacheInfo]:
+    """
+    Returns the statistics of all caches, by name.
+    """
+    return {name: cache.info() for name, cache in BoundedCache.registry.items()}
+
+
+def clear_caches() -> None:
+    """
+    Clears all caches.
+    """
+    for cache in BoundedCache.registry.values():
+        cache.clear()
+
+
+def resize_caches(
+    max_bytes: Optional[int] = None,
+    max_entries: Optional[int] = None,
+    names: Optional[list] = None,
+) -> None:
+    """
+    Changes the limits of the caches called `names` (or of all caches), see `BoundedCache.resize`.
+    """
+    for name, cache in BoundedCache.registry.items():
+        if names is None or name in names:
+            cache.resize(max_bytes, max_entries)
@@ -0,0 +1,70 @@
+import sympy as sp
+from sympy.abc import n
+
+from ramanujantools import Matrix
+from ramanujantools.caching import (
+    BoundedCache,
+    approximate_size,
+    cached,
+    cache_info,
+    clear_caches,
+)
+
+
+def test_approximate_size():
+    assert approximate_size(2**8000) > approximate_size(2**80) + 900
+    small = Matrix([[1, 2], [3, 4]])
+    large = Matrix([[10**1000, 2], [3, sp.Rational(1, 10**1000)]])
+    assert approximate_size(large) > approximate_size(small) + 800
+
+
+def test_eviction_by_size():
+    cache = BoundedCache("test_eviction_by_size", max_bytes=1000)
+    cache.put(1, 2**5000)
+    cache.put(2, 2**5000)
+    assert 1 == len(cache)
+    assert cache.get(1) is None
+    assert 2**5000 == cache.get(2)
+    cache.put(3, 2**100000)
+    assert cache.get(3) is None
+    info = cache.info()
+    assert (1, 2, 1, 1) == (info.hits, info.misses, info.evictions, info.entries)
+
+
+def test_eviction_order():
+    cache = BoundedCache("test_eviction_order", max_entries=2)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    cache.get(1)
+    cache.put(3, 3)
+    assert 1 == cache.get(1)
+    assert cache.get(2) is None
+    cache.resize(max_entries=1)
+    assert [1] == list(cache.entries)
+
+
+def test_cached():
+    calls = []
+
+    @cached("test_cached")
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert 9 == square(3)
+    assert 9 == square(3)
+    assert 16 == square(x=4)
+    assert [3, 4] == calls
+    assert 1 == cache_info()["test_cached"].hits
+    clear_caches()
+    assert 0 == square.cache_info().entries
+
+
+def test_walk_cache():
+    m = Matrix([[0, n**2], [1, n + 1]])
+    Matrix._walk_inner.cache_clear()
+    m.walk({n: 1}, 100, {n: 1})
+    m.walk({n: 1}, 100, {n: 1})
+    info = Matrix._walk_inner.cache_info()
+    assert (1, 1) == (info.hits, info.misses)
+    assert info.size > 0
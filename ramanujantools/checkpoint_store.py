@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import os
+import math
+import pickle
+import tempfile
+import sympy as sp
+from gmpy2 import mpz
+
+import ramanujantools as rt
+from ramanujantools.caching import digest
+
+
+class CheckpointStore:
+    r"""
+    Stores walk results on disk, such that later walks can resume from them.
+
+    Every walk is keyed by its matrix, trajectory and start,
+    and every stored checkpoint holds the accumulated product $\prod_{i=0}^{d-1}M(s + i \cdot t)$ at some depth $d$.
+    Numeric products are stored as gmpy2 integers (a flat list of numerators and a common denominator),
+    and symbolic products are stored as pickled sympy matrices.
+
+    Example:
+        >>> store = CheckpointStore("walks")
+        >>> m.walk({n: 1}, 10**5, {n: 1}, store=store)  # calculated from scratch and stored
+        >>> m.walk({n: 1}, 10**6, {n: 1}, store=store)  # resumed from depth 10**5
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(matrix: rt.Matrix, trajectory: Dict, start: Dict) -> str:
+        """
+        Returns the key of a walk, which is a digest of the matrix, trajectory and start.
+        """
+        return digest(
+            repr(
+                (
+                    matrix.digest(),
+                    rt.Position(trajectory).digest(),
+                    rt.Position(start).digest(),
+                )
+            )
+        )
+
+    def _path(self, key: str, depth: Optional[int] = None) -> str:
+        path = os.path.join(self.directory, key)
+        if depth is None:
+            return path
+        return os.path.join(path, f"{depth}.pickle")
+
+    def depths(self, key: str) -> List[int]:
+        """
+        Returns all stored depths of the walk `key`, sorted.
+        """
+        path = self._path(key)
+        if not os.path.isdir(path):
+            return []
+        return sorted(
+            int(name.split(".")[0])
+            for name in os.listdir(path)
+            if name.endswith(".pickle")
+        )
+
+    @staticmethod
+    def _serialize(matrix: rt.Matrix) -> Tuple:
+        if all(cell.is_Rational for cell in matrix):
+            denominator = math.lcm(*[int(cell.q) for cell in matrix])
+            values = [
+                mpz(int(cell.p) * (denominator // int(cell.q))) for cell in matrix
+            ]
+            return ("numeric", matrix.rows, matrix.cols, values, mpz(denominator))
+        return ("sympy", matrix)
+
+    @staticmethod
+    def _deserialize(data: Tuple) -> rt.Matrix:
+        if data[0] == "numeric":
+            _, rows, cols, values, denominator = data
+            if denominator == 1:
+                return rt.Matrix(rows, cols, [int(value) for value in values])
+            return rt.Matrix(
+                rows,
+                cols,
+                [sp.Rational(int(value), int(denominator)) for value in values],
+            )
+        return data[1]
+
+    def save(self, key: str, depth: int, matrix: rt.Matrix) -> None:
+        """
+        Stores the accumulated product `matrix` of the walk `key` at `depth`.
+        The file is written atomically, so concurrent jobs never read a partial checkpoint.
+        """
+        path = self._path(key)
+        os.makedirs(path, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=path, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            pickle.dump(self._serialize(matrix), file)
+        os.replace(temporary, self._path(key, depth))
+
+    def load(self, key: str, depth: int) -> rt.Matrix:
+        """
+        Returns the stored product of the walk `key` at `depth`.
+        """
+        with open(self._path(key, depth), "rb") as file:
+            return self._deserialize(pickle.load(file))
+
+    def deepest(self, key: str, max_depth: int) -> Tuple[int, Optional[rt.Matrix]]:
+        """
+        Returns the deepest stored checkpoint of the walk `key` that is not deeper than `max_depth`,
+        as a tuple (depth, matrix), or (0, None) if there is no such checkpoint.
+        """
+        depths = [depth for depth in self.depths(key) if depth <= max_depth]
+        if len(depths) == 0:
+            return 0, None
+        return depths[-1], self.load(key, depths[-1])
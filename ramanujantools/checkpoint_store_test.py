@@ -0,0 +1,41 @@
+import sympy as sp
+from sympy.abc import n, x
+
+from ramanujantools import Matrix, CheckpointStore
+
+
+def test_key():
+    m = Matrix([[0, n**2], [1, n + 1]])
+    assert CheckpointStore.key(m, {n: 1}, {n: 1}) == CheckpointStore.key(
+        Matrix([[0, n**2], [1, n + 1]]), {n: 1}, {n: 1}
+    )
+    assert CheckpointStore.key(m, {n: 1}, {n: 1}) != CheckpointStore.key(
+        m, {n: 1}, {n: 2}
+    )
+    assert CheckpointStore.key(m, {n: 1}, {n: 1}) != CheckpointStore.key(
+        m, {n: 2}, {n: 1}
+    )
+    assert CheckpointStore.key(m, {n: 1}, {n: 1}) != CheckpointStore.key(
+        m.T, {n: 1}, {n: 1}
+    )
+
+
+def test_save_load(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    numeric = Matrix([[1, sp.Rational(2, 3)], [-(10**50), 0]])
+    symbolic = Matrix([[x, 1 / (x + 1)], [3, x**2]])
+    store.save("numeric", 7, numeric)
+    store.save("symbolic", 3, symbolic)
+    assert numeric == store.load("numeric", 7)
+    assert symbolic == store.load("symbolic", 3)
+
+
+def test_deepest(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    assert (0, None) == store.deepest("key", 100)
+    for depth in [10, 30, 20]:
+        store.save("key", depth, Matrix([[depth]]))
+    assert [10, 20, 30] == store.depths("key")
+    assert (20, Matrix([[20]])) == store.deepest("key", 25)
+    assert (30, Matrix([[30]])) == store.deepest("key", 100)
+    assert (0, None) == store.deepest("key", 5)
@@ -1,5 +1,6 @@
 from .cmf import CMF
+from .trajectory_store import TrajectoryMatrixStore
 
 from . import ffbar, known_cmfs
 
-__all__ = ["CMF", "ffbar", "known_cmfs"]
+__all__ = ["CMF", "TrajectoryMatrixStore", "ffbar", "known_cmfs"]
@@ -1,15 +1,49 @@
 from __future__ import annotations
-from typing import Dict, List, Optional, Set
-from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
+import math
+import random
 import itertools
 from multimethod import multimethod
 
+import flint
+import gmpy2
+import numpy as np
 import sympy as sp
 from sympy.abc import n
 
 from ramanujantools import Position, Matrix, Limit, simplify
-from ramanujantools.flint_core import FlintMatrix, FlintContext, mpoly_ctx
+from ramanujantools.caching import cached, digest
+from ramanujantools.checkpoint_store import CheckpointStore
+from ramanujantools.flint_core import (
+    FlintMatrix,
+    FlintFractionMatrix,
+    FlintContext,
+    mpoly_ctx,
+)
+from ramanujantools.flint_core.context import number_from_sympy
+from ramanujantools.cmf.segment_plan import SegmentPlan
+from ramanujantools.cmf.sweep import SweepResult, run_sweep
+from ramanujantools.cmf.trajectory_store import TrajectoryMatrixStore
+
+LATTICE_WALK_COST_RATIO = 32
+"""
+The approximate cost of calculating a trajectory matrix, per squared trajectory length,
+in units of a single numeric matrix product. See `CMF._prefer_lattice_walk`.
+"""
+
+CONSERVING_ERROR_PROBABILITY = 2**-64
+"""The default probability that `CMF.assert_conserving` accepts matrices that are not conserving."""
+
+CONSERVING_PRIME_BITS = 62
+"""Bit size of the random primes used by `CMF._are_conserving_modular`, such that residues fit in a machine word."""
+
+
+def sort_axes_by_name(axes, trajectory, position) -> List[sp.Symbol]:
+    """
+    The default `axes_sorter` of a CMF, which sorts the axes by name.
+    """
+    return sorted(axes, key=str)
 
 
 class CMF:
@@ -24,7 +58,7 @@ class CMF:
         self,
         matrices: Dict[sp.Symbol, Matrix],
         validate: bool = True,
-        axes_sorter=lambda axes, trajectory, position: sorted(axes, key=str),
+        axes_sorter=sort_axes_by_name,
     ):
         """
         Initializes a CMF with `Mx` and `My` matrices.
@@ -32,6 +66,8 @@ class CMF:
         Args:
             matrices: The CMF matrices as a dict,
                 where the keys are the axes of the CMF and their values are the corresponding matrices.
+            validate: if `True`, asserts that the matrices are conserving using `assert_conserving`,
+                which is randomized by default. Use `assert_conserving(exact=True)` for an exact check.
 
         Raises:
             ValueError: if one of the matrices contain the symbol n, which is recserved for PCF conversions.
@@ -52,6 +88,24 @@ class CMF:
     def __eq__(self, other) -> bool:
         return self.matrices == other.matrices
 
+    def digest(self) -> str:
+        """
+        Returns a deterministic digest of the CMF, built from its axes and the digests of their matrices.
+        Memoized on the CMF, whose matrices are not expected to change (as in `__hash__`).
+        """
+        result = getattr(self, "_digest", None)
+        if result is None:
+            result = digest(
+                repr(
+                    sorted(
+                        (sp.srepr(axis), matrix.digest())
+                        for axis, matrix in self.matrices.items()
+                    )
+                )
+            )
+            self._digest = result
+        return result
+
     def __repr__(self) -> str:
         return f"CMF({self.matrices})"
 
@@ -68,25 +122,119 @@ class CMF:
         Myx = simplify(My * Mx({y: y + 1 if y_forward else y - 1}))
         return Mxy == Myx
 
-    def assert_conserving(self, check_negatives: bool = False) -> None:
+    def _are_conserving_modular(
+        self,
+        x: sp.Symbol,
+        y: sp.Symbol,
+        x_forward: bool = True,
+        y_forward: bool = True,
+        error_probability: float = CONSERVING_ERROR_PROBABILITY,
+    ) -> bool:
+        r"""
+        A randomized version of `_are_conserving`, using the Schwartz-Zippel lemma.
+
+        Writing every matrix over a common denominator as $M_x = N_x / d_x$, the matrices are conserving
+        if and only if the polynomial matrix
+        $N_x \cdot N_y(x \pm 1) \cdot d_y \cdot d_x(y \pm 1) - N_y \cdot N_x(y \pm 1) \cdot d_x \cdot d_y(x \pm 1)$
+        is zero. It is evaluated at uniformly random points modulo random primes $p$ of `CONSERVING_PRIME_BITS` bits,
+        where a nonzero polynomial of total degree $D$ vanishes with probability at most $D / p$
+        (random primes make it unlikely for all of its integer coefficients to vanish modulo $p$).
+        Enough points are sampled such that matrices that are not conserving
+        pass with probability at most `error_probability`, while conserving matrices always pass.
+
+        Raises:
+            ValueError: if the matrices are not rational functions with rational coefficients.
+        """
+        ctx = mpoly_ctx(self.free_symbols(), fmpz=True)
+        names = list(ctx.names())
+        Nx, dx = FlintMatrix.from_sympy(self.M(x, x_forward), ctx).fraction()
+        Ny, dy = FlintMatrix.from_sympy(self.M(y, y_forward), ctx).fraction()
+
+        def degree(polys: List) -> int:
+            return max(max(int(sum(poly.degrees())), 0) for poly in polys)
+
+        total_degree = degree(Nx) + degree(Ny) + degree([dx]) + degree([dy])
+        smallest_prime = 2 ** (CONSERVING_PRIME_BITS - 1)
+        trials = (
+            1
+            if total_degree == 0
+            else max(
+                1,
+                math.ceil(
+                    math.log(error_probability)
+                    / math.log(total_degree / smallest_prime)
+                ),
+            )
+        )
+
+        def shift(point: List[int], axis: sp.Symbol, forward: bool) -> List[int]:
+            if str(axis) not in names:
+                return point
+            shifted = list(point)
+            shifted[names.index(str(axis))] += 1 if forward else -1
+            return shifted
+
+        def evaluate(numerators: List, denominator, point: List[int], p: int):
+            values = [int(numerator(*point)) % p for numerator in numerators]
+            return (
+                flint.nmod_mat(self.N(), self.N(), values, p),
+                int(denominator(*point)) % p,
+            )
+
+        for _ in range(trials):
+            p = int(gmpy2.next_prime(smallest_prime + random.randrange(smallest_prime)))
+            point = [random.randrange(p) for _ in names]
+            x_point, y_point = shift(point, x, x_forward), shift(point, y, y_forward)
+            Mx, Mx_scale = evaluate(Nx, dx, point, p)
+            My, My_scale = evaluate(Ny, dy, point, p)
+            Mx_shifted, Mx_shifted_scale = evaluate(Nx, dx, y_point, p)
+            My_shifted, My_shifted_scale = evaluate(Ny, dy, x_point, p)
+            Mxy = Mx * My_shifted * (My_scale * Mx_shifted_scale % p)
+            Myx = My * Mx_shifted * (Mx_scale * My_shifted_scale % p)
+            if Mxy != Myx:
+                return False
+        return True
+
+    def assert_conserving(
+        self,
+        check_negatives: bool = False,
+        exact: bool = False,
+        error_probability: float = CONSERVING_ERROR_PROBABILITY,
+    ) -> None:
         """
         Asserts that all of the matrices of the CMF are conserving.
         Args:
             check_negatives: if `True`, will also check that the negative matrices are conserving.
                              this should mathematically always be the case when the positive matrices are conserving.
+            exact: if `True`, compares the simplified symbolic products of the matrices, which can be slow.
+                   Otherwise, compares them at random points modulo large primes (see `_are_conserving_modular`),
+                   which is exact for rational functions only, so other matrices are always compared symbolically.
+            error_probability: The maximal probability that two matrices that are not conserving pass,
+                               when `exact` is `False`.
         Raises:
             ValueError: if two matrices or more are not conserving.
         """
+
+        def are_conserving(x, y, x_forward, y_forward) -> bool:
+            if not exact:
+                try:
+                    return self._are_conserving_modular(
+                        x, y, x_forward, y_forward, error_probability
+                    )
+                except ValueError:
+                    pass
+            return self._are_conserving(x, y, x_forward, y_forward)
+
         for x, y in itertools.combinations(self.matrices.keys(), 2):
-            if not self._are_conserving(x, y, True, True):
+            if not are_conserving(x, y, True, True):
                 raise ValueError(f"M({x}) and M({y}) matrices are not conserving!")
 
             if check_negatives:
-                if not self._are_conserving(x, y, False, True):
+                if not are_conserving(x, y, False, True):
                     raise ValueError(f"M(-{x}) and M({y}) matrices are not conserving!")
-                if not self._are_conserving(x, y, True, False):
+                if not are_conserving(x, y, True, False):
                     raise ValueError(f"M({x}) and M(-{y}) matrices are not conserving!")
-                if not self._are_conserving(x, y, False, False):
+                if not are_conserving(x, y, False, False):
                     raise ValueError(
                         f"M(-{x}) and M(-{y}) matrices are not conserving!"
                     )
@@ -188,7 +336,7 @@ class CMF:
             }
         )
 
-    @lru_cache
+    @cached("CMF._calculate_diagonal_matrix")
     def _calculate_diagonal_matrix(
         self, trajectory: Position, start: Position, ctx: FlintContext
     ) -> FlintMatrix:
@@ -209,13 +357,13 @@ class CMF:
             )
 
         position = start.copy()
-        result = FlintMatrix.eye(self.N(), ctx)
+        result = FlintFractionMatrix.eye(self.N(), ctx)
         for axis in self.axes_sorter(self.axes(), trajectory, start):
             if trajectory[axis] == 0:
                 continue
             sign = trajectory[axis] >= 0
             current = self.M(axis, sign)
-            result *= FlintMatrix.from_sympy(current, ctx).subs(position)
+            result *= FlintFractionMatrix.from_sympy(current, ctx).subs(position)
             position[axis] += trajectory[axis]
         return result
 
@@ -239,22 +387,38 @@ class CMF:
         if trajectory.longest() <= 1:
             return self._calculate_diagonal_matrix(trajectory, start, ctx)
 
-        result = FlintMatrix.eye(self.N(), ctx)
+        result = FlintFractionMatrix.eye(self.N(), ctx)
         inner_symbol = CMF.inner_symbol(symbol)
-        depth = trajectory.shortest()
         position = start.copy()
+        for diagonal, depth in CMF._segments(trajectory):
+            result *= self._symbolic_walk(diagonal, depth, position, inner_symbol, ctx)
+            position += depth * diagonal
+        return result.reduce()
+
+    @staticmethod
+    def _segments(trajectory: Position) -> List[Tuple[Position, int]]:
+        """
+        Splits a trajectory into diagonal segments, as walked by `trajectory_matrix`.
+        Returns:
+            A list of (diagonal, depth) tuples, where every diagonal is the signs of the remaining trajectory,
+            walked for the shortest nonzero remaining distance.
+        """
+        segments = []
+        trajectory = trajectory.copy()
+        depth = trajectory.shortest()
         while depth > 0:
             diagonal = trajectory.signs()
-            result *= self._symbolic_walk(
-                diagonal, int(depth), position, inner_symbol, ctx
-            )
-            position += depth * diagonal
+            segments.append((diagonal, int(depth)))
             trajectory -= depth * diagonal
             depth = trajectory.shortest()
-        return result
+        return segments
 
     def trajectory_matrix(
-        self, trajectory: Dict, start: Dict = None, symbol=n
+        self,
+        trajectory: Dict,
+        start: Dict = None,
+        symbol=n,
+        store: Optional[TrajectoryMatrixStore] = None,
     ) -> Matrix:
         """
         Returns a corresponding matrix for walking in a trajectory, up to a constant.
@@ -262,6 +426,7 @@ class CMF:
         Args:
             trajectory: a dict containing the amount of steps in each direction.
             start: a dict representing the starting point of the multiplication.
+            store: if given, a `TrajectoryMatrixStore` to load the matrix from, or to store it in once calculated.
         Returns:
             A matrix that represents a single step in the desired trajectory
         Raises:
@@ -278,9 +443,48 @@ class CMF:
                 f"Start axes {start.keys()} do not match CMF axes {self.axes()}"
             )
 
-        return self._trajectory_matrix_inner(
+        if store is not None:
+            key = store.key(self, trajectory, start, symbol)
+            matrix = store.load(key)
+            if matrix is not None:
+                return matrix
+
+        matrix = self._trajectory_matrix_inner(
             Position(trajectory), start, symbol, self.ctx(symbol, start)
         ).factor()
+        if store is not None:
+            store.save(key, matrix)
+        return matrix
+
+    def trajectory_matrices(
+        self, trajectories: List[Dict], start: Dict = None, symbol=n
+    ) -> List[Matrix]:
+        """
+        Returns `trajectory_matrix(trajectory, start, symbol)` for every trajectory in `trajectories`.
+
+        The trajectory matrices are calculated together using a `SegmentPlan`,
+        such that diagonal segments (and prefixes of segments) shared by several trajectories are calculated once.
+        Most segments are shared when `start` is not given, as all trajectories then begin at the same point.
+        """
+        for trajectory in trajectories:
+            if self.axes() != trajectory.keys():
+                raise ValueError(
+                    f"Trajectory axes {trajectory.keys()} do not match CMF axes {self.axes()}"
+                )
+        if start and self.axes() != start.keys():
+            raise ValueError(
+                f"Start axes {start.keys()} do not match CMF axes {self.axes()}"
+            )
+
+        plan = SegmentPlan(
+            self, Position(start) if start else None, symbol, self.ctx(symbol, start)
+        )
+        return [
+            matrix.factor()
+            for matrix in plan.trajectory_matrices(
+                [Position(trajectory) for trajectory in trajectories]
+            )
+        ]
 
     @staticmethod
     def variable_reduction_substitution(
@@ -315,6 +519,8 @@ class CMF:
         start: Position,
         symbol: sp.Symbol,
         ctx: FlintContext,
+        binary_splitting: bool = False,
+        workers: int = 1,
     ) -> List[FlintMatrix]:
         """
         Internal walk logic for symbolic calculations. Do not use directly.
@@ -322,7 +528,13 @@ class CMF:
         trajectory_matrix = self._trajectory_matrix_inner(
             trajectory, start, symbol, ctx
         )
-        return trajectory_matrix.walk({symbol: 1}, iterations, {symbol: 1})
+        return trajectory_matrix.walk(
+            {symbol: 1},
+            iterations,
+            {symbol: 1},
+            binary_splitting=binary_splitting,
+            workers=workers,
+        )
 
     def _numeric_walk(
         self,
@@ -330,34 +542,146 @@ class CMF:
         iterations: List[int],
         start: Position,
         symbol: sp.Symbol,
+        binary_splitting: bool = False,
+        precision: Optional[int] = None,
+        workers: int = 1,
+        store: Optional[CheckpointStore] = None,
+        method: str = "auto",
     ) -> List[Matrix]:
         """
         Internal walk logic for numeric calculations. Do not use directly.
         """
+        if method not in ["auto", "lattice", "trajectory_matrix"]:
+            raise ValueError(
+                f"Unknown walk method {method}, expected auto, lattice or trajectory_matrix"
+            )
+        supports_lattice = (
+            not binary_splitting
+            and precision is None
+            and workers == 1
+            and store is None
+            and not self.parameters()
+        )
+        if method == "lattice":
+            if not supports_lattice:
+                raise ValueError(
+                    "Lattice walks do not support CMF parameters, binary_splitting, precision, workers or store"
+                )
+            return self._lattice_walk(trajectory, tuple(iterations), start)
+        if (
+            method == "auto"
+            and supports_lattice
+            and CMF._prefer_lattice_walk(trajectory, iterations)
+        ):
+            try:
+                return self._lattice_walk(trajectory, tuple(iterations), start)
+            except ZeroDivisionError:
+                pass  # The lattice path hits a pole that cancels out in the trajectory matrix
+
         trajectory_matrix = self.trajectory_matrix(trajectory, start, symbol).factor()
-        return trajectory_matrix.walk({symbol: 1}, iterations, {symbol: 1})
+        return trajectory_matrix.walk(
+            {symbol: 1},
+            iterations,
+            {symbol: 1},
+            binary_splitting=binary_splitting,
+            precision=precision,
+            workers=workers,
+            store=store,
+        )
 
-    @multimethod
-    def walk(  # noqa: F811
-        self,
-        trajectory: Dict,
-        iterations: List[int],
-        start: Dict,
-        symbol=sp.Symbol("walk"),
+    def _lattice_path(
+        self, trajectory: Position, start: Position
+    ) -> List[Tuple[sp.Symbol, bool, Position]]:
+        """
+        Returns the lattice path of a single step in `trajectory` from `start`,
+        as a list of (axis, sign, offset) tuples, where `offset` is the point of `M(axis, sign)` relative to `start`.
+
+        Follows the same path as `trajectory_matrix`, i.e, the trajectory is split to diagonals
+        as in `_trajectory_matrix_inner`, and the axes of every diagonal are ordered by `axes_sorter`.
+        """
+        path = []
+        offset = Position({axis: 0 for axis in self.axes()})
+        for diagonal, depth in CMF._segments(trajectory):
+            axes = [
+                axis
+                for axis in self.axes_sorter(self.axes(), diagonal, start + offset)
+                if diagonal[axis] != 0
+            ]
+            for _ in range(depth):
+                for axis in axes:
+                    path.append((axis, diagonal[axis] > 0, offset.copy()))
+                    offset[axis] += diagonal[axis]
+        return path
+
+    @staticmethod
+    def _prefer_lattice_walk(trajectory: Position, iterations: List[int]) -> bool:
+        """
+        Estimates whether a lattice walk (see `_lattice_walk`) is cheaper than walking the trajectory matrix.
+
+        A lattice walk performs a matrix product for every lattice point, i.e, `length` products per iteration,
+        where `length` is the L1 size of the trajectory, while the trajectory matrix performs one product per iteration,
+        after a symbolic calculation that grows quadratically with `length` (see `LATTICE_WALK_COST_RATIO`).
+        """
+        length = sum(abs(value) for value in trajectory.values())
+        return (
+            iterations[-1] * length
+            < iterations[-1] + LATTICE_WALK_COST_RATIO * length**2
+        )
+
+    @cached("CMF._lattice_walk")
+    def _lattice_walk(
+        self, trajectory: Position, iterations: Tuple[int], start: Position
     ) -> List[Matrix]:
-        r"""
-        Returns a list of trajectorial walk multiplication matrices in the desired depths.
+        """
+        Internal walk logic for numeric calculations, without calculating the trajectory matrix. Do not use directly.
 
-        The walk operation is defined as $\prod_{i=0}^{n-1}M(s_0 + i \cdot t_0, ..., s_k + i \cdot t_k)$,
-        where `M=trajectory_matrix(trajectory, start)`, and `n / size(trajectory)` (L1 size - total amount of steps)
+        Multiplies the axis matrices at every lattice point of the walk (see `_lattice_path`),
+        evaluated natively and multiplied using flint's integer matrices (see `FlintMatrix.walk_numeric`).
+        """
+        if self.parameters():
+            raise ValueError(
+                f"Lattice walks require a CMF without parameters, got {self.parameters()}"
+            )
+        ctx = mpoly_ctx(self.axes(), fmpz=start.is_integer())
+        axes = {str(axis): axis for axis in self.axes()}
+        axes = [axes[name] for name in ctx.names()]
+        path = self._lattice_path(trajectory, start)
+        evaluators = {
+            key: FlintMatrix.from_sympy(self.M(*key), ctx).numeric_evaluator()
+            for key in {(axis, sign) for axis, sign, _ in path}
+        }
+        steps = [
+            (
+                evaluators[(axis, sign)],
+                [number_from_sympy(start[a] + offset[a]) for a in axes],
+            )
+            for axis, sign, offset in path
+        ]
+        direction = [number_from_sympy(trajectory[a]) for a in axes]
 
-        Args:
-            trajectory: A dict containing the amount of steps in each direction.
-            iterations: The amount of trajectory matrix multiplications to perform, either an integer or a list.
-            start: A dict representing the starting point of the multiplication.
-        Returns:
-            The limit of the walk multiplication as defined above.
-            If `iterations` is a list, returns a list of limits.
+        N = self.N()
+        checkpoints = set(iterations)
+        results = []
+        matrix = flint.fmpz_mat(N, N, [int(i % (N + 1) == 0) for i in range(N * N)])
+        scale = flint.fmpz(1)
+        for depth in range(0, iterations[-1] + 1):
+            if depth in checkpoints:
+                results.append(Matrix.from_numeric(matrix, scale))
+            if depth == iterations[-1]:
+                break
+            for evaluate, point in steps:
+                values, denominator = evaluate(
+                    [p + depth * d for p, d in zip(point, direction)]
+                )
+                matrix *= values
+                scale *= denominator
+        return results
+
+    def _validate_walk_arguments(
+        self, trajectory: Dict, iterations: List[int], start: Dict
+    ) -> None:
+        """
+        Raises a ValueError if the arguments of a walk are invalid. See `walk`.
         """
         if self.axes() != trajectory.keys():
             raise ValueError(
@@ -381,16 +705,83 @@ class CMF:
                 f"iterations must contain only non-negative values, got {iterations}"
             )
 
+    @multimethod
+    def walk(  # noqa: F811
+        self,
+        trajectory: Dict,
+        iterations: List[int],
+        start: Dict,
+        symbol=sp.Symbol("walk"),
+        binary_splitting: bool = False,
+        precision: Optional[int] = None,
+        workers: int = 1,
+        store: Optional[CheckpointStore] = None,
+        method: str = "auto",
+    ) -> List[Matrix]:
+        r"""
+        Returns a list of trajectorial walk multiplication matrices in the desired depths.
+
+        The walk operation is defined as $\prod_{i=0}^{n-1}M(s_0 + i \cdot t_0, ..., s_k + i \cdot t_k)$,
+        where `M=trajectory_matrix(trajectory, start)`, and `n / size(trajectory)` (L1 size - total amount of steps)
+
+        Args:
+            trajectory: A dict containing the amount of steps in each direction.
+            iterations: The amount of trajectory matrix multiplications to perform, either an integer or a list.
+            start: A dict representing the starting point of the multiplication.
+            binary_splitting: if True, multiplies the trajectory matrices in a balanced product tree.
+                See `Matrix.walk`. False by default.
+            precision: if not None, calculates the walk using floating point numbers
+                of `precision` decimal digits. See `Matrix.walk`. Only supported for a numeric `start`.
+            workers: if larger than 1, computes segments of the walk in a pool of `workers` processes.
+                See `Matrix.walk`. 1 by default.
+            store: if given, a `CheckpointStore` to resume the walk from and store its result in.
+                See `Matrix.walk`. Only supported for a numeric `start`.
+            method: how to calculate a walk with a numeric `start`.
+                "trajectory_matrix" walks the trajectory matrix (see `trajectory_matrix`),
+                "lattice" multiplies the axis matrices at every lattice point of the walk without it,
+                and "auto" (the default) chooses by a cost estimate.
+                Lattice walks do not support CMF parameters, binary_splitting, precision, workers or store.
+        Returns:
+            The limit of the walk multiplication as defined above.
+            If `iterations` is a list, returns a list of limits.
+        """
+        self._validate_walk_arguments(trajectory, iterations, start)
         trajectory = Position(trajectory)
         start = Position(start)
         if start.free_symbols() != set():
+            if precision is not None:
+                raise ValueError(
+                    f"Fixed precision walks are only supported for a numeric start, got {start}"
+                )
+            if store is not None:
+                raise ValueError(
+                    f"Checkpoint stores are only supported for a numeric start, got {start}"
+                )
             ctx = self.ctx(symbol, start)
             return [
                 m.factor()
-                for m in self._symbolic_walk(trajectory, iterations, start, symbol, ctx)
+                for m in self._symbolic_walk(
+                    trajectory,
+                    iterations,
+                    start,
+                    symbol,
+                    ctx,
+                    binary_splitting,
+                    workers,
+                )
             ]
         else:
-            return self._numeric_walk(trajectory, iterations, start, symbol)
+            return self._numeric_walk(
+                trajectory,
+                iterations,
+                start,
+                symbol,
+                binary_splitting,
+                precision,
+                workers,
+                store,
+                method,
+            )
 
     @multimethod
     def walk(  # noqa: F811
@@ -399,8 +790,140 @@ class CMF:
         iterations: int,
         start: Dict,
         symbol=sp.Symbol("walk"),
+        binary_splitting: bool = False,
+        precision: Optional[int] = None,
+        workers: int = 1,
+        store: Optional[CheckpointStore] = None,
+        method: str = "auto",
     ) -> Matrix:
-        return self.walk(trajectory, [iterations], start, symbol)[0]
+        return self.walk(
+            trajectory,
+            [iterations],
+            start,
+            symbol,
+            binary_splitting=binary_splitting,
+            precision=precision,
+            workers=workers,
+            store=store,
+            method=method,
+        )[0]
+
+    @multimethod
+    def walk_projective(
+        self,
+        trajectory: Dict,
+        iterations: List[int],
+        start: Dict,
+        period: int = 256,
+        symbol=sp.Symbol("walk"),
+        binary_splitting: bool = False,
+    ) -> List[Tuple[Matrix, sp.Expr]]:
+        """
+        Same as `walk`, but periodically divides the content out of the accumulated product.
+        See `Matrix.walk_projective`.
+
+        Returns:
+            A tuple (matrix, factor) such that `factor * matrix` is the walk result.
+            If `iterations` is a list, returns a list of tuples.
+        """
+        self._validate_walk_arguments(trajectory, iterations, start)
+        trajectory_matrix = self.trajectory_matrix(trajectory, start, symbol)
+        return trajectory_matrix.walk_projective(
+            {symbol: 1},
+            iterations,
+            {symbol: 1},
+            period,
+            binary_splitting=binary_splitting,
+        )
+
+    @multimethod
+    def walk_projective(  # noqa: F811
+        self,
+        trajectory: Dict,
+        iterations: int,
+        start: Dict,
+        period: int = 256,
+        symbol=sp.Symbol("walk"),
+        binary_splitting: bool = False,
+    ) -> Tuple[Matrix, sp.Expr]:
+        return self.walk_projective(
+            trajectory,
+            [iterations],
+            start,
+            period,
+            symbol,
+            binary_splitting=binary_splitting,
+        )[0]
+
+    @multimethod
+    def walk_vector(
+        self,
+        trajectory: Dict,
+        iterations: List[int],
+        start: Dict,
+        vectors: Optional[Matrix] = None,
+        symbol=sp.Symbol("walk"),
+        binary_splitting: bool = False,
+    ) -> List[Matrix]:
+        r"""
+        Returns `vectors * self.walk(trajectory, iterations, start)`.
+
+        For a numeric `start`, only the rows of `vectors` are carried through the walk, see `Matrix.walk_vector`.
+
+        Args:
+            trajectory: A dict containing the amount of steps in each direction.
+            iterations: The amount of trajectory matrix multiplications to perform, either an integer or a list.
+            start: A dict representing the starting point of the multiplication.
+            vectors: a kxN matrix whose rows are the vectors to walk with.
+                By default, the first two rows of the identity matrix, which extract $p$ and $q$ (see `Limit`).
+            binary_splitting: see `walk`.
+        Returns:
+            The kxN walk multiplication matrix as defined above.
+            If `iterations` is a list, returns a list of matrices.
+        """
+        self._validate_walk_arguments(trajectory, iterations, start)
+        trajectory = Position(trajectory)
+        start = Position(start)
+        if vectors is None:
+            vectors = Matrix.eye(self.N())[0:2, :]
+        if start.free_symbols() != set():
+            return [
+                vectors * m
+                for m in self.walk(
+                    trajectory,
+                    iterations,
+                    start,
+                    symbol,
+                    binary_splitting=binary_splitting,
+                )
+            ]
+        trajectory_matrix = self.trajectory_matrix(trajectory, start, symbol).factor()
+        return trajectory_matrix.walk_vector(
+            {symbol: 1},
+            iterations,
+            {symbol: 1},
+            vectors,
+            binary_splitting=binary_splitting,
+        )
+
+    @multimethod
+    def walk_vector(  # noqa: F811
+        self,
+        trajectory: Dict,
+        iterations: int,
+        start: Dict,
+        vectors: Optional[Matrix] = None,
+        symbol=sp.Symbol("walk"),
+        binary_splitting: bool = False,
+    ) -> Matrix:
+        return self.walk_vector(
+            trajectory,
+            [iterations],
+            start,
+            vectors,
+            symbol,
+            binary_splitting=binary_splitting,
+        )[0]
 
     @multimethod
     def limit(
@@ -410,6 +933,10 @@ class CMF:
         start: Dict,
         p_vectors: Optional[List[Matrix]] = None,
         q_vectors: Optional[List[Matrix]] = None,
+        binary_splitting: bool = False,
+        reduce_content: bool = False,
+        precision: Optional[int] = None,
+        store: Optional[CheckpointStore] = None,
     ) -> List[Limit]:
         r"""
         Returns a list of limits of trajectorial walk multiplication matrices in the desired depths.
@@ -421,15 +948,49 @@ class CMF:
             trajectory: A dict containing the amount of steps in each direction.
             iterations: The amount of trajectory matrix multiplications to perform, either an integer or a list.
             start: A dict representing the starting point of the multiplication.
+            binary_splitting: if True, multiplies the trajectory matrices in a balanced product tree.
+                See `Matrix.walk`. False by default.
+            reduce_content: if True, walks using `walk_projective`. False by default.
+                Only supported for exact walks, i.e, without `precision` and `store`.
+            precision: if not None, walks using floating point numbers of `precision` decimal digits.
+                See `walk`.
+            store: if given, a `CheckpointStore` to resume the walk from. See `walk`.
         Returns:
             The limit of the walk multiplication as defined above.
             If `iterations` is a list, returns a list of limits.
+        Raises:
+            ValueError: If `reduce_content` is combined with `precision` or `store`.
         """
+        if reduce_content and precision is not None:
+            raise ValueError(
+                "Projective walks (reduce_content) only support exact walks"
+            )
+        if reduce_content and store is not None:
+            raise ValueError(
+                "Checkpoint stores do not support projective walks (reduce_content)"
+            )
 
         def walk_function(iterations):
-            return self.walk(trajectory, iterations, start)
+            if reduce_content:
+                return self.walk_projective(
+                    trajectory, iterations, start, binary_splitting=binary_splitting
+                )
+            return self.walk(
+                trajectory,
+                iterations,
+                start,
+                binary_splitting=binary_splitting,
+                precision=precision,
+                store=store,
+            )
 
-        return Limit.walk_to_limit(iterations, walk_function, p_vectors, q_vectors)
+        return Limit.walk_to_limit(
+            iterations,
+            walk_function,
+            p_vectors,
+            q_vectors,
+            working_precision=precision,
+        )
 
     @multimethod
     def limit(  # noqa: F811
@@ -439,8 +1000,144 @@ class CMF:
         start: Dict,
         p_vectors: Optional[List[Matrix]] = None,
         q_vectors: Optional[List[Matrix]] = None,
+        binary_splitting: bool = False,
+        reduce_content: bool = False,
+        precision: Optional[int] = None,
+        store: Optional[CheckpointStore] = None,
+    ) -> Limit:
+        return self.limit(
+            trajectory,
+            [iterations],
+            start,
+            p_vectors,
+            q_vectors,
+            binary_splitting=binary_splitting,
+            reduce_content=reduce_content,
+            precision=precision,
+            store=store,
+        )[0]
+
+    @multimethod
+    def limit_vector(
+        self,
+        trajectory: Dict,
+        iterations: List[int],
+        start: Dict,
+        p_vectors: Optional[List[Matrix]] = None,
+        q_vectors: Optional[List[Matrix]] = None,
+        binary_splitting: bool = False,
+    ) -> List[Limit]:
+        """
+        Same as `limit`, but only walks with the row vectors of `p_vectors` and `q_vectors` (see `walk_vector`).
+
+        The returned limits hold 2xN matrices rather than the full walk matrices,
+        which are sufficient for `as_rational`, `as_float`, `precision` and `delta`.
+        """
+
+        def walk_function(iterations, vectors):
+            return self.walk_vector(
+                trajectory,
+                iterations,
+                start,
+                vectors,
+                binary_splitting=binary_splitting,
+            )
+
+        return Limit.walk_vector_to_limit(
+            iterations, walk_function, self.N(), p_vectors, q_vectors
+        )
+
+    @multimethod
+    def limit_vector(  # noqa: F811
+        self,
+        trajectory: Dict,
+        iterations: int,
+        start: Dict,
+        p_vectors: Optional[List[Matrix]] = None,
+        q_vectors: Optional[List[Matrix]] = None,
+        binary_splitting: bool = False,
     ) -> Limit:
-        return self.limit(trajectory, [iterations], start, p_vectors, q_vectors)[0]
+        return self.limit_vector(
+            trajectory,
+            [iterations],
+            start,
+            p_vectors,
+            q_vectors,
+            binary_splitting=binary_splitting,
+        )[0]
+
+    def sweep(
+        self,
+        trajectories: List[Dict],
+        starts: List[Dict],
+        depth: int,
+        workers: int = 1,
+    ) -> Iterator[SweepResult]:
+        r"""
+        Calculates the limit and $\delta$ of every trajectory from every start, as in `limit` and `delta`.
+
+        Equivalent trajectories, i.e, integer multiples of the same trajectory from the same start,
+        are calculated together using a single walk, as walking `k * t` for `depth` iterations
+        reaches the same point as walking `t` for `k * depth` iterations.
+
+        Args:
+            trajectories: the trajectories to walk.
+            starts: the starting points to walk every trajectory from.
+            depth: the number of trajectory matrices multiplied.
+                The limit used for $\delta$ is approximated by walking twice as deep.
+            workers: if larger than 1, walks in a pool of `workers` processes.
+                Every worker keeps its own caches between walks.
+        Returns:
+            A generator of `SweepResult`, one for every (trajectory, start) pair,
+            yielded as soon as they are calculated (not necessarily in order).
+        """
+        for position in list(trajectories) + list(starts):
+            if self.axes() != position.keys():
+                raise ValueError(
+                    f"Axes {position.keys()} do not match CMF axes {self.axes()}"
+                )
+        if depth <= 0:
+            raise ValueError(f"depth must be positive, got {depth}")
+        return run_sweep(self, trajectories, starts, depth, workers)
+
+    def screen(
+        self,
+        trajectories: List[Dict],
+        iterations: List[int],
+        start: Dict,
+        p_vectors: Optional[List[Matrix]] = None,
+        q_vectors: Optional[List[Matrix]] = None,
+        symbol=sp.Symbol("walk"),
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximates `limit` in many trajectories at once, using float64 arithmetic.
+
+        The trajectory matrices of all trajectories are walked in lockstep using NumPy
+        (see `numeric_core.BatchMatrix`), in order to prune trajectories before walking them exactly.
+        Args:
+            trajectories: A list of trajectories, each as in `walk`.
+            iterations: The sorted amounts of multiplications to perform. Must be positive.
+            start: The starting point of all walks. Must be numeric.
+            p_vectors: See `Limit`.
+            q_vectors: See `Limit`.
+            symbol: The symbol used for the trajectory matrices. See `walk`.
+        Returns:
+            A tuple (limits, digits) of arrays of shape (len(trajectories), len(iterations)). See `Matrix.screen`.
+        """
+        from ramanujantools.numeric_core import BatchMatrix
+
+        start = Position(start)
+        if start.free_symbols() != set():
+            raise ValueError(f"Screening requires a numeric start, got {start}")
+        matrices = []
+        for trajectory in trajectories:
+            self._validate_walk_arguments(trajectory, iterations, start)
+            matrices.append(self.trajectory_matrix(trajectory, start, symbol).factor())
+        return BatchMatrix.from_sympy(
+            matrices,
+            [{symbol: 1}] * len(matrices),
+            [{symbol: 1}] * len(matrices),
+        ).limit(iterations, p_vectors, q_vectors)
 
     def delta(
         self,
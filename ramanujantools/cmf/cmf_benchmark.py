@@ -82,6 +82,15 @@ def test_trajectory_matrix_4f3_huge(benchmark):
     benchmark(CMF.trajectory_matrix, cmf, trajectory, start)
 
 
+def test_trajectory_matrix_5f4(benchmark):
+    xs = sp.symbols("x:5")
+    ys = sp.symbols("y:4")
+    cmf = pFq(5, 4, 1)
+    trajectory = dict(zip(xs + ys, [1, 1, 1, 2, 2, 3, 3, 3, 4]))
+    start = trajectory
+    benchmark(CMF.trajectory_matrix, cmf, trajectory, start)
+
+
 def test_walk_4f3(benchmark):
     x0, x1, x2, x3 = sp.symbols("x:4")
     y0, y1, y2 = sp.symbols("y:3")
@@ -1,9 +1,9 @@
-from pytest import raises
+from pytest import approx, raises
 
 import sympy as sp
 from sympy.abc import a, b, c, x, y, n
 
-from ramanujantools import Position, Matrix, simplify
+from ramanujantools import Position, Matrix, CheckpointStore, simplify
 from ramanujantools.cmf import CMF, known_cmfs
 
 
@@ -16,6 +16,38 @@ def test_assert_conserving():
         cmf = CMF(matrices={x: m, y: m}, validate=True)
 
 
+def test_assert_conserving_exact():
+    m = Matrix([[x, x + 17], [y * x, y * 3 - x + 5]])
+    cmf = CMF(matrices={x: m, y: m}, validate=False)
+    with raises(ValueError):
+        cmf.assert_conserving(exact=True)
+    known_cmfs.e().assert_conserving(exact=True)
+
+
+def test_assert_conserving_modular():
+    cmf = known_cmfs.hypergeometric_derived_2F1()
+    for first, second in [(a, b), (a, c), (b, c)]:
+        assert cmf._are_conserving_modular(first, second, error_probability=2**-128)
+        assert cmf._are_conserving_modular(first, second, False, True)
+
+    # Differs from a conserving matrix by a multiple of a polynomial that rarely vanishes
+    Mx = cmf.M(a) + Matrix([[0, 0], [0, (a - 3) * (b - 5) / (c + 7)]])
+    broken = CMF(matrices={a: Mx, b: cmf.M(b)}, validate=False)
+    assert not broken._are_conserving_modular(a, b)
+    with raises(ValueError):
+        broken.assert_conserving()
+
+
+def test_assert_conserving_modular_not_rational():
+    cmf = CMF(
+        matrices={x: Matrix([[sp.sqrt(2), 0], [0, x]]), y: Matrix([[1, 0], [0, 1]])},
+        validate=False,
+    )
+    with raises(ValueError):
+        cmf._are_conserving_modular(x, y)
+    cmf.assert_conserving()
+
+
 def test_symbols():
     cmf = known_cmfs.cmf1()
     expected_axes = {x, y}
@@ -152,6 +184,88 @@ def test_walk_list():
     ]
 
 
+def test_walk_binary_splitting():
+    cmf = known_cmfs.e()
+    trajectory = {x: 2, y: 3}
+    start = {x: 5, y: 7}
+    iterations = [1, 2, 3, 17, 29]
+    assert cmf.walk(trajectory, iterations, start) == cmf.walk(
+        trajectory, iterations, start, binary_splitting=True
+    )
+
+
+def test_walk_workers():
+    cmf = known_cmfs.e()
+    trajectory = {x: 2, y: 3}
+    iterations = [1, 2, 3, 17]
+    for start in [{x: 5, y: 7}, {x: c, y: 7}]:
+        assert cmf.walk(trajectory, iterations, start) == cmf.walk(
+            trajectory, iterations, start, workers=2
+        )
+
+
+def test_limit_store(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    cmf = known_cmfs.pi()
+    trajectory = {x: 1, y: 1}
+    start = {x: 1, y: 1}
+    expected = cmf.limit(trajectory, [20, 50], start)
+    assert expected[0] == cmf.limit(trajectory, 20, start, store=store)
+    assert expected == cmf.limit(trajectory, [20, 50], start, store=store)
+    with raises(ValueError):
+        cmf.walk(trajectory, 20, {x: c, y: 1}, store=store)
+    with raises(ValueError):
+        cmf.limit(trajectory, 20, start, reduce_content=True, store=store)
+
+
+def test_limit_reduce_content():
+    cmf = known_cmfs.pi()
+    trajectory = {x: 1, y: 1}
+    start = {x: 1, y: 1}
+    expected = cmf.limit(trajectory, [20, 50], start)
+    actual = cmf.limit(trajectory, [20, 50], start, reduce_content=True)
+    for e, a in zip(expected, actual):
+        assert e.as_rational() == a.as_rational()
+        assert e.as_float() == a.as_float()
+
+
+def test_limit_precision():
+    cmf = known_cmfs.pi()
+    trajectory = {x: 1, y: 1}
+    start = {x: 1, y: 1}
+    expected = cmf.limit(trajectory, 100, start)
+    actual = cmf.limit(trajectory, 100, start, precision=100)
+    expected_p, expected_q = expected.as_rational()
+    actual_p, actual_q = actual.as_rational()
+    assert abs(expected_p / expected_q - actual_p / actual_q) < sp.Rational(1, 10**95)
+    with raises(ValueError):
+        cmf.walk(trajectory, 10, {x: 1, y: c}, precision=100)
+    with raises(ValueError):
+        cmf.limit(trajectory, 100, start, reduce_content=True, precision=100)
+
+
+def test_walk_vector():
+    cmf = known_cmfs.e()
+    trajectory = {x: 2, y: 3}
+    start = {x: 5, y: 7}
+    iterations = [1, 2, 17]
+    vectors = Matrix([[1, 2]])
+    assert [vectors * m for m in cmf.walk(trajectory, iterations, start)] == (
+        cmf.walk_vector(trajectory, iterations, start, vectors)
+    )
+
+
+def test_limit_vector():
+    cmf = known_cmfs.e()
+    trajectory = {x: 1, y: 3}
+    start = {x: 2, y: 1}
+    expected = cmf.limit(trajectory, 17, start)
+    actual = cmf.limit_vector(trajectory, 17, start)
+    assert expected.as_rational() == actual.as_rational()
+    assert expected.precision() == actual.precision()
+    assert expected.delta(2) == actual.delta(2)
+
+
 def test_variable_reduction_substitution_axis():
     x_axis = {x: 1, y: 0}
     y_axis = {x: 0, y: 1}
@@ -213,3 +327,63 @@ def test_blind_delta_sequence_agrees_with_blind_delta():
     ]
     assert delta_sequence == sequence_of_deltas
     assert len(delta_sequence) == depth
+
+
+def test_screen():
+    cmf = known_cmfs.pi()
+    trajectories = [{x: 1, y: 1}, {x: 2, y: 1}, {x: 1, y: 3}]
+    start = {x: 1, y: 1}
+    limits, digits = cmf.screen(trajectories, [5, 10], start)
+    assert (3, 2) == limits.shape == digits.shape
+    for i, trajectory in enumerate(trajectories):
+        for j, limit in enumerate(cmf.limit(trajectory, [5, 10], start)):
+            p, q = limit.as_rational()
+            assert float(p / q) == approx(limits[i][j])
+    with raises(ValueError):
+        cmf.screen(trajectories, [10], {x: 1, y: c})
+
+
+def test_digest():
+    assert known_cmfs.e().digest() == known_cmfs.e().digest()
+    assert known_cmfs.e().digest() != known_cmfs.pi().digest()
+    cmf = known_cmfs.pi()
+    assert cmf.digest() is cmf.digest()
+
+
+def test_walk_lattice():
+    x0, x1 = sp.symbols("x:2")
+    y0, y1 = sp.symbols("y:2")
+    cmf = known_cmfs.pFq(2, 2, -1)
+    trajectory = {x0: 1, x1: 2, y0: 0, y1: -1}
+    start = {x0: 1, x1: 1, y0: -1, y1: -1}
+    iterations = [0, 1, 7, 20]
+    expected = cmf.walk(trajectory, iterations, start, method="trajectory_matrix")
+    assert expected == cmf.walk(trajectory, iterations, start, method="lattice")
+    assert expected == cmf.walk(trajectory, iterations, start)
+
+
+def test_walk_lattice_pole_fallback():
+    x0, x1, x2 = sp.symbols("x:3")
+    y0, y1 = sp.symbols("y:2")
+    cmf = known_cmfs.pFq(3, 2, 1)
+    trajectory = {x0: 1, x1: 1, x2: 1, y0: 2, y1: 2}
+    start = {x0: 2, x1: 2, x2: 2, y0: 4, y1: 4}
+    with raises(ZeroDivisionError):
+        cmf.walk(trajectory, 5, start, method="lattice")
+    assert cmf.walk(trajectory, 5, start, method="trajectory_matrix") == cmf.walk(
+        trajectory, 5, start
+    )
+
+
+def test_walk_pole():
+    cmf = known_cmfs.zeta3()
+    for walk in cmf.walk({x: 2, y: -1}, [3, 6], {x: 3, y: 2}):
+        assert walk.has(sp.nan)
+
+
+def test_walk_lattice_unsupported():
+    cmf = known_cmfs.e()
+    with raises(ValueError):
+        cmf.walk({x: 1, y: 1}, 5, {x: 1, y: 1}, method="lattice", workers=2)
+    with raises(ValueError):
+        cmf.walk({x: 1, y: 1}, 5, {x: 1, y: 1}, method="unknown")
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import sympy as sp
+
+from ramanujantools import Position
+from ramanujantools.flint_core import FlintContext, FlintFractionMatrix
+
+Segment = Tuple[Position, Position, int]
+"""A segment of a trajectory, as a tuple (position, diagonal, depth)."""
+
+
+class SegmentPlan:
+    r"""
+    Calculates the trajectory matrices of a batch of trajectories as a DAG of shared segment products.
+
+    Every trajectory is split to diagonal segments (see `CMF._segments`), where every segment is the product
+    $\prod_{i=0}^{depth-1}D(p + i \cdot d)$ of the diagonal matrix $D$ of a diagonal $d$, from a position $p$.
+    Segments are identified by their position, diagonal and depth, such that:
+    * Every distinct segment is calculated once, and so is every distinct prefix of segments.
+    * A segment that extends a shallower segment on the same diagonal from the same position
+      is calculated as the shallower segment times the remaining segment.
+
+    Positions are calculated after the variable reduction of `trajectory_matrix`,
+    so segments are shared between trajectories when no start is given (all trajectories begin at the axes),
+    or when the same segments are reached from the same start.
+    """
+
+    def __init__(
+        self, cmf, start: Optional[Position], symbol: sp.Symbol, ctx: FlintContext
+    ):
+        self.cmf = cmf
+        self.start = start
+        self.symbol = symbol
+        self.ctx = ctx
+        self.products: Dict[Tuple[str, str, int], FlintFractionMatrix] = {}
+        self.calculated = 0
+        self.reused = 0
+
+    @staticmethod
+    def key(segment: Segment) -> Tuple[str, str, int]:
+        position, diagonal, depth = segment
+        return position.digest(), diagonal.digest(), depth
+
+    def segments(self, trajectory: Position) -> List[Segment]:
+        """
+        Returns the segments of `trajectory`, from the start of this plan.
+        """
+        position = (
+            self.cmf.variable_reduction_substitution(
+                trajectory, self.start, self.symbol
+            )
+            if self.start is not None
+            else Position({axis: axis for axis in self.cmf.axes()})
+        )
+        segments = []
+        for diagonal, depth in self.cmf._segments(trajectory):
+            segments.append((position.copy(), diagonal, depth))
+            position += depth * diagonal
+        return segments
+
+    def segment(self, position: Position, diagonal: Position, depth: int):
+        """
+        Returns the product of a segment, calculating it if needed.
+        """
+        key = SegmentPlan.key((position, diagonal, depth))
+        if key in self.products:
+            self.reused += 1
+            return self.products[key]
+
+        shorter = max(
+            (
+                other_depth
+                for other_position, other_diagonal, other_depth in self.products
+                if (other_position, other_diagonal) == key[:2] and other_depth < depth
+            ),
+            default=0,
+        )
+        if shorter > 0:
+            self.reused += 1
+            result = self.products[key[:2] + (shorter,)] * self.segment(
+                position + shorter * diagonal, diagonal, depth - shorter
+            )
+        else:
+            self.calculated += 1
+            result = self.cmf._symbolic_walk(
+                diagonal,
+                depth,
+                position,
+                self.cmf.inner_symbol(self.symbol),
+                self.ctx,
+            )
+        self.products[key] = result
+        return result
+
+    def trajectory_matrices(
+        self, trajectories: List[Position]
+    ) -> List[FlintFractionMatrix]:
+        """
+        Returns the (reduced) trajectory matrix of every trajectory, see `CMF._trajectory_matrix_inner`.
+        """
+        planned = [self.segments(trajectory) for trajectory in trajectories]
+        distinct = {
+            SegmentPlan.key(segment): segment
+            for segments in planned
+            for segment in segments
+        }
+        # Shallow segments first, such that deeper segments can extend them
+        for segment in sorted(distinct.values(), key=lambda segment: segment[2]):
+            self.segment(*segment)
+
+        prefixes = {}
+        results = []
+        for segments in planned:
+            result = FlintFractionMatrix.eye(self.cmf.N(), self.ctx)
+            prefix = ()
+            for segment in segments:
+                prefix += (SegmentPlan.key(segment),)
+                if prefix not in prefixes:
+                    prefixes[prefix] = result * self.products[prefix[-1]]
+                result = prefixes[prefix]
+            results.append(result.reduce())
+        return results
@@ -0,0 +1,39 @@
+import sympy as sp
+from sympy.abc import n
+
+from ramanujantools import Position
+from ramanujantools.cmf import known_cmfs
+from ramanujantools.cmf.segment_plan import SegmentPlan
+
+x0, x1 = sp.symbols("x:2")
+y0, y1 = sp.symbols("y:2")
+
+
+def test_trajectory_matrices():
+    cmf = known_cmfs.pFq(2, 2, -1)
+    trajectories = [
+        {x0: 1, x1: 2, y0: 1, y1: 2},
+        {x0: 1, x1: 3, y0: 2, y1: 2},
+        {x0: 2, x1: 2, y0: 1, y1: 2},
+    ]
+    for start in [None, {x0: 1, x1: 1, y0: 3, y1: 3}]:
+        assert [
+            cmf.trajectory_matrix(trajectory, start) for trajectory in trajectories
+        ] == cmf.trajectory_matrices(trajectories, start)
+
+
+def test_shared_segments():
+    cmf = known_cmfs.pFq(2, 2, -1)
+    trajectories = [
+        Position({x0: 3, x1: 3, y0: 3, y1: 3}),
+        Position({x0: 1, x1: 1, y0: 1, y1: 1}),
+        Position({x0: 3, x1: 3, y0: 3, y1: 4}),
+    ]
+    plan = SegmentPlan(cmf, None, n, cmf.ctx(n, None))
+    matrices = plan.trajectory_matrices(trajectories)
+    # The diagonal segment of depth 1 is calculated once and extended to depth 3,
+    # which is shared as a prefix by the first and last trajectories.
+    assert 3 == plan.calculated
+    assert plan.reused > 0
+    assert matrices[0].factor() == cmf.trajectory_matrix(trajectories[0])
+    assert matrices[2].factor() == cmf.trajectory_matrix(trajectories[2])
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import mpmath as mp
+import sympy as sp
+
+from ramanujantools import Position, Limit
+
+_worker_cmf = None
+"""The CMF swept by this worker process, see `initialize_worker`."""
+
+
+class SweepResult(NamedTuple):
+    """
+    The result of a single (trajectory, start) pair in `CMF.sweep`.
+    """
+
+    trajectory: Position
+    start: Position
+    limit: mp.mpf
+    digits: int
+    delta: mp.mpf
+    time: float
+    """The time in seconds spent on the walk this result was extracted from (shared by equivalent trajectories)."""
+
+
+def primitive_trajectory(trajectory: Position) -> Tuple[Position, int]:
+    """
+    Returns a tuple (primitive, multiple) such that `trajectory == multiple * primitive`,
+    where the values of `primitive` are coprime.
+    Trajectories that are zero or not integer are returned as is, with multiple 1.
+    """
+    if not trajectory.is_integer():
+        return trajectory, 1
+    multiple = math.gcd(*[int(value) for value in trajectory.values()])
+    if multiple <= 1:
+        return trajectory, 1
+    return (
+        Position(
+            {
+                key: sp.Integer(int(value) // multiple)
+                for key, value in trajectory.items()
+            }
+        ),
+        multiple,
+    )
+
+
+def sweep_groups(
+    trajectories: List[Dict], starts: List[Dict]
+) -> List[Tuple[Position, Position, List[Tuple[Position, int]]]]:
+    """
+    Groups all (trajectory, start) pairs by their primitive trajectory and start.
+
+    Walking `k * t` for `d` iterations reaches the same point as walking `t` for `k * d` iterations,
+    so by the conservative property, both walks have the same result and can be calculated together.
+    Returns:
+        A list of tuples (primitive, start, members), sorted by primitive trajectory,
+        where members is a list of (trajectory, multiple) tuples.
+    """
+    groups = {}
+    for trajectory in trajectories:
+        primitive, multiple = primitive_trajectory(Position(trajectory))
+        for start in starts:
+            start = Position(start)
+            key = (primitive.digest(), start.digest())
+            if key not in groups:
+                groups[key] = (primitive, start, [])
+            groups[key][2].append((Position(trajectory), multiple))
+    return [groups[key] for key in sorted(groups)]
+
+
+def portable(value: mp.mpf) -> mp.mpf:
+    """
+    Returns `value` as an mpf of the global mpmath context, without rounding it,
+    since values of the local contexts of `Limit` can not be pickled.
+    """
+    return mp.mp.make_mpf(value._mpf_)
+
+
+def initialize_worker(cmf) -> None:
+    """
+    Sets the CMF swept by this worker process.
+    Worker processes outlive single tasks, so their caches (e.g, of diagonal matrices) are shared between tasks.
+    """
+    global _worker_cmf
+    _worker_cmf = cmf
+
+
+def sweep_group(
+    primitive: Position,
+    start: Position,
+    members: List[Tuple[Position, int]],
+    depth: int,
+    cmf=None,
+) -> List[SweepResult]:
+    """
+    Calculates the results of all members of a group (see `sweep_groups`) using a single walk,
+    with the same limits as `CMF.limit` of every member, i.e, `k * t` at depth `d` is compared to depth `d - 1`.
+    The limit of every member is approximated by walking it twice as deep, as in `CMF.delta`.
+    Uses the CMF of this worker process (see `initialize_worker`) if `cmf` is None.
+    """
+    cmf = cmf if cmf is not None else _worker_cmf
+    began = time.perf_counter()
+    multiples = set(multiple for _, multiple in members)
+    iterations = sorted(
+        set(
+            multiple * walk_depth
+            for multiple in multiples
+            for walk_depth in [depth - 1, depth, 2 * depth - 1, 2 * depth]
+        )
+    )
+    walks = dict(zip(iterations, cmf.walk(primitive, iterations, start)))
+    elapsed = time.perf_counter() - began
+
+    def limit(multiple: int, walk_depth: int) -> Limit:
+        return Limit(walks[multiple * walk_depth], walks[multiple * (walk_depth - 1)])
+
+    results = []
+    for trajectory, multiple in members:
+        approximant = limit(multiple, depth)
+        reference = limit(multiple, 2 * depth).as_float()
+        results.append(
+            SweepResult(
+                trajectory,
+                start,
+                portable(approximant.as_float()),
+                approximant.precision(),
+                portable(approximant.delta(reference)),
+                elapsed,
+            )
+        )
+    return results
+
+
+def run_sweep(
+    cmf, trajectories: List[Dict], starts: List[Dict], depth: int, workers: int = 1
+) -> Iterator[SweepResult]:
+    """
+    Implementation of `CMF.sweep`.
+    """
+    groups = sweep_groups(trajectories, starts)
+    if workers == 1:
+        for primitive, start, members in groups:
+            yield from sweep_group(primitive, start, members, depth, cmf)
+        return
+
+    executor = ProcessPoolExecutor(
+        workers, initializer=initialize_worker, initargs=(cmf,)
+    )
+    try:
+        futures = [
+            executor.submit(sweep_group, primitive, start, members, depth)
+            for primitive, start, members in groups
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
@@ -0,0 +1,61 @@
+from pytest import approx, raises
+
+from sympy.abc import x, y
+
+from ramanujantools import Position
+from ramanujantools.cmf import known_cmfs
+from ramanujantools.cmf.sweep import primitive_trajectory, sweep_groups
+
+
+def test_primitive_trajectory():
+    assert (Position({x: 2, y: -3}), 4) == primitive_trajectory(
+        Position({x: 8, y: -12})
+    )
+    assert (Position({x: 1, y: 0}), 5) == primitive_trajectory(Position({x: 5, y: 0}))
+    assert (Position({x: 1, y: 2}), 1) == primitive_trajectory(Position({x: 1, y: 2}))
+
+
+def test_sweep_groups():
+    trajectories = [{x: 1, y: 1}, {x: 2, y: 2}, {x: 1, y: 2}, {x: 3, y: 3}]
+    starts = [{x: 1, y: 1}, {x: 2, y: 1}]
+    groups = sweep_groups(trajectories, starts)
+    assert 4 == len(groups)
+    assert 8 == sum(len(members) for _, _, members in groups)
+    for primitive, _, members in groups:
+        for trajectory, multiple in members:
+            assert trajectory == multiple * primitive
+
+
+def test_sweep():
+    cmf = known_cmfs.zeta3()
+    trajectories = [{x: 1, y: 1}, {x: 2, y: 2}, {x: 1, y: 2}]
+    starts = [{x: 1, y: 1}, {x: 2, y: 1}]
+    depth = 10
+    results = list(cmf.sweep(trajectories, starts, depth))
+    assert len(trajectories) * len(starts) == len(results)
+    for result in results:
+        limit = cmf.limit(result.trajectory, depth, result.start)
+        assert limit.as_float() == approx(result.limit)
+        assert limit.precision() == result.digits
+        assert cmf.delta(result.trajectory, depth, result.start) == approx(result.delta)
+
+
+def test_sweep_workers():
+    cmf = known_cmfs.zeta3()
+    trajectories = [{x: 1, y: 1}, {x: 2, y: 2}, {x: 1, y: 2}]
+    starts = [{x: 1, y: 1}, {x: 2, y: 1}]
+
+    def key(result):
+        return (str(result.trajectory), str(result.start))
+
+    expected = sorted(cmf.sweep(trajectories, starts, 10), key=key)
+    actual = sorted(cmf.sweep(trajectories, starts, 10, workers=2), key=key)
+    assert [(key(r), r.limit, r.digits, r.delta) for r in expected] == [
+        (key(r), r.limit, r.digits, r.delta) for r in actual
+    ]
+
+
+def test_sweep_invalid_axes():
+    cmf = known_cmfs.zeta3()
+    with raises(ValueError):
+        cmf.sweep([{x: 1}], [{x: 1, y: 1}], 10)
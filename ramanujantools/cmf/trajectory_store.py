@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import Dict, Iterator, Optional
+
+import time
+import zlib
+import pickle
+import sqlite3
+from contextlib import contextmanager
+
+import sympy as sp
+
+from ramanujantools import Matrix, Position
+from ramanujantools.caching import digest
+
+
+class TrajectoryMatrixStore:
+    r"""
+    Stores trajectory matrices of CMFs in a local SQLite database, such that they persist between processes.
+
+    Every matrix is keyed by the digests of the CMF, trajectory and start (see `CMF.digest`) and the symbol,
+    and stored as a compressed pickle of the factored matrix.
+    Once the stored matrices exceed `max_bytes`, the least recently used ones are evicted.
+
+    Example:
+        >>> store = TrajectoryMatrixStore("trajectories.sqlite")
+        >>> cmf.trajectory_matrix(trajectory, start, store=store)  # calculated and stored
+        >>> cmf.trajectory_matrix(trajectory, start, store=store)  # loaded from the store
+    """
+
+    def __init__(self, path: str, max_bytes: Optional[int] = None):
+        """
+        Args:
+            path: The path of the SQLite database, created if missing.
+            max_bytes: The maximal total size of all stored matrices, or None for no limit.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS matrices ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Yields a connection to the database, which is committed and closed on exit.
+        """
+        connection = sqlite3.connect(self.path, timeout=60)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def key(cmf, trajectory: Dict, start: Optional[Dict], symbol: sp.Symbol) -> str:
+        """
+        Returns the key of a trajectory matrix, which is a digest of the CMF, trajectory, start and symbol.
+        """
+        return digest(
+            repr(
+                (
+                    cmf.digest(),
+                    Position(trajectory).digest(),
+                    Position(start).digest() if start else None,
+                    sp.srepr(symbol),
+                )
+            )
+        )
+
+    def load(self, key: str) -> Optional[Matrix]:
+        """
+        Returns the matrix stored under `key`, or None if there is none.
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM matrices WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE matrices SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        return pickle.loads(zlib.decompress(row[0]))
+
+    def save(self, key: str, matrix: Matrix) -> None:
+        """
+        Stores `matrix` under `key`, and evicts the least recently used matrices if needed.
+        """
+        value = zlib.compress(pickle.dumps(matrix))
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO matrices VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time()),
+            )
+        if self.max_bytes is not None:
+            self.evict(self.max_bytes)
+
+    def evict(self, max_bytes: int) -> None:
+        """
+        Removes the least recently used matrices, until all stored matrices take at most `max_bytes`.
+        """
+        with self._connect() as connection:
+            total = 0
+            for key, size in connection.execute(
+                "SELECT key, size FROM matrices ORDER BY accessed DESC"
+            ).fetchall():
+                total += size
+                if total > max_bytes:
+                    connection.execute("DELETE FROM matrices WHERE key = ?", (key,))
+
+    def size(self) -> int:
+        """
+        Returns the total size of all stored matrices, in bytes.
+        """
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM matrices"
+            ).fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM matrices").fetchone()[0]
+
+    def clear(self) -> None:
+        """
+        Removes all stored matrices.
+        """
+        with self._connect() as connection:
+            connection.execute("DELETE FROM matrices")
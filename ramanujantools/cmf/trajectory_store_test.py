@@ -0,0 +1,56 @@
+import sympy as sp
+from sympy.abc import x, y
+
+from ramanujantools.cmf import TrajectoryMatrixStore, known_cmfs
+
+
+def test_key():
+    cmf = known_cmfs.e()
+    key = TrajectoryMatrixStore.key(cmf, {x: 1, y: 2}, {x: 1, y: 1}, sp.Symbol("n"))
+    assert key == TrajectoryMatrixStore.key(
+        known_cmfs.e(), {y: 2, x: 1}, {x: 1, y: 1}, sp.Symbol("n")
+    )
+    assert key != TrajectoryMatrixStore.key(
+        cmf, {x: 1, y: 2}, {x: 1, y: 2}, sp.Symbol("n")
+    )
+    assert key != TrajectoryMatrixStore.key(
+        cmf, {x: 1, y: 2}, {x: 1, y: 1}, sp.Symbol("k")
+    )
+    assert key != TrajectoryMatrixStore.key(
+        known_cmfs.pi(), {x: 1, y: 2}, {x: 1, y: 1}, sp.Symbol("n")
+    )
+
+
+def test_trajectory_matrix(tmp_path):
+    store = TrajectoryMatrixStore(str(tmp_path / "store.sqlite"))
+    cmf = known_cmfs.e()
+    trajectory, start = {x: 2, y: 3}, {x: 1, y: 1}
+    expected = cmf.trajectory_matrix(trajectory, start)
+    assert expected == cmf.trajectory_matrix(trajectory, start, store=store)
+    assert 1 == len(store)
+
+    key = store.key(cmf, trajectory, start, sp.Symbol("n"))
+    assert expected == store.load(key)
+    reopened = TrajectoryMatrixStore(str(tmp_path / "store.sqlite"))
+    assert expected == cmf.trajectory_matrix(trajectory, start, store=reopened)
+    assert 1 == len(reopened)
+
+
+def test_eviction(tmp_path):
+    store = TrajectoryMatrixStore(str(tmp_path / "store.sqlite"))
+    cmf = known_cmfs.e()
+    for i in range(1, 5):
+        cmf.trajectory_matrix({x: i, y: 1}, {x: 1, y: 1}, store=store)
+    assert 4 == len(store)
+    first = store.key(cmf, {x: 1, y: 1}, {x: 1, y: 1}, sp.Symbol("n"))
+    assert store.load(first) is not None  # most recently used now
+
+    limit = store.size() // 2
+    store.evict(limit)
+    assert 0 < len(store) < 4
+    assert store.size() <= limit
+    assert store.load(first) is not None
+
+    bounded = TrajectoryMatrixStore(str(tmp_path / "bounded.sqlite"), max_bytes=1)
+    cmf.trajectory_matrix({x: 1, y: 1}, {x: 1, y: 1}, store=bounded)
+    assert 0 == len(bounded)
@@ -1,5 +1,24 @@
-from .context import mpoly_ctx, FlintPoly, FlintContext
+from .context import (
+    mpoly_ctx,
+    mpoly_from_sympy,
+    mpoly_to_sympy,
+    FlintPoly,
+    FlintContext,
+)
 from .rational import FlintRational
 from .matrix import FlintMatrix
+from .fraction_matrix import FlintFractionMatrix
+from .serialization import save_matrix, load_matrix
 
-__all__ = ["FlintRational", "FlintMatrix", "mpoly_ctx", "FlintPoly", "FlintContext"]
+__all__ = [
+    "FlintRational",
+    "FlintMatrix",
+    "FlintFractionMatrix",
+    "save_matrix",
+    "load_matrix",
+    "mpoly_ctx",
+    "mpoly_from_sympy",
+    "mpoly_to_sympy",
+    "FlintPoly",
+    "FlintContext",
+]
@@ -1,20 +1,148 @@
-from typing import List, TypeAlias
+from typing import Dict, List, Tuple, TypeAlias
+
+from functools import lru_cache
 
 import flint
 import sympy as sp
 
-FlintContext: TypeAlias = flint.fmpz_mpoly_ctx | flint.fmpq_mpoly_ctx
-FlintPoly: TypeAlias = flint.fmpz_mpoly | flint.fmpq_mpoly_ctx
+from ramanujantools.flint_core.univariate import UnivariateContext, UnivariatePoly
+
+FlintContext: TypeAlias = (
+    flint.fmpz_mpoly_ctx | flint.fmpq_mpoly_ctx | UnivariateContext
+)
+FlintPoly: TypeAlias = flint.fmpz_mpoly | flint.fmpq_mpoly | UnivariatePoly
 
 
 def mpoly_ctx(symbols: List[sp.Symbol], fmpz: bool) -> FlintContext:
     """
-    Creates a FlintContext
+    Creates a FlintContext.
+    If there is a single symbol, returns a UnivariateContext, whose fmpz_poly/fmpq_poly arithmetic is faster.
     Args:
         symbols: The symbols to be supported by the FlintContext
         fmpz: if True, returns fmpz_mpoly_ctx. Otherwise returns fmpq_mpoly_ctx.
     """
+    if len(symbols) == 1:
+        return UnivariateContext.get(str(list(symbols)[0]), fmpz)
     ctx_type = flint.fmpz_mpoly_ctx if fmpz else flint.fmpq_mpoly_ctx
     return ctx_type.get(
         [str(symbol) for symbol in list(sorted(symbols, key=str))], "lex"
     )
+
+
+def is_fmpz(ctx: FlintContext) -> bool:
+    """
+    Returns True if `ctx` is a context of polynomials with integer coefficients.
+    """
+    if isinstance(ctx, UnivariateContext):
+        return ctx.fmpz
+    return isinstance(ctx, flint.fmpz_mpoly_ctx)
+
+
+@lru_cache
+def generators(ctx: FlintContext) -> Dict[str, FlintPoly]:
+    """
+    Returns the generators of `ctx` by their names.
+    """
+    return dict(zip(ctx.names(), ctx.gens()))
+
+
+def _mpoly_from_sympy(expr: sp.Expr, ctx: FlintContext) -> FlintPoly:
+    if expr.is_Symbol:
+        gens = generators(ctx)
+        if expr.name not in gens:
+            raise ValueError(f"Symbol {expr} is not supported by context {ctx}")
+        return gens[expr.name]
+    if expr.is_Integer:
+        return ctx.constant(int(expr))
+    if expr.is_Rational:
+        return ctx.constant(flint.fmpq(int(expr.p), int(expr.q)))
+    if expr.is_Add:
+        result = ctx.constant(0)
+        for arg in expr.args:
+            result += _mpoly_from_sympy(arg, ctx)
+        return result
+    if expr.is_Mul:
+        result = ctx.constant(1)
+        for arg in expr.args:
+            result *= _mpoly_from_sympy(arg, ctx)
+        return result
+    if expr.is_Pow and expr.exp.is_Integer and expr.exp >= 0:
+        return _mpoly_from_sympy(expr.base, ctx) ** int(expr.exp)
+    raise ValueError(f"Cannot convert {expr} to a polynomial over {ctx}")
+
+
+@lru_cache(maxsize=4096)
+def mpoly_from_sympy(expr: sp.Expr, ctx: FlintContext) -> FlintPoly:
+    """
+    Converts a polynomial sympy expression to a flint mpoly,
+    by walking its expression tree and applying the same operations in `ctx`.
+    Results are cached per expression and context.
+    Raises:
+        ValueError: If `expr` is not a polynomial in the generators of `ctx`.
+    """
+    return _mpoly_from_sympy(sp.sympify(expr), ctx)
+
+
+def composition(substitutions: Dict, ctx: FlintContext) -> List[FlintPoly]:
+    """
+    Returns the values of all generators of `ctx` under `substitutions`, in context order,
+    as expected by `compose`. Generators that are not substituted are kept as they are.
+    """
+    substitutions = {str(key): value for key, value in substitutions.items()}
+    return [
+        mpoly_from_sympy(substitutions[name], ctx) if name in substitutions else gen
+        for name, gen in generators(ctx).items()
+    ]
+
+
+def number_from_sympy(number: sp.Rational) -> flint.fmpz | flint.fmpq:
+    """
+    Converts a sympy rational number to a flint fmpz (if it is an integer) or fmpq.
+    """
+    number = sp.Rational(number)
+    if number.q == 1:
+        return flint.fmpz(int(number.p))
+    return flint.fmpq(int(number.p), int(number.q))
+
+
+def number_to_sympy(number: flint.fmpz | flint.fmpq) -> sp.Rational:
+    """
+    Converts a flint fmpz or fmpq to a sympy number.
+    """
+    return sp.Rational(int(number.numerator), int(number.denominator))
+
+
+def mpoly_to_sympy(poly: FlintPoly) -> sp.Expr:
+    """
+    Converts a flint mpoly to a sympy expression, term by term.
+    """
+    symbols = [sp.Symbol(name) for name in poly.context().names()]
+    return sp.Add(
+        *[
+            number_to_sympy(coefficient)
+            * sp.Mul(*[symbol**power for symbol, power in zip(symbols, monomial)])
+            for monomial, coefficient in poly.to_dict().items()
+        ]
+    )
+
+
+def context_state(ctx: FlintContext) -> Tuple:
+    """
+    Returns a picklable representation of `ctx`, which can be restored using `context_from_state`.
+    The state keeps the type, generator order and ordering of the context,
+    such that polynomials in their exponent vector representation (see `to_dict`) are restored as is.
+    """
+    if isinstance(ctx, UnivariateContext):
+        return ctx.names(), ctx.fmpz, None
+    return ctx.names(), is_fmpz(ctx), ctx.ordering().name
+
+
+def context_from_state(state: Tuple) -> FlintContext:
+    """
+    Restores a context from its `state`, see `context_state`.
+    """
+    names, fmpz, ordering = state
+    if ordering is None:
+        return UnivariateContext.get(names[0], fmpz)
+    ctx_type = flint.fmpz_mpoly_ctx if fmpz else flint.fmpq_mpoly_ctx
+    return ctx_type.get(list(names), ordering)
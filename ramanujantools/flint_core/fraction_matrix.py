@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import flint
+
+import ramanujantools as rt
+from ramanujantools.flint_core import (
+    FlintRational,
+    FlintMatrix,
+    FlintPoly,
+    FlintContext,
+)
+from ramanujantools.flint_core import kernels
+from ramanujantools.flint_core.rational import LAZY_DEGREE_THRESHOLD
+from ramanujantools.flint_core.context import (
+    composition,
+    context_from_state,
+    context_state,
+    is_fmpz,
+)
+
+
+class FlintFractionMatrix(FlintMatrix):
+    r"""
+    Represents a Matrix of rational functions as a matrix of mpoly numerators over a single shared denominator.
+
+    Unlike FlintMatrix, which reduces every cell by gcd after every operation,
+    multiplication here is a plain polynomial matrix product followed by a single denominator product,
+    so no gcds are calculated in most products.
+    The common factors are removed when calling `reduce`, which is done before factoring the result,
+    and occasionally during products, once the denominator grows (see `_lazy_reduce`).
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        numerators: List[FlintPoly],
+        denominator: FlintPoly,
+        ctx: FlintContext,
+    ) -> FlintFractionMatrix:
+        self._rows = rows
+        self._cols = cols
+        self.numerators = numerators
+        self.denominator = denominator
+        self.ctx = ctx
+        # The degree of the denominator after the last reduction, see `_lazy_reduce`
+        self.reduced_degree = 0
+        # Whether the matrix is known to be reduced, such that `factor` does not reduce it again
+        self.reduced = False
+
+    @property
+    def values(self) -> List[FlintRational]:
+        """
+        The cells of the matrix as (reduced) FlintRationals.
+        """
+        return [
+            FlintRational(numerator, self.denominator, self.ctx)
+            for numerator in self.numerators
+        ]
+
+    @staticmethod
+    def from_flint(matrix: FlintMatrix) -> FlintFractionMatrix:
+        """
+        Converts a FlintMatrix to FlintFractionMatrix, using the lcm of all denominators as the shared denominator.
+        """
+        if isinstance(matrix, FlintFractionMatrix):
+            return matrix
+        numerators, denominator = matrix.fraction()
+        return FlintFractionMatrix(
+            matrix.rows(), matrix.cols(), numerators, denominator, matrix.ctx
+        )
+
+    @staticmethod
+    def from_sympy(matrix: rt.Matrix, ctx: FlintContext) -> FlintFractionMatrix:
+        """
+        Converts a Matrix to FlintFractionMatrix.
+        Args:
+            matrix: The matrix as ramanujantools.Matrix
+            ctx: The desired mpoly context (which also defines the supported variables)
+        """
+        return FlintFractionMatrix.from_flint(FlintMatrix.from_sympy(matrix, ctx))
+
+    @staticmethod
+    def from_numeric(
+        values: flint.fmpz_mat, denominator: flint.fmpz, ctx: FlintContext
+    ) -> FlintFractionMatrix:
+        """
+        Converts a numeric matrix, given as an integer matrix and a denominator (see `walk_numeric`),
+        to FlintFractionMatrix.
+        """
+        return FlintFractionMatrix(
+            values.nrows(),
+            values.ncols(),
+            [ctx.constant(value) for value in values.entries()],
+            ctx.constant(denominator),
+            ctx,
+        )
+
+    def fraction(self) -> Tuple[List[FlintPoly], FlintPoly]:
+        """
+        Returns the matrix as a tuple (numerators, denominator). See `FlintMatrix.fraction`.
+        """
+        return self.numerators, self.denominator
+
+    def state(self) -> Tuple:
+        """
+        Returns a picklable representation of the matrix, which can be restored using `from_state`.
+        """
+        numerators = [numerator.to_dict() for numerator in self.numerators]
+        return (
+            self.rows(),
+            self.cols(),
+            numerators,
+            self.denominator.to_dict(),
+            context_state(self.ctx),
+        )
+
+    @staticmethod
+    def from_state(state: Tuple) -> FlintFractionMatrix:
+        """
+        Restores a matrix from its `state`.
+        """
+        rows, cols, numerators, denominator, ctx_state = state
+        ctx = context_from_state(ctx_state)
+        return FlintFractionMatrix(
+            rows,
+            cols,
+            [ctx.from_dict(numerator) for numerator in numerators],
+            ctx.from_dict(denominator),
+            ctx,
+        )
+
+    @staticmethod
+    def eye(N: int, ctx: FlintContext) -> FlintFractionMatrix:
+        """
+        Creates an identity matrix of size N.
+
+        Args:
+            N: The squared matrix dimension
+            ctx: The desired mpoly context (which also defines the supported variables)
+        """
+        numerators = [
+            ctx.constant(1 if row == col else 0) for row in range(N) for col in range(N)
+        ]
+        return FlintFractionMatrix(N, N, numerators, ctx.constant(1), ctx)
+
+    def __getitem__(self, key):
+        """
+        Returns an element of the matrix as a FlintRational.
+        Supports both matrix[row, col] and matrix[index] syntax
+        """
+        if isinstance(key, tuple):
+            key = key[0] * self.cols() + key[1]
+        return FlintRational(self.numerators[key], self.denominator, self.ctx)
+
+    def __setitem__(self, key, value: FlintRational):
+        """
+        Sets an element of the matrix, bringing the matrix to a common denominator with `value`.
+        Supports both matrix[row, col] and matrix[index] syntax
+        """
+        if isinstance(key, tuple):
+            key = key[0] * self.cols() + key[1]
+        gcd = self.denominator.gcd(value.denominator)
+        multiplier = value.denominator / gcd
+        self.numerators = [numerator * multiplier for numerator in self.numerators]
+        self.numerators[key] = value.numerator * (self.denominator / gcd)
+        self.denominator *= multiplier
+        self.reduced = False
+
+    def __eq__(self, other: FlintMatrix) -> bool:
+        other = FlintFractionMatrix.from_flint(other)
+        return self.shape() == other.shape() and all(
+            a * other.denominator == b * self.denominator
+            for a, b in zip(self.numerators, other.numerators)
+        )
+
+    def __repr__(self) -> str:
+        return f"FlintFractionMatrix({self.data()})"
+
+    def __str__(self) -> str:
+        return f"FlintFractionMatrix({self.data()})"
+
+    def __mul__(self, other: FlintMatrix | FlintRational | int) -> FlintFractionMatrix:
+        """
+        Multiplies self by another matrix or a scalar, without reducing the result.
+        """
+        if isinstance(other, FlintMatrix):
+            other = FlintFractionMatrix.from_flint(other)
+            if self.cols() != other.rows():
+                raise ValueError("Attempting to multiply")
+            numerators = kernels.multiply(
+                self.numerators,
+                other.numerators,
+                self.rows(),
+                self.cols(),
+                other.cols(),
+                winograd=True,
+            )
+            return FlintFractionMatrix(
+                self.rows(),
+                other.cols(),
+                numerators,
+                self.denominator * other.denominator,
+                self.ctx,
+            )._lazy_reduce(max(self.reduced_degree, other.reduced_degree))
+        if isinstance(other, FlintRational):
+            return FlintFractionMatrix(
+                self.rows(),
+                self.cols(),
+                [numerator * other.numerator for numerator in self.numerators],
+                self.denominator * other.denominator,
+                self.ctx,
+            )
+        return FlintFractionMatrix(
+            self.rows(),
+            self.cols(),
+            [numerator * other for numerator in self.numerators],
+            self.denominator,
+            self.ctx,
+        )
+
+    def __truediv__(self, other: FlintRational | int) -> FlintFractionMatrix:
+        """
+        Divides self by a scalar
+        """
+        if isinstance(other, FlintMatrix):
+            raise ValueError("Attempted to divide by matrix!")
+        if isinstance(other, FlintRational):
+            return FlintFractionMatrix(
+                self.rows(),
+                self.cols(),
+                [numerator * other.denominator for numerator in self.numerators],
+                self.denominator * other.numerator,
+                self.ctx,
+            )
+        return FlintFractionMatrix(
+            self.rows(),
+            self.cols(),
+            self.numerators,
+            self.denominator * other,
+            self.ctx,
+        )
+
+    def content(self) -> FlintRational:
+        """
+        Returns the content of the matrix, i.e, the gcd of all numerators divided by the shared denominator.
+        Dividing the matrix by its content leaves a polynomial matrix without a common factor.
+        """
+        numerator = self.ctx.constant(0)
+        for value in self.numerators:
+            numerator = numerator.gcd(value)
+        return FlintRational(numerator, self.denominator, self.ctx)
+
+    def _lazy_reduce(self, reduced_degree: int) -> FlintFractionMatrix:
+        """
+        Reduces the matrix (see `reduce`) once the degree of its denominator passes `LAZY_DEGREE_THRESHOLD`
+        and twice the degree it had after the last reduction, `reduced_degree`.
+        This keeps long products bounded when their factors cancel,
+        while denominators that keep growing without cancelling are only reduced a logarithmic amount of times.
+        """
+        if max(self.denominator.degrees(), default=0) <= max(
+            LAZY_DEGREE_THRESHOLD, 2 * reduced_degree
+        ):
+            self.reduced_degree = reduced_degree
+            return self
+        return self.reduce()
+
+    def reduce(self) -> FlintFractionMatrix:
+        """
+        Returns the same matrix, with the common factors of the shared denominator and all numerators removed.
+        """
+        if self.reduced:
+            return self
+        gcd = self.denominator
+        for numerator in self.numerators:
+            if gcd.is_one():
+                break
+            gcd = gcd.gcd(numerator)
+        if not is_fmpz(self.ctx):
+            gcd *= FlintRational.fmpq_gcd(
+                [
+                    c
+                    for poly in self.numerators + [self.denominator]
+                    for c in poly.coeffs()
+                ]
+            )
+        result = FlintFractionMatrix(
+            self.rows(),
+            self.cols(),
+            [numerator / gcd for numerator in self.numerators],
+            self.denominator / gcd,
+            self.ctx,
+        )
+        result.reduced_degree = int(max(result.denominator.degrees(), default=0))
+        result.reduced = True
+        return result
+
+    def subs(self, substitutions: Dict) -> FlintFractionMatrix:
+        """
+        Substitutes symbols in the matrix.
+        """
+        return self.compose(composition(substitutions, self.ctx))
+
+    def compose(self, values: List[FlintPoly]) -> FlintFractionMatrix:
+        """
+        Substitutes all generators of the context with `values`, given in context order (see `context.composition`).
+        """
+        return FlintFractionMatrix(
+            self.rows(),
+            self.cols(),
+            [numerator.compose(*values) for numerator in self.numerators],
+            self.denominator.compose(*values),
+            self.ctx,
+        )
+
+    def evaluate(self, point: List) -> FlintFractionMatrix:
+        """
+        Evaluates the matrix at a numeric `point`, given as fmpz/fmpq values for all generators in context order.
+        """
+        denominator = self.denominator(*point)
+        if denominator == 0:
+            raise ZeroDivisionError(f"Matrix has a pole at {point}")
+        return FlintFractionMatrix(
+            self.rows(),
+            self.cols(),
+            [self.ctx.constant(numerator(*point)) for numerator in self.numerators],
+            self.ctx.constant(denominator),
+            self.ctx,
+        )
+
+    def factor(self) -> rt.Matrix:
+        """
+        Factors all elements in the matrix.
+        """
+        return FlintMatrix.factor(self.reduce())
@@ -0,0 +1,97 @@
+import sympy as sp
+from sympy.abc import n
+
+from ramanujantools import Matrix
+from ramanujantools.flint_core import mpoly_ctx, FlintMatrix, FlintFractionMatrix
+from ramanujantools.flint_core.rational import LAZY_DEGREE_THRESHOLD
+
+
+def fractionify(matrix: Matrix, fmpz=True) -> FlintFractionMatrix:
+    ctx = mpoly_ctx(matrix.free_symbols, fmpz)
+    return FlintFractionMatrix.from_sympy(matrix, ctx)
+
+
+def test_factor():
+    matrix = Matrix(
+        [
+            [1, n**2 + n, n**2 - n + 5],
+            [3 * n + 9, n**2 - 1, 1 / (n + 1)],
+            [n**2 + 7, n - 2, (n + 1) * (n - 3)],
+        ],
+    )
+
+    assert matrix.applyfunc(sp.factor) == fractionify(matrix).factor()
+
+
+def test_mul():
+    m1 = Matrix([[0, n**2], [1, 1 / n]])
+    m2 = Matrix([[3, n - 2], [n, 5 / (n + 1)]])
+
+    assert fractionify(m1 * m2) == fractionify(m1) * fractionify(m2)
+    assert fractionify(m2 * m1) == fractionify(m2) * fractionify(m1)
+    assert (m1 * 17).applyfunc(sp.factor) == (fractionify(m1) * 17).factor()
+
+
+def test_reduce():
+    m = Matrix([[n, 1 / (n + 1)], [n / (n + 1), 1 / n]])
+    product = fractionify(m) * fractionify(m.inv())
+    assert product.denominator.degrees() != (0,)
+    reduced = product.reduce()
+    assert reduced == product
+    assert reduced.denominator.degrees() == (0,)
+    assert Matrix.eye(2) == reduced.factor()
+    assert reduced is reduced.reduce()
+    reduced[0, 1] = FlintFractionMatrix.from_sympy(
+        Matrix([[n / (n + 1)]]), product.ctx
+    )[0, 0]
+    assert not reduced.reduced
+
+
+def test_walk():
+    matrix = Matrix(
+        [
+            [1, n**2 + n, n**2 - n + 5],
+            [3 * n + 9, n**2 - 1, 1 / (n + 1)],
+            [n**2 + 7, n - 2, (n + 1) * (n - 3)],
+        ],
+    )
+    ctx = mpoly_ctx([n], False)
+    expected = FlintMatrix.from_sympy(matrix, ctx).walk({n: 1}, 4, {n: n / 2})
+    assert (
+        expected.factor()
+        == fractionify(matrix, False).walk({n: 1}, 4, {n: n / 2}).factor()
+    )
+
+
+def test_walk_degrees_bounded():
+    # The product telescopes to [[(n + k) / n, ...], [0, 1]], whose denominator is n
+    matrix = Matrix([[(n + 1) / n, 1], [0, 1]])
+    depth = 200
+    walked = fractionify(matrix).walk({n: 1}, depth, {n: n})
+    assert max(walked.denominator.degrees()) <= 2 * LAZY_DEGREE_THRESHOLD
+    assert all(
+        max(numerator.degrees()) <= 2 * LAZY_DEGREE_THRESHOLD + 1
+        for numerator in walked.numerators
+    )
+    assert (
+        Matrix([[(n + depth) / n, depth * (depth - 1) / (2 * n) + depth], [0, 1]])
+        == walked.factor()
+    )
+
+
+def test_walk_workers():
+    matrix = Matrix([[0, n**2], [1, 1 / (n + 1)]])
+    iterations = [0, 1, 4, 9]
+    fraction_matrix = fractionify(matrix)
+    expected = fraction_matrix.walk({n: 1}, iterations, {n: n})
+    assert expected == fraction_matrix.walk({n: 1}, iterations, {n: n}, workers=2)
+
+
+def test_state():
+    x, y = sp.symbols("x y")
+    matrix = Matrix([[x / 3, y**2 - 1], [1 / (x + y), 7]])
+    for fmpz in [True, False]:
+        fraction_matrix = fractionify(matrix, fmpz)
+        assert fraction_matrix == FlintFractionMatrix.from_state(
+            fraction_matrix.state()
+        )
@@ -0,0 +1,142 @@
+from typing import List
+
+
+def multiply_2x2(a: List, b: List) -> List:
+    """
+    Multiplies two 2x2 matrices given as flat lists in row-major order.
+    """
+    a0, a1, a2, a3 = a
+    b0, b1, b2, b3 = b
+    return [
+        a0 * b0 + a1 * b2,
+        a0 * b1 + a1 * b3,
+        a2 * b0 + a3 * b2,
+        a2 * b1 + a3 * b3,
+    ]
+
+
+def multiply_3x3(a: List, b: List) -> List:
+    """
+    Multiplies two 3x3 matrices given as flat lists in row-major order.
+    """
+    a0, a1, a2, a3, a4, a5, a6, a7, a8 = a
+    b0, b1, b2, b3, b4, b5, b6, b7, b8 = b
+    return [
+        a0 * b0 + a1 * b3 + a2 * b6,
+        a0 * b1 + a1 * b4 + a2 * b7,
+        a0 * b2 + a1 * b5 + a2 * b8,
+        a3 * b0 + a4 * b3 + a5 * b6,
+        a3 * b1 + a4 * b4 + a5 * b7,
+        a3 * b2 + a4 * b5 + a5 * b8,
+        a6 * b0 + a7 * b3 + a8 * b6,
+        a6 * b1 + a7 * b4 + a8 * b7,
+        a6 * b2 + a7 * b5 + a8 * b8,
+    ]
+
+
+def multiply_4x4(a: List, b: List) -> List:
+    """
+    Multiplies two 4x4 matrices given as flat lists in row-major order.
+    """
+    a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14, a15 = a
+    b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12, b13, b14, b15 = b
+    return [
+        a0 * b0 + a1 * b4 + a2 * b8 + a3 * b12,
+        a0 * b1 + a1 * b5 + a2 * b9 + a3 * b13,
+        a0 * b2 + a1 * b6 + a2 * b10 + a3 * b14,
+        a0 * b3 + a1 * b7 + a2 * b11 + a3 * b15,
+        a4 * b0 + a5 * b4 + a6 * b8 + a7 * b12,
+        a4 * b1 + a5 * b5 + a6 * b9 + a7 * b13,
+        a4 * b2 + a5 * b6 + a6 * b10 + a7 * b14,
+        a4 * b3 + a5 * b7 + a6 * b11 + a7 * b15,
+        a8 * b0 + a9 * b4 + a10 * b8 + a11 * b12,
+        a8 * b1 + a9 * b5 + a10 * b9 + a11 * b13,
+        a8 * b2 + a9 * b6 + a10 * b10 + a11 * b14,
+        a8 * b3 + a9 * b7 + a10 * b11 + a11 * b15,
+        a12 * b0 + a13 * b4 + a14 * b8 + a15 * b12,
+        a12 * b1 + a13 * b5 + a14 * b9 + a15 * b13,
+        a12 * b2 + a13 * b6 + a14 * b10 + a15 * b14,
+        a12 * b3 + a13 * b7 + a14 * b11 + a15 * b15,
+    ]
+
+
+def multiply_generic(a: List, b: List, rows: int, inner: int, cols: int) -> List:
+    """
+    Multiplies a `rows x inner` matrix by an `inner x cols` matrix, both given as flat lists in row-major order.
+    """
+    result = []
+    for row in range(rows):
+        left = a[row * inner : (row + 1) * inner]
+        for col in range(cols):
+            current = left[0] * b[col]
+            for k in range(1, inner):
+                current += left[k] * b[k * cols + col]
+            result.append(current)
+    return result
+
+
+def multiply_winograd(a: List, b: List, rows: int, inner: int, cols: int) -> List:
+    r"""
+    Multiplies matrices as in `multiply_generic`, using Winograd's inner product algorithm.
+
+    Every inner product is calculated in pairs, as
+    $\sum_k (a_{i,2k} + b_{2k+1,j})(a_{i,2k+1} + b_{2k,j}) - \xi_i - \eta_j$,
+    where $\xi_i = \sum_k a_{i,2k}a_{i,2k+1}$ and $\eta_j = \sum_k b_{2k,j}b_{2k+1,j}$ are calculated once,
+    which takes about half of the multiplications of the naive algorithm for large matrices.
+    Only valid for commuting elements, and only worthwhile when additions are much cheaper than multiplications.
+    """
+    pairs = inner // 2
+    if pairs == 0:
+        return multiply_generic(a, b, rows, inner, cols)
+    rows_a = [a[row * inner : (row + 1) * inner] for row in range(rows)]
+    cols_b = [[b[k * cols + col] for k in range(inner)] for col in range(cols)]
+    xi = []
+    for left in rows_a:
+        current = left[0] * left[1]
+        for k in range(1, pairs):
+            current += left[2 * k] * left[2 * k + 1]
+        xi.append(current)
+    eta = []
+    for right in cols_b:
+        current = right[0] * right[1]
+        for k in range(1, pairs):
+            current += right[2 * k] * right[2 * k + 1]
+        eta.append(current)
+
+    result = []
+    for i, left in enumerate(rows_a):
+        for j, right in enumerate(cols_b):
+            current = -xi[i] - eta[j]
+            for k in range(pairs):
+                current += (left[2 * k] + right[2 * k + 1]) * (
+                    left[2 * k + 1] + right[2 * k]
+                )
+            if inner % 2 == 1:
+                current += left[-1] * right[-1]
+            result.append(current)
+    return result
+
+
+WINOGRAD_THRESHOLD = 5
+"""The smallest inner dimension for which `multiply` uses `multiply_winograd` when allowed."""
+
+
+def multiply(
+    a: List, b: List, rows: int, inner: int, cols: int, winograd: bool = False
+) -> List:
+    """
+    Multiplies a `rows x inner` matrix by an `inner x cols` matrix, both given as flat lists in row-major order.
+
+    Uses unrolled kernels for square matrices of sizes 2, 3 and 4,
+    and if `winograd` is True, uses `multiply_winograd` when `inner` is at least `WINOGRAD_THRESHOLD`.
+    """
+    if rows == inner == cols:
+        if inner == 2:
+            return multiply_2x2(a, b)
+        if inner == 3:
+            return multiply_3x3(a, b)
+        if inner == 4:
+            return multiply_4x4(a, b)
+    if winograd and inner >= WINOGRAD_THRESHOLD:
+        return multiply_winograd(a, b, rows, inner, cols)
+    return multiply_generic(a, b, rows, inner, cols)
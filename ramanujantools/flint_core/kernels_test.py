@@ -0,0 +1,60 @@
+import random
+
+import sympy as sp
+from sympy.abc import n, x
+
+from ramanujantools import Matrix
+from ramanujantools.flint_core import mpoly_ctx, FlintMatrix, FlintFractionMatrix
+from ramanujantools.flint_core.kernels import (
+    multiply,
+    multiply_generic,
+    multiply_winograd,
+)
+
+
+def random_list(size: int) -> list:
+    random.seed(size)
+    return [random.randint(-50, 50) for _ in range(size)]
+
+
+def test_multiply_unrolled():
+    for size in [2, 3, 4]:
+        a = random_list(size * size)
+        b = random_list(size * size + 1)[1:]
+        expected = multiply_generic(a, b, size, size, size)
+        assert expected == multiply(a, b, size, size, size)
+        assert (Matrix(size, size, a) * Matrix(size, size, b)).reshape(
+            1, size * size
+        ).tolist()[0] == expected
+
+
+def test_multiply_winograd():
+    for rows, inner, cols in [(5, 5, 5), (6, 6, 6), (2, 7, 3), (4, 1, 2)]:
+        a = random_list(rows * inner)
+        b = random_list(inner * cols + 1)[1:]
+        expected = multiply_generic(a, b, rows, inner, cols)
+        assert expected == multiply_winograd(a, b, rows, inner, cols)
+        assert expected == multiply(a, b, rows, inner, cols, winograd=True)
+
+
+def test_flint_mul():
+    for size in [2, 3, 4, 5]:
+        m1 = Matrix(size, size, lambda i, j: (n + i) / (x - j + 1) + i * j)
+        m2 = Matrix(size, size, lambda i, j: n**i - x * j)
+        ctx = mpoly_ctx([n, x], False)
+        expected = (m1 * m2).applyfunc(sp.factor)
+        for cls in [FlintMatrix, FlintFractionMatrix]:
+            assert (
+                expected == (cls.from_sympy(m1, ctx) * cls.from_sympy(m2, ctx)).factor()
+            )
+
+
+def test_flint_mul_non_square():
+    m1 = Matrix([[n, 1, 2], [3, n**2, 1 / n]])
+    m2 = Matrix([[1, n], [n + 1, 0], [2, 1 / (n + 1)]])
+    ctx = mpoly_ctx([n], True)
+    expected = (m1 * m2).applyfunc(sp.factor)
+    for cls in [FlintMatrix, FlintFractionMatrix]:
+        product = cls.from_sympy(m1, ctx) * cls.from_sympy(m2, ctx)
+        assert (2, 2) == (product.rows(), product.cols())
+        assert expected == product.factor()
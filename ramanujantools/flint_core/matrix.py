@@ -1,14 +1,30 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
 
+import math
+import functools
 from multimethod import multimethod
 
+import flint
 import sympy as sp
 
 import ramanujantools as rt
 from ramanujantools import Position
-from ramanujantools.flint_core import FlintRational, FlintContext
+from ramanujantools.flint_core import (
+    FlintRational,
+    FlintContext,
+    FlintPoly,
+)
+from ramanujantools.flint_core import kernels
+from ramanujantools.flint_core.context import (
+    composition,
+    context_from_state,
+    context_state,
+    is_fmpz,
+    number_from_sympy,
+)
+from ramanujantools.parallel import segments, segment_products
 
 
 class FlintMatrix:
@@ -37,6 +53,37 @@ class FlintMatrix:
         values = [FlintRational.from_sympy(cell, ctx) for cell in matrix]
         return FlintMatrix(matrix.rows, matrix.cols, values, ctx)
 
+    def state(self) -> Tuple:
+        """
+        Returns a picklable representation of the matrix, which can be restored using `from_state`.
+        """
+        values = [
+            (value.numerator.to_dict(), value.denominator.to_dict())
+            for value in self.values
+        ]
+        return (self.rows(), self.cols(), values, context_state(self.ctx))
+
+    @staticmethod
+    def from_state(state: Tuple) -> FlintMatrix:
+        """
+        Restores a matrix from its `state`.
+        """
+        rows, cols, values, ctx_state = state
+        ctx = context_from_state(ctx_state)
+        values = [
+            FlintRational(
+                ctx.from_dict(numerator),
+                ctx.from_dict(denominator),
+                ctx,
+                normalized=True,
+            )
+            for numerator, denominator in values
+        ]
+        return FlintMatrix(rows, cols, values, ctx)
+
+    def __reduce__(self) -> Tuple:
+        return type(self).from_state, (self.state(),)
+
     @staticmethod
     def eye(N: int, ctx: FlintContext) -> FlintMatrix:
         """
@@ -120,14 +167,12 @@ class FlintMatrix:
         if isinstance(other, FlintMatrix):
             if self.cols() != other.rows():
                 raise ValueError("Attempting to multiply")
-            elements = []
-            for row in range(self.rows()):
-                for col in range(other.cols()):
-                    current = 0
-                    for k in range(self.cols()):
-                        current += self[row, k] * other[k, col]
-                    elements.append(current)
-            return FlintMatrix(self.rows(), self.cols(), elements, self.ctx)
+            elements = kernels.multiply(
+                self.values, other.values, self.rows(), self.cols(), other.cols()
+            )
+            for element in elements:
+                element.normalize()
+            return FlintMatrix(self.rows(), other.cols(), elements, self.ctx)
 
         else:
             return FlintMatrix(
@@ -158,17 +203,197 @@ class FlintMatrix:
             self.ctx,
         )
 
+    def content(self) -> FlintRational:
+        """
+        Returns the content of the matrix, i.e, the gcd of all numerators divided by the lcm of all denominators.
+        Dividing the matrix by its content leaves a polynomial matrix without a common factor.
+        """
+        numerator = self.ctx.constant(0)
+        denominator = self.ctx.constant(1)
+        for value in self.values:
+            numerator = numerator.gcd(value.numerator)
+            denominator = (
+                denominator * value.denominator / denominator.gcd(value.denominator)
+            )
+        return FlintRational(numerator, denominator, self.ctx)
+
     def subs(self, substitutions: Dict) -> FlintMatrix:
         """
         Substitutes symbols in the matrix.
         """
+        return self.compose(composition(substitutions, self.ctx))
+
+    def compose(self, values: List[FlintPoly]) -> FlintMatrix:
+        """
+        Substitutes all generators of the context with `values`, given in context order (see `context.composition`).
+        """
         return FlintMatrix(
             self.rows(),
             self.cols(),
-            [value.subs(substitutions) for value in self.values],
+            [value.compose(values) for value in self.values],
             self.ctx,
         )
 
+    def evaluate(self, point: List) -> FlintMatrix:
+        """
+        Evaluates the matrix at a numeric `point`, given as fmpz/fmpq values for all generators in context order.
+        """
+        return FlintMatrix(
+            self.rows(),
+            self.cols(),
+            [value.evaluate(point) for value in self.values],
+            self.ctx,
+        )
+
+    def numeric_point(
+        self, trajectory: Dict, start: Dict
+    ) -> Optional[Tuple[List, List]]:
+        """
+        Returns the walk `start` and `trajectory` as flint numbers for all generators in context order,
+        or None if any of them is not a rational number.
+        """
+        start = {str(key): value for key, value in start.items()}
+        trajectory = {str(key): value for key, value in trajectory.items()}
+        names = self.ctx.names()
+        if not all(name in start or name in trajectory for name in names) or not all(
+            sp.sympify(value).is_Rational
+            for value in list(start.values()) + list(trajectory.values())
+        ):
+            return None
+        point = [number_from_sympy(start.get(name, 0)) for name in names]
+        direction = [number_from_sympy(trajectory.get(name, 0)) for name in names]
+        return point, direction
+
+    def steps(
+        self, trajectory: Position, start: Position
+    ) -> Callable[[int], FlintMatrix]:
+        r"""
+        Returns a function that calculates $M(s + i \cdot t)$ for a step $i$,
+        where `M=self`, `t=trajectory` and `s=start`.
+
+        `start` and `trajectory` are converted to the context once,
+        such that every step only adds a multiple of the trajectory to the start before composing.
+        If all generators have numeric values, every step is calculated using native point evaluation instead.
+        """
+        numeric = self.numeric_point(trajectory, start)
+        if numeric is not None:
+            point, direction = numeric
+            return lambda i: self.evaluate(
+                [p + i * d for p, d in zip(point, direction)]
+            )
+
+        start = {str(key): value for key, value in start.items()}
+        trajectory = {str(key): value for key, value in trajectory.items()}
+        names = [
+            name for name in self.ctx.names() if name in start or name in trajectory
+        ]
+        zero = sp.Integer(0)
+        base = composition({name: start.get(name, zero) for name in names}, self.ctx)
+        direction = composition(
+            {name: trajectory.get(name, zero) for name in names}, self.ctx
+        )
+        direction = [
+            d if name in names else self.ctx.constant(0)
+            for name, d in zip(self.ctx.names(), direction)
+        ]
+        return lambda i: self.compose([b + i * d for b, d in zip(base, direction)])
+
+    def fraction(self) -> Tuple[List[FlintPoly], FlintPoly]:
+        """
+        Returns the matrix as a tuple (numerators, denominator),
+        where numerators is a flat list in row-major order, over a single shared denominator.
+        """
+        denominator = self.ctx.constant(1)
+        for value in self.values:
+            denominator = (
+                denominator * value.denominator / denominator.gcd(value.denominator)
+            )
+        numerators = [
+            value.numerator * (denominator / value.denominator) for value in self.values
+        ]
+        return numerators, denominator
+
+    @staticmethod
+    def from_numeric(
+        values: flint.fmpz_mat, denominator: flint.fmpz, ctx: FlintContext
+    ) -> FlintMatrix:
+        """
+        Converts a numeric matrix, given as an integer matrix and a denominator (see `walk_numeric`), to FlintMatrix.
+        """
+        return FlintMatrix(
+            values.nrows(),
+            values.ncols(),
+            [
+                FlintRational(ctx.constant(value), ctx.constant(denominator), ctx)
+                for value in values.entries()
+            ],
+            ctx,
+        )
+
+    def walk_numeric(
+        self, trajectory: Dict, iterations: List[int], start: Dict
+    ) -> List[Tuple[flint.fmpz_mat, flint.fmpz]]:
+        """
+        Same as `walk`, where all generators are given rational values by `start` and `trajectory`.
+
+        Every step is evaluated natively at its point (see `evaluate`) and brought to an integer matrix
+        and a denominator, so the whole walk is multiplied in C using flint's `fmpz_mat`.
+        Returns:
+            A list of tuples (values, denominator), one for each value in `iterations`,
+            such that `values / denominator` is the walk result.
+        Raises:
+            ValueError: If `start` or `trajectory` are not numeric for all generators.
+        """
+        numeric = self.numeric_point(trajectory, start)
+        if numeric is None:
+            raise ValueError(
+                f"walk_numeric requires rational values for all of {self.ctx.names()}, "
+                f"got trajectory={trajectory}, start={start}"
+            )
+        point, direction = numeric
+        evaluate = self.numeric_evaluator()
+        N = self.rows()
+        checkpoints = set(iterations)
+        results = []
+        matrix = flint.fmpz_mat(N, N, [int(i % (N + 1) == 0) for i in range(N * N)])
+        scale = flint.fmpz(1)
+        for depth in range(0, iterations[-1] + 1):
+            if depth in checkpoints:
+                results.append((matrix, scale))
+            if depth == iterations[-1]:
+                break
+            values, denominator = evaluate(
+                [p + depth * d for p, d in zip(point, direction)]
+            )
+            matrix *= values
+            scale *= denominator
+        return results
+
+    def numeric_evaluator(
+        self,
+    ) -> Callable[[List], Tuple[flint.fmpz_mat, flint.fmpz]]:
+        """
+        Returns a function that evaluates the matrix at a rational point (flint numbers in context order),
+        as a tuple (values, denominator) of an integer matrix and a denominator, as in `walk_numeric`.
+        The shared denominator of the matrix (see `fraction`) is calculated once.
+        """
+        numerators, denominator = self.fraction()
+        rows, cols = self.rows(), self.cols()
+        fmpz = is_fmpz(self.ctx)
+
+        def evaluate(point: List) -> Tuple[flint.fmpz_mat, flint.fmpz]:
+            values = [numerator(*point) for numerator in numerators]
+            scale = denominator(*point)
+            if scale == 0:
+                raise ZeroDivisionError(f"Matrix has a pole at {point}")
+            if not fmpz:
+                common = math.lcm(*[int(value.q) for value in values + [scale]])
+                values = [(value * common).p for value in values]
+                scale = (scale * common).p
+            return flint.fmpz_mat(rows, cols, values), flint.fmpz(scale)
+
+        return evaluate
+
     def factor(self) -> rt.Matrix:
         """
         Factors all elements in the matrix.
@@ -176,8 +401,36 @@ class FlintMatrix:
         values = [value.factor() for value in self.values]
         return rt.Matrix(self.rows(), self.cols(), values)
 
+    def product(
+        self, trajectory: Position, start: Position, begin: int, end: int
+    ) -> FlintMatrix:
+        r"""
+        Returns $\prod_{i=begin}^{end-1}M(s + i \cdot t)$, where `M=self`, `t=trajectory` and `s=start`.
+
+        Calculated using binary splitting, i.e, by multiplying the two halves of the range recursively,
+        such that operands of similar sizes are multiplied together.
+        """
+        return self._product(self.steps(trajectory, start), begin, end)
+
+    def _product(
+        self, step: Callable[[int], FlintMatrix], begin: int, end: int
+    ) -> FlintMatrix:
+        if end - begin <= 0:
+            return type(self).eye(self.rows(), self.ctx)
+        if end - begin == 1:
+            return step(begin)
+        middle = (begin + end) // 2
+        return self._product(step, begin, middle) * self._product(step, middle, end)
+
     @multimethod
-    def walk(self, trajectory: Dict, iterations: List[int], start: Dict) -> FlintMatrix:
+    def walk(
+        self,
+        trajectory: Dict,
+        iterations: List[int],
+        start: Dict,
+        binary_splitting: bool = False,
+        workers: int = 1,
+    ) -> FlintMatrix:
         r"""
         Returns the multiplication result of walking in a certain trajectory.
 
@@ -191,6 +444,10 @@ class FlintMatrix:
             trajectory: the trajectory of a single step in the walk, as defined above.
             iterations: The amount of multiplications to perform. Can be an integer value or a list of values.
             start: the starting point of the matrix multiplication
+            binary_splitting: if True, the product between every two consecutive depths
+                is calculated using binary splitting (see `product`). False by default.
+            workers: if larger than 1, the walk is cut into contiguous segments (see `parallel.segments`),
+                whose products are calculated using binary splitting in a pool of `workers` processes.
         Returns:
             The walk multiplication matrix as defined above.
             If iterations is list, returns a list of matrices.
@@ -202,12 +459,38 @@ class FlintMatrix:
         position = Position(start)
         trajectory = Position(trajectory)
         results = []
-        matrix = FlintMatrix.eye(self.rows(), self.ctx)
+        matrix = type(self).eye(self.rows(), self.ctx)
+        if binary_splitting or workers > 1:
+            if workers == 1:
+                product = functools.partial(
+                    self._product, self.steps(trajectory, position)
+                )
+            else:
+                product = functools.partial(self.product, trajectory, position)
+            checkpoints = set(iterations)
+            if 0 in checkpoints:
+                results.append(matrix)
+            walk_segments = segments(iterations, workers)
+            products = segment_products(product, walk_segments, workers)
+            for (_, depth), segment in zip(walk_segments, products):
+                matrix *= segment
+                if depth in checkpoints:
+                    results.append(matrix)
+            return results
+
+        if self.numeric_point(trajectory, position) is not None:
+            return [
+                type(self).from_numeric(values, denominator, self.ctx)
+                for values, denominator in self.walk_numeric(
+                    trajectory, iterations, position
+                )
+            ]
+
+        step = self.steps(trajectory, position)
         for depth in range(0, iterations[-1]):
             if depth in iterations:
                 results.append(matrix)
-            matrix *= self.subs(position)
-            position += trajectory
+            matrix *= step(depth)
         results.append(matrix)  # Last matrix, for iterations[-1]
         return results
 
@@ -217,5 +500,45 @@ class FlintMatrix:
         trajectory: Dict,
         iterations: int,
         start: Dict,
+        binary_splitting: bool = False,
+        workers: int = 1,
     ) -> rt.Matrix:
-        return self.walk(trajectory, [iterations], start)[0]
+        return self.walk(
+            trajectory,
+            [iterations],
+            start,
+            binary_splitting=binary_splitting,
+            workers=workers,
+        )[0]
+
+    def walk_projective(
+        self,
+        trajectory: Dict,
+        iterations: List[int],
+        start: Dict,
+        period: int = 256,
+    ) -> List[Tuple[FlintMatrix, FlintRational]]:
+        """
+        Same as `walk`, but divides the content (see `content`) out of the accumulated product
+        every `period` steps and at every requested depth.
+
+        Returns:
+            A list of tuples (matrix, factor), one for each value in `iterations`,
+            such that `factor * matrix` is the walk result.
+        """
+        step = self.steps(Position(trajectory), Position(start))
+        results = []
+        matrix = type(self).eye(self.rows(), self.ctx)
+        factor = FlintRational.from_sympy(sp.Integer(1), self.ctx)
+        for depth in range(0, iterations[-1] + 1):
+            if depth in iterations or depth % period == 0:
+                content = matrix.content()
+                if not content.numerator.is_zero():
+                    matrix /= content
+                    factor *= content
+            if depth in iterations:
+                results.append((matrix, factor))
+            if depth == iterations[-1]:
+                break
+            matrix *= step(depth)
+        return results
@@ -1,4 +1,5 @@
 import sympy as sp
+from pytest import raises
 from sympy.abc import n
 
 from ramanujantools import Matrix
@@ -66,3 +67,83 @@ def test_walk_rational():
     ).factor()
 
     assert expected == flintify(matrix, fmpz=False).walk({n: 1}, 3, {n: n / 2}).factor()
+
+
+def test_walk_binary_splitting():
+    matrix = Matrix([[0, n**2], [1, 1 / (n + 1)]])
+    iterations = [0, 1, 4, 9]
+    flint_matrix = flintify(matrix)
+    expected = flint_matrix.walk({n: 1}, iterations, {n: n})
+    assert expected == flint_matrix.walk(
+        {n: 1}, iterations, {n: n}, binary_splitting=True
+    )
+
+
+def test_walk_workers():
+    matrix = Matrix([[0, n**2], [1, 1 / (n + 1)]])
+    iterations = [0, 1, 4, 9]
+    for fmpz in [True, False]:
+        flint_matrix = flintify(matrix, fmpz)
+        expected = flint_matrix.walk({n: 1}, iterations, {n: n})
+        assert expected == flint_matrix.walk({n: 1}, iterations, {n: n}, workers=2)
+
+
+def test_state():
+    x, y = sp.symbols("x y")
+    matrix = Matrix([[x / 3, y**2 - 1], [1 / (x + y), 7]])
+    for fmpz in [True, False]:
+        flint_matrix = flintify(matrix, fmpz)
+        assert flint_matrix == FlintMatrix.from_state(flint_matrix.state())
+
+
+def test_content():
+    matrix = Matrix([[2 * n**2, 4 * n / (n + 1)], [6 * n, 0]])
+    assert (2 * n / (n + 1)) == flintify(matrix).content().factor()
+
+
+def test_walk_projective():
+    matrix = Matrix([[2 * n**2, 4 * n / (n + 1)], [6 * n, n - 3]])
+    iterations = [0, 1, 4, 7]
+    flint_matrix = flintify(matrix)
+    expected = flint_matrix.walk({n: 1}, iterations, {n: n})
+    actual = flint_matrix.walk_projective({n: 1}, iterations, {n: n}, period=2)
+    for e, (m, factor) in zip(expected, actual):
+        assert e.factor() == (m * factor).factor()
+
+
+def test_walk_numeric_start():
+    matrix = Matrix([[0, n**2], [1, (2 * n + 1) / (n + 3)]])
+    for fmpz in [True, False]:
+        expected = matrix.walk({n: 1}, [1, 5, 8], {n: 2})
+        actual = flintify(matrix, fmpz).walk({n: 1}, [1, 5, 8], {n: 2})
+        assert expected == [value.factor() for value in actual]
+
+
+def test_steps():
+    x, y = sp.symbols("x y")
+    matrix = Matrix([[x, y**2 - 1], [1 / (x + y), 7]])
+    flint_matrix = flintify(matrix, fmpz=False)
+    trajectory = {x: 1, y: 2}
+    for start in [{x: x, y: y / 2}, {x: 3, y: sp.Rational(1, 2)}]:
+        step = flint_matrix.steps(trajectory, start)
+        for i in range(3):
+            substitutions = {x: start[x] + i, y: start[y] + 2 * i}
+            assert matrix.subs(substitutions).applyfunc(sp.factor) == (step(i).factor())
+
+
+def test_walk_numeric():
+    matrix = Matrix([[1, n**2 + n, 5], [3 * n + 9, n**2 - 1, 1 / (n + 1)], [7, n, 2]])
+    iterations = [0, 1, 6, 10]
+    for fmpz, start in [(True, {n: 1}), (False, {n: sp.Rational(1, 3)})]:
+        actual = flintify(matrix, fmpz).walk_numeric({n: 1}, iterations, start)
+        for depth, (values, denominator) in zip(iterations, actual):
+            expected = Matrix.eye(3)
+            for i in range(depth):
+                expected *= matrix.subs({n: start[n] + i})
+            assert expected == Matrix(3, 3, values.entries()) / int(denominator)
+
+
+def test_walk_numeric_symbolic_start():
+    matrix = Matrix([[0, n**2], [1, n]])
+    with raises(ValueError):
+        flintify(matrix).walk_numeric({n: 1}, [1, 2], {n: n})
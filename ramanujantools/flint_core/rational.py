@@ -1,39 +1,112 @@
 from __future__ import annotations
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 import math
 import flint
 import sympy as sp
 
-from ramanujantools import Position
 from ramanujantools.flint_core import FlintPoly, FlintContext
+from ramanujantools.flint_core.context import (
+    composition,
+    context_from_state,
+    context_state,
+    is_fmpz,
+    mpoly_from_sympy,
+    mpoly_to_sympy,
+    number_to_sympy,
+)
+
+LAZY_DEGREE_THRESHOLD = 16
+"""Unnormalized FlintRationals are normalized once the degree of their denominator passes this threshold."""
 
 
 class FlintRational:
     """
     Represents a rational function.
-    Implemented as a numerator and denominator, reduces by gcd every step
+    Implemented as a numerator and denominator.
+
+    Values created directly are reduced by gcd, but the results of arithmetic operations are normalized lazily,
+    i.e, only when their `numerator` or `denominator` are accessed (which includes `factor`, `__eq__` and `subs`),
+    or once the degree of their denominator passes `LAZY_DEGREE_THRESHOLD`.
     """
 
     def __init__(
-        self, numerator: FlintPoly, denominator: FlintPoly, ctx: FlintContext
+        self,
+        numerator: FlintPoly,
+        denominator: FlintPoly,
+        ctx: FlintContext,
+        normalize: bool = True,
+        normalized: bool = False,
     ) -> FlintRational:
-        self.is_integer = isinstance(numerator, flint.fmpz_mpoly)
-        gcd = numerator.gcd(denominator)
+        """
+        Args:
+            normalize: if False, the value is normalized lazily (see class docs).
+            normalized: if True, the numerator and denominator are known to be normalized already,
+                so they are used as they are.
+        """
+        self.is_integer = is_fmpz(ctx)
+        self._numerator = numerator
+        self._denominator = denominator
+        self._normalized = normalized
+        self.ctx = ctx
+        if normalize or max(denominator.degrees(), default=0) > LAZY_DEGREE_THRESHOLD:
+            self.normalize()
+
+    def state(self) -> Tuple:
+        """
+        Returns a picklable representation of self, which can be restored using `from_state`.
+        """
+        return (
+            self.numerator.to_dict(),
+            self.denominator.to_dict(),
+            context_state(self.ctx),
+        )
+
+    @staticmethod
+    def from_state(state: Tuple) -> FlintRational:
+        """
+        Restores a FlintRational from its `state`.
+        """
+        numerator, denominator, ctx_state = state
+        ctx = context_from_state(ctx_state)
+        return FlintRational(
+            ctx.from_dict(numerator), ctx.from_dict(denominator), ctx, normalized=True
+        )
+
+    def __reduce__(self) -> Tuple:
+        return FlintRational.from_state, (self.state(),)
+
+    def normalize(self) -> FlintRational:
+        """
+        Reduces the numerator and denominator by their gcd (and content for fmpq) in place, and returns self.
+        """
+        if self._normalized:
+            return self
+        gcd = self._numerator.gcd(self._denominator)
         if not self.is_integer:
-            content = FlintRational.fmpq_gcd(numerator.coeffs() + denominator.coeffs())
+            content = FlintRational.fmpq_gcd(
+                self._numerator.coeffs() + self._denominator.coeffs()
+            )
             gcd *= content
-        self.numerator = numerator / gcd
-        self.denominator = denominator / gcd
-        self.ctx = ctx
+        self._numerator = self._numerator / gcd
+        self._denominator = self._denominator / gcd
+        self._normalized = True
+        return self
+
+    @property
+    def numerator(self) -> FlintPoly:
+        return self.normalize()._numerator
+
+    @property
+    def denominator(self) -> FlintPoly:
+        return self.normalize()._denominator
 
     @staticmethod
     def mpoly_from_sympy(poly: sp.Expr, ctx: FlintContext) -> FlintPoly:
         r"""
-        Converts a sympy expression to a flint mpoly.
+        Converts a sympy expression to a flint mpoly. See `context.mpoly_from_sympy`.
         """
-        mpoly_type = type(ctx.constant(0))
-        return mpoly_type(str(poly).replace("**", "^"), ctx)
+        return mpoly_from_sympy(poly, ctx)
 
     @staticmethod
     def from_sympy(rational: sp.Expr, ctx: FlintContext) -> FlintRational:
@@ -65,16 +138,43 @@ class FlintRational:
         """
         Returns 1 / self.
         """
-        return FlintRational(self.denominator, self.numerator, self.ctx)
+        return FlintRational(
+            self._denominator,
+            self._numerator,
+            self.ctx,
+            normalize=False,
+            normalized=self._normalized,
+        )
 
     def __neg__(self):
-        return FlintRational(-self.numerator, self.denominator, self.ctx)
+        return FlintRational(
+            -self._numerator,
+            self._denominator,
+            self.ctx,
+            normalize=False,
+            normalized=self._normalized,
+        )
 
     def __add__(self, other: FlintRational) -> FlintRational:
+        if not isinstance(other, FlintRational):
+            return FlintRational(
+                self._numerator + self._denominator * other,
+                self._denominator,
+                self.ctx,
+                normalize=False,
+            )
+        if self._denominator == other._denominator:
+            return FlintRational(
+                self._numerator + other._numerator,
+                self._denominator,
+                self.ctx,
+                normalize=False,
+            )
         return FlintRational(
-            self.numerator * other.denominator + self.denominator * other.numerator,
-            self.denominator * other.denominator,
+            self._numerator * other._denominator + self._denominator * other._numerator,
+            self._denominator * other._denominator,
             self.ctx,
+            normalize=False,
         )
 
     def __radd__(self, other: FlintRational) -> FlintRational:
@@ -88,11 +188,13 @@ class FlintRational:
 
     def __mul__(self, other) -> FlintRational:
         if isinstance(other, FlintRational):
-            numerator = self.numerator * other.numerator
-            denominator = self.denominator * other.denominator
-            return FlintRational(numerator, denominator, self.ctx)
+            numerator = self._numerator * other._numerator
+            denominator = self._denominator * other._denominator
+            return FlintRational(numerator, denominator, self.ctx, normalize=False)
         else:
-            return FlintRational(self.numerator * other, self.denominator, self.ctx)
+            return FlintRational(
+                self._numerator * other, self._denominator, self.ctx, normalize=False
+            )
 
     def __rmul__(self, other) -> FlintRational:
         return self * other
@@ -100,7 +202,9 @@ class FlintRational:
     def __truediv__(self, other) -> FlintRational:
         if isinstance(other, FlintRational):
             return self * other.inv()
-        return FlintRational(self.numerator, self.denominator * other, self.ctx)
+        return FlintRational(
+            self._numerator, self._denominator * other, self.ctx, normalize=False
+        )
 
     def __rtruediv__(self, other) -> FlintRational:
         return other * self.inv()
@@ -120,26 +224,27 @@ class FlintRational:
         """
         Substitutes symbols in self.
         """
-        substitutions = Position(
-            {str(key): value for key, value in substitutions.items()}
-        )
-        composition = []
-        for gen in self.ctx.gens():
-            if str(gen) in substitutions:
-                value = FlintRational.mpoly_from_sympy(
-                    substitutions[str(gen)], self.ctx
-                )
-            else:
-                value = gen
-            composition.append(value)
-        content = (
-            1
-            if self.is_integer
-            else substitutions.denominator_lcm() ** max(self.degrees())
+        return self.compose(composition(substitutions, self.ctx))
+
+    def compose(self, values: List[FlintPoly]) -> FlintRational:
+        """
+        Substitutes all generators of the context with `values`, given in context order (see `context.composition`).
+        """
+        return FlintRational(
+            self.numerator.compose(*values), self.denominator.compose(*values), self.ctx
         )
+
+    def evaluate(self, point: List) -> FlintRational:
+        """
+        Evaluates self at a numeric `point`, given as fmpz/fmpq values for all generators in context order,
+        using flint's native evaluation. Returns a constant FlintRational.
+        """
+        denominator = self.denominator(*point)
+        if denominator == 0:
+            raise ZeroDivisionError(f"{self} has a pole at {point}")
         return FlintRational(
-            (content * self.numerator).compose(*composition),
-            (content * self.denominator).compose(*composition),
+            self.ctx.constant(self.numerator(*point)),
+            self.ctx.constant(denominator),
             self.ctx,
         )
 
@@ -148,14 +253,10 @@ class FlintRational:
         """
         Factors an mpoly polynomial and returns it as a sp.Expr
         """
-        gens = poly.context().gens()
-        for gen in gens:
-            exec(f"{gen} = sp.Symbol('{gen}')")
         content, factors = poly.factor()
-        p = sp.simplify(content)
+        p = number_to_sympy(content)
         for factor, multiplicity in factors:
-            factor = str(factor).replace("^", "**")  # from flint syntax back to python
-            p *= eval(f"({factor}) ** ({multiplicity})")
+            p *= mpoly_to_sympy(factor) ** multiplicity
         return p
 
     def factor(self) -> sp.Expr:
@@ -1,9 +1,16 @@
 from typing import List
 
+import flint
 import sympy as sp
 from sympy.abc import x, y
 
-from ramanujantools.flint_core import mpoly_ctx, FlintRational
+from ramanujantools.flint_core import (
+    mpoly_ctx,
+    mpoly_from_sympy,
+    mpoly_to_sympy,
+    FlintRational,
+)
+from ramanujantools.flint_core.rational import LAZY_DEGREE_THRESHOLD
 
 
 def flintify(expr: sp.Expr, symbols: List = None, fmpz=True) -> FlintRational:
@@ -62,11 +69,39 @@ def test_eq():
     assert expr == expr / 2 + 3 - 3 + expr / 2
 
 
+def test_lazy_normalization():
+    product = flintify(x / (x + y)) * flintify((x + y) / y)
+    assert not product._normalized
+    assert flintify(x / y) == product
+    assert product._normalized
+
+
+def test_lazy_normalization_threshold():
+    value = flintify(x / y)
+    factor = flintify((x + 1) / (x + 2), [x, y])
+    for _ in range(LAZY_DEGREE_THRESHOLD):
+        value *= factor * factor.inv()
+        assert max(value._denominator.degrees()) <= LAZY_DEGREE_THRESHOLD
+    assert flintify(x / y) == value
+
+
 def test_factor():
     expected = (x + y) * (x**2 + y**2) * (y - 3) / ((x + 17) * (y - 15) * (x * y + 1))
     assert expected == flintify(expected.expand()).factor()
 
 
+def test_factor_symbol_names():
+    a, b = sp.Symbol("x[0]"), sp.Symbol("lambda")
+    expected = (a - b) * (a + b) / (2 * (a + 1))
+    assert expected == flintify(expected.expand(), fmpz=False).factor()
+
+
+def test_mpoly_sympy_conversion():
+    expr = x**3 * y - sp.Rational(7, 3) * x * y**2 + 5
+    ctx = mpoly_ctx([x, y], fmpz=False)
+    assert expr == mpoly_to_sympy(mpoly_from_sympy(expr, ctx))
+
+
 def test_subs_integer():
     expr = (x**2 + 3 * y / 2 - sp.Rational(5, 4)) / (x * y + y**2 / 3)
     subs = {x: 3, y: x}
@@ -79,3 +114,10 @@ def test_subs_rational():
     assert flintify(expr.subs(subs), symbols=[x, y], fmpz=False) == flintify(
         expr, fmpz=False
     ).subs(subs)
+
+
+def test_evaluate():
+    expr = (x**2 - 3 * y) / (x + 2 * y)
+    point = [flint.fmpq(1, 2), flint.fmpz(3)]
+    expected = expr.subs({x: sp.Rational(1, 2), y: 3})
+    assert expected == flintify(expr, fmpz=False).evaluate(point).factor()
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import List
+
+import os
+import json
+import flint
+import numpy as np
+
+from ramanujantools.flint_core import FlintMatrix, FlintRational, FlintFractionMatrix
+from ramanujantools.flint_core.context import context_from_state, context_state
+
+
+def encode_integers(integers: List[int]) -> np.ndarray:
+    """
+    Encodes integers of any size as a uint8 array of shape (len(integers), width),
+    where every row is the little endian two's complement representation of an integer.
+    """
+    width = max([(abs(int(value)).bit_length() + 8) // 8 for value in integers] + [1])
+    result = np.zeros((len(integers), width), dtype=np.uint8)
+    for index, value in enumerate(integers):
+        result[index] = np.frombuffer(
+            int(value).to_bytes(width, "little", signed=True), dtype=np.uint8
+        )
+    return result
+
+
+def decode_integers(array: np.ndarray) -> List[int]:
+    """
+    Decodes integers encoded by `encode_integers`.
+    """
+    return [int.from_bytes(row.tobytes(), "little", signed=True) for row in array]
+
+
+def save_matrix(matrix: FlintMatrix, path: str) -> None:
+    """
+    Writes a FlintMatrix (or FlintFractionMatrix) to the directory `path`, in a compact binary format.
+
+    The matrix is stored as numerators over a shared denominator (see `FlintMatrix.fraction`),
+    where all polynomials are flattened to a single exponent array and coefficient arrays,
+    and saved as .npy files, such that `load_matrix` can memory map them.
+    """
+    numerators, denominator = matrix.fraction()
+    terms = [poly.to_dict() for poly in numerators + [denominator]]
+    names, fmpz, ordering = context_state(matrix.ctx)
+    offsets = np.cumsum([0] + [len(poly_terms) for poly_terms in terms])
+    exponents = np.array(
+        [exponent for poly_terms in terms for exponent in poly_terms.keys()],
+        dtype=np.int64,
+    ).reshape(-1, len(names))
+    coefficients = [
+        coefficient for poly_terms in terms for coefficient in poly_terms.values()
+    ]
+
+    os.makedirs(path, exist_ok=True)
+    metadata = {
+        "type": type(matrix).__name__,
+        "rows": matrix.rows(),
+        "cols": matrix.cols(),
+        "names": list(names),
+        "fmpz": fmpz,
+        "ordering": ordering,
+    }
+    with open(os.path.join(path, "metadata.json"), "w") as file:
+        json.dump(metadata, file)
+    np.save(os.path.join(path, "offsets.npy"), offsets)
+    np.save(os.path.join(path, "exponents.npy"), exponents)
+    np.save(
+        os.path.join(path, "numerators.npy"),
+        encode_integers([c.numerator for c in coefficients]),
+    )
+    np.save(
+        os.path.join(path, "denominators.npy"),
+        encode_integers([c.denominator for c in coefficients]),
+    )
+
+
+def load_matrix(path: str, mmap: bool = True) -> FlintMatrix:
+    """
+    Reads a matrix written by `save_matrix`, of the same type it was written as.
+    Args:
+        path: The directory the matrix was saved to.
+        mmap: if True, the arrays are memory mapped instead of read to memory in advance.
+    """
+    with open(os.path.join(path, "metadata.json")) as file:
+        metadata = json.load(file)
+    mmap_mode = "r" if mmap else None
+    arrays = {
+        name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+        for name in ["offsets", "exponents", "numerators", "denominators"]
+    }
+
+    fmpz = metadata["fmpz"]
+    ctx = context_from_state((metadata["names"], fmpz, metadata["ordering"]))
+    numerators = decode_integers(arrays["numerators"])
+    denominators = decode_integers(arrays["denominators"])
+    coefficients = (
+        numerators
+        if fmpz
+        else [flint.fmpq(p, q) for p, q in zip(numerators, denominators)]
+    )
+    exponents = [tuple(int(e) for e in row) for row in arrays["exponents"]]
+    offsets = [int(offset) for offset in arrays["offsets"]]
+    polys = [
+        ctx.from_dict(dict(zip(exponents[begin:end], coefficients[begin:end])))
+        for begin, end in zip(offsets, offsets[1:])
+    ]
+
+    rows, cols = metadata["rows"], metadata["cols"]
+    if metadata["type"] == FlintFractionMatrix.__name__:
+        return FlintFractionMatrix(rows, cols, polys[:-1], polys[-1], ctx)
+    values = [FlintRational(numerator, polys[-1], ctx) for numerator in polys[:-1]]
+    return FlintMatrix(rows, cols, values, ctx)
@@ -0,0 +1,102 @@
+import pickle
+
+import flint
+import sympy as sp
+from pytest import raises
+from sympy.abc import n, x
+
+from ramanujantools import Matrix
+from ramanujantools.flint_core import (
+    mpoly_ctx,
+    FlintRational,
+    FlintMatrix,
+    FlintFractionMatrix,
+    save_matrix,
+    load_matrix,
+)
+
+
+def matrices():
+    bivariate = Matrix([[n / 3, x**2 - 10**30], [1 / (n + x), 7]])
+    univariate = Matrix([[n / 3, -(10**30)], [1 / (n + 2), 7]])
+    for matrix in [bivariate, univariate]:
+        for fmpz in [True, False]:
+            ctx = mpoly_ctx(matrix.free_symbols, fmpz)
+            flint_matrix = FlintMatrix.from_sympy(matrix, ctx)
+            yield flint_matrix
+            yield FlintFractionMatrix.from_flint(flint_matrix)
+
+
+def test_pickle_matrix():
+    for matrix in matrices():
+        loaded = pickle.loads(pickle.dumps(matrix))
+        assert type(matrix) is type(loaded)
+        assert matrix == loaded
+
+
+def test_pickle_rational():
+    for matrix in matrices():
+        assert matrix[1, 0] == pickle.loads(pickle.dumps(matrix[1, 0]))
+
+
+def test_pickle_univariate_context():
+    ctx = mpoly_ctx([n], fmpz=False)
+    assert ctx is pickle.loads(pickle.dumps(ctx))
+    poly = ctx.gens()[0] / 3 + 1
+    assert poly == pickle.loads(pickle.dumps(poly))
+
+
+def test_pickle_keeps_context():
+    for ctx_type in [flint.fmpz_mpoly_ctx, flint.fmpq_mpoly_ctx]:
+        for names in [["y", "x"], ["x"]]:
+            ctx = ctx_type.get(names, "lex")
+            gens = ctx.gens()
+            poly = gens[0] ** 2 + gens[-1] + 1
+            rational = FlintRational(poly, ctx.constant(1), ctx)
+            loaded = pickle.loads(pickle.dumps(rational))
+            assert ctx is loaded.ctx
+            assert rational == loaded
+            assert poly + loaded.numerator == 2 * poly
+
+            matrix = FlintMatrix(1, 1, [rational], ctx)
+            for value in [matrix, FlintFractionMatrix.from_flint(matrix)]:
+                loaded = pickle.loads(pickle.dumps(value))
+                assert ctx is loaded.ctx
+                assert value == loaded
+
+
+def test_pickle_flint_types_untouched():
+    ctx = flint.fmpz_mpoly_ctx.get(["y", "x"], "lex")
+    for value in [ctx, ctx.gens()[0], flint.fmpz_poly([1, 2])]:
+        with raises(TypeError):
+            pickle.dumps(value)
+
+
+def test_save_load_keeps_context(tmp_path):
+    for names in [["y", "x"], ["x"]]:
+        ctx = flint.fmpz_mpoly_ctx.get(names, "lex")
+        gens = ctx.gens()
+        rational = FlintRational(gens[0] ** 2 + gens[-1], ctx.constant(3), ctx)
+        matrix = FlintMatrix(1, 1, [rational], ctx)
+        path = str(tmp_path / "".join(names))
+        save_matrix(matrix, path)
+        loaded = load_matrix(path)
+        assert ctx is loaded.ctx
+        assert matrix == loaded
+
+
+def test_save_load(tmp_path):
+    for index, matrix in enumerate(matrices()):
+        for mmap in [True, False]:
+            path = str(tmp_path / str(index))
+            save_matrix(matrix, path)
+            loaded = load_matrix(path, mmap)
+            assert type(matrix) is type(loaded)
+            assert matrix == loaded
+
+
+def test_save_load_zero(tmp_path):
+    ctx = mpoly_ctx([n], fmpz=True)
+    matrix = FlintMatrix.from_sympy(Matrix([[0, 0], [n, 0]]), ctx)
+    save_matrix(matrix, str(tmp_path))
+    assert sp.zeros(1, 2) == load_matrix(str(tmp_path)).factor()[0, :]
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from functools import lru_cache
+
+import flint
+
+
+class UnivariateContext:
+    """
+    A polynomial context with a single generator, backed by flint's univariate fmpz_poly or fmpq_poly.
+
+    Supports the subset of the mpoly context interface used by flint_core,
+    such that FlintRational and FlintMatrix can use it interchangeably with multivariate contexts.
+    Use `get` (or `mpoly_ctx`) to create contexts, such that equal contexts are the same object.
+    """
+
+    def __init__(self, name: str, fmpz: bool) -> UnivariateContext:
+        self.name = name
+        self.fmpz = fmpz
+        self.poly_type = flint.fmpz_poly if fmpz else flint.fmpq_poly
+
+    @staticmethod
+    @lru_cache
+    def get(name: str, fmpz: bool) -> UnivariateContext:
+        """
+        Returns the univariate context of the generator `name`.
+        """
+        return UnivariateContext(name, fmpz)
+
+    def __reduce__(self) -> Tuple:
+        return UnivariateContext.get, (self.name, self.fmpz)
+
+    def __repr__(self) -> str:
+        return f"UnivariateContext({self.name}, {self.poly_type.__name__})"
+
+    def nvars(self) -> int:
+        return 1
+
+    def names(self) -> Tuple[str]:
+        return (self.name,)
+
+    def gens(self) -> Tuple[UnivariatePoly]:
+        return (UnivariatePoly(self.poly_type([0, 1]), self),)
+
+    def constant(self, value) -> UnivariatePoly:
+        return UnivariatePoly(self.poly_type([value]), self)
+
+    def from_dict(self, terms: Dict[Tuple[int], object]) -> UnivariatePoly:
+        """
+        Creates a polynomial from a dict of the form {(exponent,): coefficient}, as returned by `to_dict`.
+        """
+        degree = max((exponent for (exponent,) in terms), default=0)
+        coefficients = [0] * (degree + 1)
+        for (exponent,), coefficient in terms.items():
+            coefficients[exponent] = coefficient
+        return UnivariatePoly(self.poly_type(coefficients), self)
+
+
+def unwrap(value):
+    return value.poly if isinstance(value, UnivariatePoly) else value
+
+
+class UnivariatePoly:
+    """
+    Wraps an fmpz_poly or fmpq_poly with the subset of the mpoly interface used by flint_core.
+    """
+
+    __slots__ = ("poly", "ctx")
+
+    def __init__(
+        self, poly: flint.fmpz_poly | flint.fmpq_poly, ctx: UnivariateContext
+    ) -> UnivariatePoly:
+        self.poly = poly
+        self.ctx = ctx
+
+    def __reduce__(self) -> Tuple:
+        return self.ctx.from_dict, (self.to_dict(),)
+
+    def context(self) -> UnivariateContext:
+        return self.ctx
+
+    def __add__(self, other) -> UnivariatePoly:
+        return UnivariatePoly(self.poly + unwrap(other), self.ctx)
+
+    def __radd__(self, other) -> UnivariatePoly:
+        return UnivariatePoly(unwrap(other) + self.poly, self.ctx)
+
+    def __sub__(self, other) -> UnivariatePoly:
+        return UnivariatePoly(self.poly - unwrap(other), self.ctx)
+
+    def __rsub__(self, other) -> UnivariatePoly:
+        return UnivariatePoly(unwrap(other) - self.poly, self.ctx)
+
+    def __mul__(self, other) -> UnivariatePoly:
+        return UnivariatePoly(self.poly * unwrap(other), self.ctx)
+
+    def __rmul__(self, other) -> UnivariatePoly:
+        return UnivariatePoly(unwrap(other) * self.poly, self.ctx)
+
+    def __truediv__(self, other) -> UnivariatePoly:
+        """
+        Exact division, as in mpoly.
+        """
+        return UnivariatePoly(self.poly / unwrap(other), self.ctx)
+
+    def __neg__(self) -> UnivariatePoly:
+        return UnivariatePoly(-self.poly, self.ctx)
+
+    def __pow__(self, exponent: int) -> UnivariatePoly:
+        return UnivariatePoly(self.poly**exponent, self.ctx)
+
+    def __eq__(self, other) -> bool:
+        return self.poly == unwrap(other)
+
+    def __ne__(self, other) -> bool:
+        return self.poly != unwrap(other)
+
+    def __str__(self) -> str:
+        return self.poly.str(var=self.ctx.name)
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __call__(self, value):
+        """
+        Evaluates the polynomial at a point.
+        """
+        return self.poly(value)
+
+    def is_zero(self) -> bool:
+        return self.poly.is_zero()
+
+    def is_one(self) -> bool:
+        return self.poly.is_one()
+
+    def degrees(self) -> Tuple[int]:
+        return (self.poly.degree(),)
+
+    def coeffs(self) -> List:
+        """
+        Returns the nonzero coefficients, from the highest degree to the lowest.
+        """
+        return [c for c in reversed(self.poly.coeffs()) if c != 0]
+
+    def to_dict(self) -> Dict[Tuple[int], object]:
+        return {(i,): c for i, c in enumerate(self.poly.coeffs()) if c != 0}
+
+    def gcd(self, other: UnivariatePoly) -> UnivariatePoly:
+        return UnivariatePoly(self.poly.gcd(unwrap(other)), self.ctx)
+
+    def compose(self, value: UnivariatePoly) -> UnivariatePoly:
+        """
+        Returns self(value).
+        """
+        return UnivariatePoly(self.poly(unwrap(value)), self.ctx)
+
+    def factor(self) -> Tuple[object, List[Tuple[UnivariatePoly, int]]]:
+        """
+        Factors the polynomial into primitive integer polynomials, as in mpoly.
+        Returns:
+            A tuple (content, factors), where factors is a list of (factor, multiplicity) tuples.
+        """
+        if self.ctx.fmpz:
+            content, factors = self.poly.factor()
+        else:
+            content, factors = self.poly.numer().factor()
+            content = flint.fmpq(content) / self.poly.denom()
+        return content, [
+            (UnivariatePoly(self.ctx.poly_type(factor), self.ctx), multiplicity)
+            for factor, multiplicity in factors
+        ]
@@ -0,0 +1,38 @@
+import sympy as sp
+from sympy.abc import n
+
+from ramanujantools import Matrix
+from ramanujantools.flint_core import mpoly_ctx, FlintMatrix, FlintRational
+from ramanujantools.flint_core.univariate import UnivariateContext
+
+
+def test_mpoly_ctx_univariate():
+    for fmpz in [True, False]:
+        ctx = mpoly_ctx([n], fmpz)
+        assert isinstance(ctx, UnivariateContext)
+        assert ctx is mpoly_ctx([n], fmpz)
+
+
+def test_factor():
+    expected = (n + 1) ** 2 * (3 * n - 2) / (5 * (n**2 + 7))
+    for fmpz in [True, False]:
+        ctx = mpoly_ctx([n], fmpz)
+        assert expected == FlintRational.from_sympy(expected.expand(), ctx).factor()
+
+
+def test_to_dict():
+    ctx = mpoly_ctx([n], True)
+    poly = FlintRational.mpoly_from_sympy(3 * n**4 - n + 7, ctx)
+    assert {(4,): 3, (1,): -1, (0,): 7} == poly.to_dict()
+    assert poly == ctx.from_dict(poly.to_dict())
+
+
+def test_walk_matches_multivariate():
+    x = sp.Symbol("x")
+    matrix = Matrix([[0, n**2], [1, (n + 1) / (n + 2)]])
+    univariate = FlintMatrix.from_sympy(matrix, mpoly_ctx([n], False))
+    multivariate = FlintMatrix.from_sympy(matrix, mpoly_ctx([n, x], False))
+    assert (
+        multivariate.walk({n: 1}, 5, {n: n / 2}).factor()
+        == univariate.walk({n: 1}, 5, {n: n / 2}).factor()
+    )
@@ -35,6 +35,12 @@ class Limit:
 
     Contains two matrices for the two last steps of calculation.
     Uses the last step to extract constants, and the previous one to determine precision.
+
+    The matrices may be stored up to a factor, as in `Matrix.walk_projective`.
+    In that case, `current_factor * current` and `previous_factor * previous` are the actual walk matrices.
+    A vector limit (see `walk_vector_to_limit`) holds row vectors of the walk matrices instead.
+    If the walk was calculated in floating point, `working_precision` is its precision in decimal digits,
+    which bounds the reported `precision`.
     """
 
     def __init__(
@@ -43,21 +49,31 @@ class Limit:
         previous: Matrix,
         p_vectors: Optional[List[Matrix]] = None,
         q_vectors: Optional[List[Matrix]] = None,
+        current_factor: sp.Expr = 1,
+        previous_factor: sp.Expr = 1,
+        vector: bool = False,
+        working_precision: Optional[int] = None,
     ):
         self.current = current
         self.previous = previous
-        self.p_vectors = p_vectors or [
-            Matrix.e(self.N(), 0, column=False),
-            Matrix.e(self.N(), self.N() - 1, column=True),
-        ]
-
-        self.q_vectors = q_vectors or [
-            Matrix.e(self.N(), 1, column=False),
-            Matrix.e(self.N(), self.N() - 1, column=True),
-        ]
+        self.current_factor = current_factor
+        self.previous_factor = previous_factor
+        self.vector = vector
+        self.working_precision = working_precision
+        self.p_vectors = p_vectors or Limit.default_p_vectors(self.N())
+        self.q_vectors = q_vectors or Limit.default_q_vectors(self.N())
 
     def __repr__(self) -> str:
-        return f"Limit({self.current}, {self.previous})"
+        args = [repr(self.current), repr(self.previous)]
+        if self.current_factor != 1:
+            args.append(f"current_factor={self.current_factor!r}")
+        if self.previous_factor != 1:
+            args.append(f"previous_factor={self.previous_factor!r}")
+        if self.vector:
+            args.append("vector=True")
+        if self.working_precision is not None:
+            args.append(f"working_precision={self.working_precision}")
+        return f"Limit({', '.join(args)})"
 
     def __str__(self) -> str:
         return repr(self)
@@ -68,10 +84,49 @@ class Limit:
             and self.previous == other.previous
             and self.p_vectors == other.p_vectors
             and self.q_vectors == other.q_vectors
+            and self.current_factor == other.current_factor
+            and self.previous_factor == other.previous_factor
+            and self.vector == other.vector
+            and self.working_precision == other.working_precision
         )
 
+    @staticmethod
+    def default_p_vectors(N: int) -> List[Matrix]:
+        """
+        Returns the default numerator extraction vectors, which extract the [0, -1] element.
+        """
+        return [Matrix.e(N, 0, column=False), Matrix.e(N, N - 1, column=True)]
+
+    @staticmethod
+    def default_q_vectors(N: int) -> List[Matrix]:
+        """
+        Returns the default denominator extraction vectors, which extract the [1, -1] element.
+        """
+        return [Matrix.e(N, 1, column=False), Matrix.e(N, N - 1, column=True)]
+
     def N(self) -> int:
-        return self.current.rows
+        """
+        Returns the dimension of the walk matrix, which is also the length of the vectors of a vector limit.
+        """
+        return self.current.cols
+
+    def is_vector(self) -> bool:
+        """
+        Returns True iff the limit holds row vectors of the walk matrix (see `walk_vector_to_limit`),
+        rather than the walk matrix itself.
+        """
+        return self.vector
+
+    def assert_not_vector(self) -> None:
+        """
+        Asserts that the limit holds the walk matrix itself, as required to search for integer relations.
+        Raises:
+            ValueError: if the limit is a vector limit.
+        """
+        if self.is_vector():
+            raise ValueError(
+                "Integer relations require the full walk matrix, got a vector limit. Use `limit` instead of `limit_vector`"
+            )
 
     @property
     def mp(self):
@@ -85,10 +140,25 @@ class Limit:
         walk_function: Callable[List[int], List[Limit]],
         p_vectors: Optional[List[Matrix]] = None,
         q_vectors: Optional[List[Matrix]] = None,
+        vector: bool = False,
+        working_precision: Optional[int] = None,
     ) -> List[Limit]:
+        """
+        Creates a limit for every depth in `iterations` using `walk_function`.
+
+        `walk_function` returns the walk matrices for a list of depths,
+        or tuples of (matrix, factor) as in `Matrix.walk_projective`.
+        If `vector` is True, it returns row vectors of the walk matrices instead (see `walk_vector_to_limit`).
+        If the walk is calculated in floating point, `working_precision` is its precision in decimal digits.
+        """
         previous_values = [depth - 1 for depth in iterations]
         walk_iterations = sorted(list(set(iterations + previous_values)))
-        walk_matrices = walk_function(walk_iterations)
+        walk_matrices = []
+        walk_factors = []
+        for result in walk_function(walk_iterations):
+            matrix, factor = result if isinstance(result, tuple) else (result, 1)
+            walk_matrices.append(matrix)
+            walk_factors.append(factor)
 
         current_index = 0
         limits = []
@@ -101,10 +171,46 @@ class Limit:
                     walk_matrices[current_index - 1],
                     p_vectors,
                     q_vectors,
+                    walk_factors[current_index],
+                    walk_factors[current_index - 1],
+                    vector,
+                    working_precision,
                 )
             )
         return limits
 
+    @staticmethod
+    def walk_vector_to_limit(
+        iterations: List[int],
+        walk_vector_function: Callable[[List[int], Matrix], List[Matrix]],
+        N: int,
+        p_vectors: Optional[List[Matrix]] = None,
+        q_vectors: Optional[List[Matrix]] = None,
+    ) -> List[Limit]:
+        r"""
+        Same as `walk_to_limit`, but only walks with the row vectors of `p_vectors` and `q_vectors`.
+
+        `walk_vector_function(iterations, vectors)` is expected to return `vectors * M` for each depth,
+        where `M` is the walk matrix.
+        The returned limits hold the 2xN matrices $\begin{pmatrix} u_p M \cr u_q M \end{pmatrix}$,
+        where $u_p$ and $u_q$ are the row vectors of `p_vectors` and `q_vectors` respectively,
+        with extraction vectors adjusted accordingly, such that `as_rational` is unchanged.
+        """
+        p_vectors = p_vectors or Limit.default_p_vectors(N)
+        q_vectors = q_vectors or Limit.default_q_vectors(N)
+        vectors = Matrix.vstack(p_vectors[0], q_vectors[0])
+
+        def walk_function(iterations):
+            return walk_vector_function(iterations, vectors)
+
+        return Limit.walk_to_limit(
+            iterations,
+            walk_function,
+            [Matrix([[1, 0]]), p_vectors[1]],
+            [Matrix([[0, 1]]), q_vectors[1]],
+            vector=True,
+        )
+
     def as_rational(self, previous=False) -> List:
         r"""
         Returns the limit as a rational number $\frac{p}{q}$.
@@ -121,8 +227,9 @@ class Limit:
             A list of the form [p, q], representing the rational number.
         """
         matrix = self.previous if previous else self.current
-        p = sp.Rational((self.p_vectors[0] * matrix * self.p_vectors[1])[0])
-        q = sp.Rational((self.q_vectors[0] * matrix * self.q_vectors[1])[0])
+        factor = self.previous_factor if previous else self.current_factor
+        p = sp.Rational((self.p_vectors[0] * matrix * self.p_vectors[1])[0] * factor)
+        q = sp.Rational((self.q_vectors[0] * matrix * self.q_vectors[1])[0] * factor)
         return [
             sp.Integer(p.numerator * q.denominator),
             sp.Integer(p.denominator * q.numerator),
@@ -132,9 +239,20 @@ class Limit:
         """
         Returns the error in 'digits' for the PCF convergence.
 
+        If the walk was calculated in floating point, the result is capped by `working_precision`,
+        as the walk matrices carry no more digits than that.
+
         Args:
             base: The numerical base in which to return the precision (by default 10)
         """
+        if self.working_precision is None:
+            return self._convergence_precision(base)
+        return min(
+            self._convergence_precision(base),
+            int(mp.floor(self.working_precision * mp.log(10, base))),
+        )
+
+    def _convergence_precision(self, base: int) -> int:
         p1, q1 = self.as_rational()
         p2, q2 = self.as_rational(previous=True)
         numerator = p1 * q2 - q1 * p2
@@ -196,7 +314,10 @@ class Limit:
             column_index: The column to use in order to extract $p_i$. -1 by default.
         Returns:
             a string describing the integer relation, if exists. None otherwise.
+        Raises:
+            ValueError: if the limit is a vector limit (see `is_vector`).
         """
+        self.assert_not_vector()
         pslq_result = self.mp.pslq(self.current.col(column_index), maxcoeff=maxcoeff)
         if pslq_result is None:
             return None
@@ -217,7 +338,10 @@ class Limit:
             column_index: The column to use in order to extract $p_i$. -1 by default.
         Returns:
             a string describing the integer relation, if exists. None otherwise.
+        Raises:
+            ValueError: if the limit is a vector limit (see `is_vector`).
         """
+        self.assert_not_vector()
         if L == 0:
             return self.identify_rational()
 
@@ -1,7 +1,9 @@
-from pytest import approx
+from pytest import approx, raises
 
 from mpmath import mp
 
+from sympy.abc import n
+
 from ramanujantools import Matrix, Limit
 from .limit import most_round_in_range
 
@@ -24,6 +26,13 @@ def test_as_rational_higher_order():
     assert [p, q] == limit.as_rational()
 
 
+def test_as_rational_factor():
+    p = 2
+    q = 3
+    limit = Limit(Matrix([[0, p], [1, q]]), Matrix.eye(2), current_factor=5)
+    assert [5 * p, 5 * q] == limit.as_rational()
+
+
 def test_as_float():
     p = 2
     q = 3
@@ -76,3 +85,47 @@ def test_rounding_small_change():
 def test_repr():
     limit = limit_for_tests(Matrix([[1, 2], [3, 4]]))
     assert limit == eval(repr(limit))
+
+
+def test_repr_working_precision():
+    limit = Limit(
+        Matrix([[1, 2], [3, 4]]), Matrix([[1, 2], [3, 4]]), working_precision=30
+    )
+    assert limit == eval(repr(limit))
+
+
+def test_repr_projective():
+    m = Matrix([[0, n**2], [1, 2 * n + 1]])
+    limit = m.limit({n: 1}, 10, {n: 1}, reduce_content=True)
+    assert limit.current_factor != 1
+    assert limit == eval(repr(limit))
+
+
+def test_vector_limit():
+    m = Matrix([[0, 0, n**3], [1, 0, -(n**2)], [0, 1, 3 * n + 1]])
+    limit = m.limit({n: 1}, 20, {n: 1})
+    vector_limit = m.limit_vector({n: 1}, 20, {n: 1})
+    assert not limit.is_vector()
+    assert vector_limit.is_vector()
+    assert limit.N() == vector_limit.N() == 3
+    with raises(ValueError):
+        vector_limit.identify_rational()
+    with raises(ValueError):
+        vector_limit.identify(vector_limit.as_float())
+
+
+def test_vector_limit_square():
+    m = Matrix([[0, -(n**2)], [1, 2 * n + 1]])
+    p_vectors = [Matrix([[1, 2]]), Matrix([0, 1])]
+    q_vectors = [Matrix([[3, 4]]), Matrix([0, 1])]
+    limit = m.limit({n: 1}, 20, {n: 1})
+    limit.p_vectors = p_vectors
+    limit.q_vectors = q_vectors
+    vector_limit = m.limit_vector({n: 1}, 20, {n: 1}, p_vectors, q_vectors)
+    assert vector_limit.is_vector()
+    assert limit.as_rational() == vector_limit.as_rational()
+    assert limit != vector_limit
+    with raises(ValueError):
+        vector_limit.identify_rational()
+    with raises(ValueError):
+        vector_limit.identify(vector_limit.as_float())
@@ -1,9 +1,11 @@
 from __future__ import annotations
-from typing import Dict, List, Set, Callable, Tuple
-from functools import lru_cache, cached_property
+from typing import Dict, List, Optional, Set, Callable, Tuple
+from functools import cached_property
 
 from multimethod import multimethod
 
+import flint
+import gmpy2
 import numpy as np
 import mpmath as mp
 import sympy as sp
@@ -11,6 +13,9 @@ from sympy.abc import n
 
 from ramanujantools import Position
 from ramanujantools.flint_core import mpoly_ctx, FlintMatrix
+from ramanujantools.numeric_core import NumericMatrix
+from ramanujantools.caching import cached, digest
+from ramanujantools.checkpoint_store import CheckpointStore
 
 
 class Matrix(sp.Matrix):
@@ -55,7 +60,36 @@ class Matrix(sp.Matrix):
         )
 
     def __hash__(self) -> int:
-        return hash(frozenset(self))
+        return hash((self.shape, tuple(self)))
+
+    def digest(self) -> str:
+        """
+        Returns a deterministic digest of the matrix, which is stable across processes and runs,
+        unlike `hash`. The digest is structural, i.e, equal matrices written differently have different digests.
+
+        Memoized on the matrix, and invalidated by in-place modifications (see `__setitem__`).
+        """
+        result = getattr(self, "_digest", None)
+        if result is None:
+            result = digest(repr((self.shape, [sp.srepr(cell) for cell in self])))
+            self._digest = result
+        return result
+
+    def __setitem__(self, key, value) -> None:
+        self._digest = None
+        super().__setitem__(key, value)
+
+    def fill(self, value) -> None:
+        self._digest = None
+        super().fill(value)
+
+    def _eval_col_del(self, col: int) -> None:
+        self._digest = None
+        super()._eval_col_del(col)
+
+    def _eval_row_del(self, row: int) -> None:
+        self._digest = None
+        super()._eval_row_del(row)
 
     def __call__(self, substitutions: Dict) -> Matrix:
         """
@@ -86,6 +120,19 @@ class Matrix(sp.Matrix):
 
         return (self.free_symbols - subbed_out).union(subbed_in) != set()
 
+    def _can_call_numeric_walk(self, trajectory: Dict, start: Dict) -> bool:
+        """
+        Returns true iff the walk is fully numeric and can be calculated using `NumericMatrix`.
+        """
+        trajectory = Position(trajectory)
+        start = Position(start)
+        return (
+            self.free_symbols.issubset(start.keys())
+            and trajectory.is_rational()
+            and start.is_rational()
+            and NumericMatrix.is_compilable(self)
+        )
+
     def _can_call_numerical_subs(self, substitutions: Dict) -> bool:
         """
         Returns true iff the all substitutions are numerical and we can can call `numerical_subs` instead of `xreplace`.
@@ -106,7 +153,7 @@ class Matrix(sp.Matrix):
         return fast_subs(substitutions)
 
     @staticmethod
-    @lru_cache
+    @cached("Matrix.create_fast_subs", max_entries=4096)
     def create_fast_subs(matrix: Matrix) -> Callable:
         """
         Returns a function that evaluates the matrix at given substitutions.
@@ -172,14 +219,14 @@ class Matrix(sp.Matrix):
         """
         return self.as_polynomial().reduce() == other.as_polynomial().reduce()
 
-    @lru_cache
+    @cached("Matrix.inverse")
     def inverse(self) -> Matrix:
         """
         Inverts the matrix.
         """
         return self.inv()
 
-    @lru_cache
+    @cached("Matrix.simplify")
     def simplify(self) -> Matrix:
         """
         Returns a simplified version of matrix
@@ -285,37 +332,110 @@ class Matrix(sp.Matrix):
         """
         return self.coboundary(self.companion_coboundary_matrix())
 
-    @lru_cache
+    def _flint_numeric_walk(
+        self, trajectory: Position, iterations: List[int], start: Position
+    ) -> List[Matrix]:
+        """
+        Numeric walk using flint's native integer matrices (see `FlintMatrix.walk_numeric`).
+        Used instead of `NumericMatrix` for sequential walks of non-companion matrices,
+        where full matrix products are needed in every step.
+        """
+        ctx = mpoly_ctx(
+            self.free_symbols, fmpz=start.is_integer() and trajectory.is_integer()
+        )
+        return [
+            Matrix.from_numeric(values, denominator)
+            for values, denominator in FlintMatrix.from_sympy(self, ctx).walk_numeric(
+                trajectory, iterations, start
+            )
+        ]
+
+    @staticmethod
+    def from_numeric(values: flint.fmpz_mat, denominator: flint.fmpz) -> Matrix:
+        """
+        Converts an integer matrix and a denominator, as returned by `FlintMatrix.walk_numeric`, to a Matrix.
+        """
+        if denominator == 1:
+            cells = [int(value) for value in values.entries()]
+        else:
+            cells = [
+                sp.Rational(int(value), int(denominator)) for value in values.entries()
+            ]
+        return Matrix(values.nrows(), values.ncols(), cells)
+
+    @cached("Matrix._walk_inner")
     def _walk_inner(
         self,
         trajectory: Position,
         iterations: Tuple[int],
         start: Position,
+        binary_splitting: bool = False,
+        initial: Optional[Matrix] = None,
+        precision: Optional[int] = None,
+        workers: int = 1,
     ) -> List[Matrix]:
         """
         Internal walk function, used for type conversions and for caching. Do not use directly.
         """
         from ramanujantools.flint_core import FlintMatrix
 
-        if self._can_call_flint_walk(trajectory, start):
+        if precision is not None:
+            if not self._can_call_numeric_walk(trajectory, start):
+                raise ValueError(
+                    "Fixed precision walks are only supported when all symbols are substituted by rationals, "
+                    f"got trajectory={trajectory}, start={start}"
+                )
+            results = NumericMatrix.from_sympy(self, trajectory, start).walk_mp(
+                list(iterations), precision
+            )
+            if initial is not None:
+                results = [initial * result for result in results]
+            return results
+        elif self._can_call_flint_walk(trajectory, start):
             symbols = self.walk_free_symbols(start)
             as_flint = FlintMatrix.from_sympy(
                 self, mpoly_ctx(symbols, fmpz=start.is_polynomial())
             )
-            results = as_flint.walk(trajectory, list(iterations), start)
+            results = as_flint.walk(
+                trajectory,
+                list(iterations),
+                start,
+                binary_splitting=binary_splitting,
+                workers=workers,
+            )
             results = [result.factor() for result in results]
+            if initial is not None:
+                results = [initial * result for result in results]
             return results
-        else:
-            results = []
-            position = start.copy()
-            matrix = Matrix.eye(self.rows)
-            for depth in range(0, iterations[-1]):
-                if depth in iterations:
-                    results.append(matrix)
-                matrix *= self(position)
-                position += trajectory
-            results.append(matrix)  # Last matrix, for iterations[-1]
-            return results
+        elif self._can_call_numeric_walk(trajectory, start):
+            try:
+                if (
+                    not binary_splitting
+                    and workers == 1
+                    and initial is None
+                    and len(self.free_symbols) > 0
+                    and not self.is_companion()
+                ):
+                    return self._flint_numeric_walk(trajectory, list(iterations), start)
+                return NumericMatrix.from_sympy(self, trajectory, start).walk(
+                    list(iterations),
+                    binary_splitting=binary_splitting,
+                    initial=initial,
+                    workers=workers,
+                )
+            except ZeroDivisionError:
+                pass  # The walk hits a pole, multiplied symbolically below such that it results in nan
+
+        results = []
+        position = start.copy()
+        matrix = Matrix.eye(self.rows) if initial is None else initial
+        for depth in range(0, iterations[-1]):
+            if depth in iterations:
+                results.append(matrix)
+            matrix *= self(position)
+            position += trajectory
+        results.append(matrix)  # Last matrix, for iterations[-1]
+        return results
 
     @multimethod
     def walk(  # noqa: F811
@@ -323,6 +443,10 @@ class Matrix(sp.Matrix):
         trajectory: Dict,
         iterations: List[int],
         start: Dict,
+        binary_splitting: bool = False,
+        precision: Optional[int] = None,
+        workers: int = 1,
+        store: Optional[CheckpointStore] = None,
     ) -> List[Matrix]:
         r"""
         Returns the multiplication result of walking in a certain trajectory.
@@ -337,6 +461,18 @@ class Matrix(sp.Matrix):
             trajectory: the trajectory of a single step in the walk, as defined above.
             iterations: The amount of multiplications to perform. Can be an integer value or a list of values.
             start: the starting point of the matrix multiplication
+            binary_splitting: if True, multiplies the matrices between every two requested depths
+                in a balanced product tree instead of one by one.
+                This is asymptotically faster for deep walks, where the integers grow big. False by default.
+            precision: if not None, the walk is calculated using floating point numbers
+                of `precision` decimal digits instead of exact arithmetic, and the result contains sympy Floats.
+                Only supported when all symbols are substituted by rational numbers.
+            workers: if larger than 1, the walk is cut into contiguous segments,
+                whose products are calculated in parallel in a pool of `workers` processes and then multiplied.
+                Only used by exact walks, i.e, ignored when `precision` is given. 1 by default.
+            store: if given, a `CheckpointStore` that the walk resumes from and stores its result in.
+                The walk starts from the deepest stored product that is not deeper than `iterations[0]`,
+                and the product at `iterations[-1]` is stored for later walks. Only supported for exact walks.
         Returns:
             The walk multiplication matrix as defined above.
             If iterations is list, returns a list of matrices.
@@ -345,6 +481,41 @@ class Matrix(sp.Matrix):
                         if `start` and `trajectory` have different keys,
                         if `iterations` contains duplicate values
         """
+        self._validate_walk_arguments(trajectory, iterations, start)
+        trajectory = Position(trajectory)
+        start = Position(start)
+        if store is None:
+            return self._walk_inner(
+                trajectory,
+                tuple(iterations),
+                start,
+                binary_splitting,
+                precision=precision,
+                workers=workers,
+            )
+
+        if precision is not None:
+            raise ValueError("Checkpoint stores only support exact walks")
+        key = store.key(self, trajectory, start)
+        depth, initial = store.deepest(key, iterations[0])
+        results = self._walk_inner(
+            trajectory,
+            tuple(iteration - depth for iteration in iterations),
+            start + depth * trajectory,
+            binary_splitting,
+            initial,
+            workers=workers,
+        )
+        if iterations[-1] > depth:
+            store.save(key, iterations[-1], results[-1])
+        return results
+
+    def _validate_walk_arguments(
+        self, trajectory: Dict, iterations: List[int], start: Dict
+    ) -> None:
+        """
+        Raises a ValueError if the arguments of a walk are invalid. See `walk`.
+        """
         if not self.is_square():
             raise ValueError(
                 f"Matrix.walk is only supported for square matrices, got a {self.rows}x{self.cols} matrix"
@@ -367,18 +538,163 @@ class Matrix(sp.Matrix):
             raise ValueError(
                 f"iterations must contain only non-negative values, got {iterations}"
             )
+
+    @multimethod
+    def walk(  # noqa: F811
+        self,
+        trajectory: Dict,
+        iterations: int,
+        start: Dict,
+        binary_splitting: bool = False,
+        precision: Optional[int] = None,
+        workers: int = 1,
+        store: Optional[CheckpointStore] = None,
+    ) -> Matrix:
+        return self.walk(
+            trajectory,
+            [iterations],
+            start,
+            binary_splitting=binary_splitting,
+            precision=precision,
+            workers=workers,
+            store=store,
+        )[0]
+
+    @cached("Matrix._walk_projective_inner")
+    def _walk_projective_inner(
+        self,
+        trajectory: Position,
+        iterations: Tuple[int],
+        start: Position,
+        period: int,
+        binary_splitting: bool,
+    ) -> List[Tuple[Matrix, sp.Expr]]:
+        """
+        Internal projective walk function, used for type conversions and for caching. Do not use directly.
+        """
+        if self._can_call_flint_walk(trajectory, start):
+            symbols = self.walk_free_symbols(start)
+            as_flint = FlintMatrix.from_sympy(
+                self, mpoly_ctx(symbols, fmpz=start.is_polynomial())
+            )
+            return [
+                (matrix.factor(), factor.factor())
+                for matrix, factor in as_flint.walk_projective(
+                    trajectory, list(iterations), start, period
+                )
+            ]
+        elif self._can_call_numeric_walk(trajectory, start):
+            return NumericMatrix.from_sympy(self, trajectory, start).walk_projective(
+                list(iterations), period, binary_splitting
+            )
+        else:
+            results = self._walk_inner(trajectory, iterations, start, binary_splitting)
+            return [(matrix, sp.Integer(1)) for matrix in results]
+
+    @multimethod
+    def walk_projective(
+        self,
+        trajectory: Dict,
+        iterations: List[int],
+        start: Dict,
+        period: int = 256,
+        binary_splitting: bool = False,
+    ) -> List[Tuple[Matrix, sp.Expr]]:
+        """
+        Same as `walk`, but periodically divides the content out of the accumulated product.
+
+        A limit is projective, so the content of the walk matrix is irrelevant to it,
+        but the content grows with the walk and slows down every multiplication.
+        The removed factor is recorded, so the exact walk result can be reconstructed.
+
+        Args:
+            trajectory: the trajectory of a single step in the walk, see `walk`.
+            iterations: The amount of multiplications to perform. Can be an integer value or a list of values.
+            start: the starting point of the matrix multiplication
+            period: The amount of steps between two content reductions.
+                The content is also reduced at every requested depth.
+            binary_splitting: see `walk`.
+                When True, the content is only reduced at the requested depths.
+        Returns:
+            A tuple (matrix, factor) such that `factor * matrix` is the walk result.
+            If iterations is list, returns a list of tuples.
+        """
+        self._validate_walk_arguments(trajectory, iterations, start)
+        return self._walk_projective_inner(
+            Position(trajectory),
+            tuple(iterations),
+            Position(start),
+            period,
+            binary_splitting,
+        )
+
+    @multimethod
+    def walk_projective(  # noqa: F811
+        self,
+        trajectory: Dict,
+        iterations: int,
+        start: Dict,
+        period: int = 256,
+        binary_splitting: bool = False,
+    ) -> Tuple[Matrix, sp.Expr]:
+        return self.walk_projective(
+            trajectory, [iterations], start, period, binary_splitting=binary_splitting
+        )[0]
+
+    @multimethod
+    def walk_vector(
+        self,
+        trajectory: Dict,
+        iterations: List[int],
+        start: Dict,
+        vectors: Optional[Matrix] = None,
+        binary_splitting: bool = False,
+    ) -> List[Matrix]:
+        r"""
+        Returns the multiplication result of walking in a certain trajectory, multiplied by row vectors from the left.
+
+        That is, returns `vectors * self.walk(trajectory, iterations, start)`.
+        Since the walk multiplies from the right, only the k rows of `vectors` are carried through the walk
+        when it is numeric, which costs $O(kN^2)$ per step instead of $O(N^3)$ for the full product.
+
+        Args:
+            trajectory: the trajectory of a single step in the walk, see `walk`.
+            iterations: The amount of multiplications to perform. Can be an integer value or a list of values.
+            start: the starting point of the matrix multiplication
+            vectors: a kxN matrix whose rows are the vectors to walk with.
+                By default, the first two rows of the identity matrix, which extract $p$ and $q$ (see `Limit`).
+            binary_splitting: see `walk`.
+        Returns:
+            The kxN walk multiplication matrix as defined above.
+            If iterations is list, returns a list of matrices.
+        """
+        self._validate_walk_arguments(trajectory, iterations, start)
+        if vectors is None:
+            vectors = Matrix.eye(self.rows)[0:2, :]
         return self._walk_inner(
-            Position(trajectory), tuple(iterations), Position(start)
+            Position(trajectory),
+            tuple(iterations),
+            Position(start),
+            binary_splitting,
+            Matrix(vectors),
         )
 
     @multimethod
-    def walk(  # noqa: F811
+    def walk_vector(  # noqa: F811
         self,
         trajectory: Dict,
         iterations: int,
         start: Dict,
+        vectors: Optional[Matrix] = None,
+        binary_splitting: bool = False,
     ) -> Matrix:
-        return self.walk(trajectory, [iterations], start)[0]
+        return self.walk_vector(
+            trajectory,
+            [iterations],
+            start,
+            vectors,
+            binary_splitting=binary_splitting,
+        )[0]
 
     def walk_free_symbols(self, start: Dict) -> Set:
         """
@@ -398,13 +714,55 @@ class Matrix(sp.Matrix):
         trajectory: Dict,
         iterations: List[int],
         start: Dict,
+        binary_splitting: bool = False,
+        reduce_content: bool = False,
+        precision: Optional[int] = None,
+        store: Optional[CheckpointStore] = None,
     ):  # noqa: F811
+        """
+        Returns the limits of walking in a certain trajectory, at the requested depths.
+        Args:
+            trajectory: the trajectory of a single step in the walk, see `walk`.
+            iterations: The amount of multiplications to perform. Can be an integer value or a list of values.
+            start: the starting point of the matrix multiplication
+            binary_splitting: see `walk`.
+            reduce_content: if True, walks using `walk_projective`.
+                Only supported for exact walks, i.e, without `precision` and `store`.
+            precision: see `walk`.
+            store: see `walk`.
+        Returns:
+            The limit of the walk. If iterations is list, returns a list of limits.
+        Raises:
+            ValueError: If `reduce_content` is combined with `precision` or `store`.
+        """
         from ramanujantools import Limit
 
+        if reduce_content and precision is not None:
+            raise ValueError(
+                "Projective walks (reduce_content) only support exact walks"
+            )
+        if reduce_content and store is not None:
+            raise ValueError(
+                "Checkpoint stores do not support projective walks (reduce_content)"
+            )
+
         def walk_function(iterations):
-            return self.walk(trajectory, iterations, start)
+            if reduce_content:
+                return self.walk_projective(
+                    trajectory, iterations, start, binary_splitting=binary_splitting
+                )
+            return self.walk(
+                trajectory,
+                iterations,
+                start,
+                binary_splitting=binary_splitting,
+                precision=precision,
+                store=store,
+            )
 
-        return Limit.walk_to_limit(iterations, walk_function)
+        return Limit.walk_to_limit(
+            iterations, walk_function, working_precision=precision
+        )
 
     @multimethod
     def limit(  # noqa: F811
@@ -412,8 +770,114 @@ class Matrix(sp.Matrix):
         trajectory: Dict,
         iterations: int,
         start: Dict,
+        binary_splitting: bool = False,
+        reduce_content: bool = False,
+        precision: Optional[int] = None,
+        store: Optional[CheckpointStore] = None,
     ):
-        return self.limit(trajectory, [iterations], start)[0]
+        return self.limit(
+            trajectory,
+            [iterations],
+            start,
+            binary_splitting=binary_splitting,
+            reduce_content=reduce_content,
+            precision=precision,
+            store=store,
+        )[0]
+
+    @multimethod
+    def limit_vector(
+        self,
+        trajectory: Dict,
+        iterations: List[int],
+        start: Dict,
+        p_vectors: Optional[List[Matrix]] = None,
+        q_vectors: Optional[List[Matrix]] = None,
+        binary_splitting: bool = False,
+    ):
+        """
+        Same as `limit`, but only walks with the row vectors of `p_vectors` and `q_vectors` (see `walk_vector`).
+
+        The returned limits hold 2xN matrices rather than the full walk matrices,
+        which are sufficient for `as_rational`, `as_float`, `precision` and `delta`.
+        """
+        from ramanujantools import Limit
+
+        def walk_function(iterations, vectors):
+            return self.walk_vector(
+                trajectory,
+                iterations,
+                start,
+                vectors,
+                binary_splitting=binary_splitting,
+            )
+
+        return Limit.walk_vector_to_limit(
+            iterations, walk_function, self.rows, p_vectors, q_vectors
+        )
+
+    @multimethod
+    def limit_vector(  # noqa: F811
+        self,
+        trajectory: Dict,
+        iterations: int,
+        start: Dict,
+        p_vectors: Optional[List[Matrix]] = None,
+        q_vectors: Optional[List[Matrix]] = None,
+        binary_splitting: bool = False,
+    ):
+        return self.limit_vector(
+            trajectory,
+            [iterations],
+            start,
+            p_vectors,
+            q_vectors,
+            binary_splitting=binary_splitting,
+        )[0]
+
+    def screen(
+        self,
+        trajectory: Dict,
+        iterations: List[int],
+        starts: List[Dict],
+        p_vectors: Optional[List[Matrix]] = None,
+        q_vectors: Optional[List[Matrix]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximates `limit` from many starting points at once, using float64 arithmetic.
+
+        All walks are calculated in lockstep using NumPy (see `numeric_core.BatchMatrix`),
+        which is orders of magnitude faster than exact walks, and is meant for pruning candidates before them.
+        Args:
+            trajectory: See `walk`.
+            iterations: The sorted amounts of multiplications to perform. Must be positive.
+            starts: A list of starting points. All symbols of the matrix must be substituted by numbers.
+            p_vectors: See `Limit`.
+            q_vectors: See `Limit`.
+        Returns:
+            A tuple (limits, digits) of arrays of shape (len(starts), len(iterations)),
+            where `limits[i][j]` approximates `limit(trajectory, iterations[j], starts[i]).as_float()`
+            and `digits[i][j]` approximates its `precision()`, up to the float64 resolution of about 15 digits.
+        """
+        from ramanujantools.numeric_core import BatchMatrix
+
+        if not (
+            self.free_symbols.issubset(trajectory.keys())
+            and Position(trajectory).is_rational()
+            and NumericMatrix.is_compilable(self)
+        ):
+            raise ValueError(
+                f"Screening requires a rational matrix and trajectory, got trajectory={trajectory}"
+            )
+        for start in starts:
+            self._validate_walk_arguments(trajectory, iterations, start)
+            if not Position(start).is_rational():
+                raise ValueError(
+                    f"Screening requires all symbols to be substituted, got start={start}"
+                )
+        return BatchMatrix.from_starts(self, trajectory, starts).limit(
+            iterations, p_vectors, q_vectors
+        )
 
     def as_pcf(self, deflate_all=True):
         """
@@ -497,6 +961,25 @@ class Matrix(sp.Matrix):
             deltas.append(sp.log(abs(lambdas[0]) / abs(lambdas[i])))
         return deltas
 
+    def _numeric_reduced_denominators(self, depths: List[int]) -> List[float]:
+        r"""
+        Returns $\log|\bar{q}|$ for every depth in `depths`, as in `gcd_slope`.
+
+        Only the two rows that extract $p_n$ and $q_n$ are walked (see `walk_vector`),
+        and the gcd is calculated over gmpy2 integers, without creating any Limit or sympy objects.
+        """
+        numeric = NumericMatrix.from_sympy(self, {n: 1}, {n: 1})
+        N = self.rows
+        results = []
+        for values, _, denominator in numeric._walk(
+            depths, False, Matrix.eye(N)[0:2, :], None
+        ):
+            p = gmpy2.mpq(values[N - 1], denominator)
+            q = gmpy2.mpq(values[2 * N - 1], denominator)
+            p, q = p.numerator * q.denominator, p.denominator * q.numerator
+            results.append(float(mp.log(abs(q // gmpy2.gcd(p, q)))))
+        return results
+
     def gcd_slope(self, depth=20) -> mp.mpf:
         r"""
         Attempts to perform a linear fit of $\bar{q} = \frac{q_n}{gcd(p_n, q_n)}$ as a function of $n$.
@@ -507,12 +990,15 @@ class Matrix(sp.Matrix):
             The slope of the lienar fit of $\bar{q}$.
         """
         depths = list(range(1, depth))
-        q_reduced_list = []
-        limits = self.limit({n: 1}, depths, {n: 1})
-        for limit in limits:
-            p, q = limit.as_rational()
-            gcd = sp.gcd(p, q)
-            q_reduced_list.append(sp.log(abs(q // gcd).evalf(30)))
+        if self._can_call_numeric_walk({n: 1}, {n: 1}):
+            q_reduced_list = self._numeric_reduced_denominators(depths)
+        else:
+            q_reduced_list = []
+            limits = self.limit({n: 1}, depths, {n: 1})
+            for limit in limits:
+                p, q = limit.as_rational()
+                gcd = sp.gcd(p, q)
+                q_reduced_list.append(sp.log(abs(q // gcd).evalf(30)))
         fit = np.polyfit(
             np.array(depths), np.array(q_reduced_list, dtype=np.float64), 1
         )
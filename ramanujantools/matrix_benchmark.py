@@ -1,11 +1,12 @@
-from sympy.abc import n
+from sympy.abc import n, x, y
 
 from ramanujantools import Matrix
+from ramanujantools.flint_core import mpoly_ctx, FlintMatrix, FlintFractionMatrix
 
 
-def walk_benchmark(matrix, trajectory, iterations, start):
+def walk_benchmark(matrix, trajectory, iterations, start, **kwargs):
     Matrix._walk_inner.cache_clear()
-    return matrix.walk(trajectory, iterations, start)
+    return matrix.walk(trajectory, iterations, start, **kwargs)
 
 
 def test_walk_pcf_single_parameter_benchmark(benchmark):
@@ -55,6 +56,50 @@ def test_walk_5x5_polynomial_single_parameter_benchmark(benchmark):
     benchmark(walk_benchmark, matrix, {n: 1}, 1000, {n: 1})
 
 
+def test_walk_pcf_deep_benchmark(benchmark):
+    matrix = Matrix([[0, -(n**6)], [1, 34 * n**3 + 51 * n**2 + 27 * n + 5]])
+    benchmark(walk_benchmark, matrix, {n: 1}, 20000, {n: 1})
+
+
+def test_walk_pcf_deep_binary_splitting_benchmark(benchmark):
+    matrix = Matrix([[0, -(n**6)], [1, 34 * n**3 + 51 * n**2 + 27 * n + 5]])
+    benchmark(walk_benchmark, matrix, {n: 1}, 20000, {n: 1}, binary_splitting=True)
+
+
+def test_walk_5x5_companion_benchmark(benchmark):
+    matrix = Matrix.companion_form(
+        [n**3 + 1, -(n**2) * (2 * n + 1), 3 * n**3 - n + 7, n**2 - 3, 5 * n - 1]
+    )
+    benchmark(walk_benchmark, matrix, {n: 1}, 1000, {n: 1})
+
+
+def flint_mul_benchmark(cls, size):
+    matrix = Matrix(size, size, lambda i, j: (n + i) ** 2 / (x - j + 1) + i * j * x)
+    flint_matrix = cls.from_sympy(matrix, mpoly_ctx([n, x], True))
+    return flint_matrix.walk({n: 1}, 6, {n: n, x: x})
+
+
+def test_flint_mul_3x3_benchmark(benchmark):
+    matrix = flint_mul_benchmark(FlintMatrix, 3)
+    benchmark(lambda: matrix * matrix)
+
+
+def test_flint_fraction_mul_3x3_benchmark(benchmark):
+    matrix = flint_mul_benchmark(FlintFractionMatrix, 3)
+    benchmark(lambda: matrix * matrix)
+
+
+def test_flint_fraction_mul_6x6_benchmark(benchmark):
+    matrix = flint_mul_benchmark(FlintFractionMatrix, 6)
+    benchmark(lambda: matrix * matrix)
+
+
+def test_screen_10000_starts_benchmark(benchmark):
+    matrix = Matrix([[0, -(x**2) * y], [1, (2 * x + 1) * (y + 1)]])
+    starts = [{x: i, y: j} for i in range(1, 101) for j in range(1, 101)]
+    benchmark(matrix.screen, {x: 1, y: 0}, [100], starts)
+
+
 def test_as_companion_3x3_2f2_benchmark(benchmark):
     matrix = Matrix(
         [
@@ -1,9 +1,9 @@
-from pytest import approx
+from pytest import approx, raises
 
 import sympy as sp
 from sympy.abc import x, y, n
 
-from ramanujantools import Matrix, Limit, simplify
+from ramanujantools import Matrix, Limit, CheckpointStore, simplify
 from ramanujantools.cmf.known_cmfs import pFq
 
 
@@ -65,6 +65,24 @@ def test_can_call_flint_walk():
     assert m._can_call_flint_walk({x: 1, y: 1}, {x: n - 1, y: n**2})
 
 
+def test_can_call_numeric_walk():
+    m = Matrix([[x, 1], [y, 2]])
+
+    assert m._can_call_numeric_walk({x: 1, y: 1}, {x: 1, y: 1})
+    assert m._can_call_numeric_walk(
+        {x: 1, y: 1}, {x: sp.Rational(1, 2), y: sp.Rational(1, 2)}
+    )
+    assert (m / x)._can_call_numeric_walk({x: 1, y: 1}, {x: 1, y: 1})
+
+    # symbolic walks
+    assert not m._can_call_numeric_walk({x: 1, y: 1}, {x: x, y: 1})
+    assert not m._can_call_numeric_walk({x: 1}, {x: 1})
+
+    # irrational values
+    assert not m._can_call_numeric_walk({x: 1, y: 1}, {x: sp.sqrt(2), y: 1})
+    assert not (sp.pi * m)._can_call_numeric_walk({x: 1, y: 1}, {x: 1, y: 1})
+
+
 def test_subs_degenerated():
     m = Matrix([[x, 1], [y, 2]])
     assert m == m.subs({x: x})
@@ -184,6 +202,19 @@ def test_walk_1():
     assert m.walk({x: 1, y: 0}, 1, {x: x, y: y}) == m
 
 
+def test_walk_pole():
+    m = Matrix([[0, 1 / (x - 3)], [1, x]])
+    expected = Matrix.eye(2)
+    for i in range(5):
+        expected *= m({x: 1 + i})
+    assert expected.has(sp.nan)
+    # nan cells are not equal as matrices, so their cells are compared instead
+    assert list(expected) == list(m.walk({x: 1}, 5, {x: 1}))
+    shallow, deep = m.walk({x: 1}, [2, 5], {x: 1}, binary_splitting=True)
+    assert m.walk({x: 1}, 2, {x: 1}) == shallow
+    assert list(expected) == list(deep)
+
+
 def test_walk_list():
     trajectory = {x: 2, y: 3}
     start = {x: 5, y: 7}
@@ -194,6 +225,55 @@ def test_walk_list():
     ]
 
 
+def test_walk_binary_splitting():
+    trajectory = {x: 2, y: 3}
+    start = {x: 5, y: 7}
+    iterations = [0, 1, 2, 3, 17, 29, 53, 99]
+    m = Matrix([[x, 3 * x + 5 * y], [y**7 + x - 3, x**5]])
+    assert m.walk(trajectory, iterations, start) == m.walk(
+        trajectory, iterations, start, binary_splitting=True
+    )
+
+
+def test_walk_numeric_rational():
+    trajectory = {x: 1, y: sp.Rational(1, 2)}
+    start = {x: sp.Rational(1, 3), y: 2}
+    iterations = [0, 1, 5, 12]
+    m = Matrix([[x, 3 * x + 5 * y], [1 / (y + x), x**2]])
+    assert m.walk(trajectory, iterations, start) == m.walk(
+        trajectory, iterations, start, binary_splitting=True
+    )
+
+
+def test_walk_workers():
+    trajectory = {x: 2, y: 3}
+    iterations = [0, 1, 2, 3, 17, 29]
+    m = Matrix([[x, 3 * x + 5 * y], [y**7 + x - 3, x**5]])
+    for start in [{x: 5, y: 7}, {x: 5, y: y}]:
+        assert m.walk(trajectory, iterations, start) == m.walk(
+            trajectory, iterations, start, workers=3
+        )
+
+
+def test_walk_store(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    trajectory = {x: 2, y: 3}
+    m = Matrix([[x, 3 * x + 5 * y], [y**2 + x - 3, x]])
+    zero = Matrix([[0, 0], [0, 0]])
+    for start in [{x: 5, y: 7}, {x: 5, y: y}]:
+        key = store.key(m, trajectory, start)
+        expected = m.walk(trajectory, [4, 6, 9], start)
+        assert expected[0] == m.walk(trajectory, 4, start, store=store)
+        assert [4] == store.depths(key)
+        assert expected == m.walk(trajectory, [4, 6, 9], start, store=store)
+        assert [4, 9] == store.depths(key)
+        # a walk to depths in [4, 9) resumes from the checkpoint at 4
+        store.save(key, 4, zero)
+        assert [zero, zero] == m.walk(trajectory, [5, 6], start, store=store)
+    with raises(ValueError):
+        m.limit(trajectory, 4, {x: 5, y: 7}, reduce_content=True, store=store)
+
+
 def test_walk_start_single_variable():
     iterations = [1, 2, 3, 4]
     m = Matrix([[0, x**2], [1, x + 1]])
@@ -275,6 +355,87 @@ def test_limit_list():
         )
 
 
+def test_walk_projective():
+    trajectory = {x: 2, y: 3}
+    start = {x: 5, y: 7}
+    iterations = [0, 1, 17, 29]
+    m = Matrix([[x, 3 * x + 5 * y], [y**7 + x - 3, x**5]])
+    for expected, (matrix, factor) in zip(
+        m.walk(trajectory, iterations, start),
+        m.walk_projective(trajectory, iterations, start, 5),
+    ):
+        assert expected == factor * matrix
+
+
+def test_limit_reduce_content():
+    trajectory = {x: 2, y: 3}
+    start = {x: 5, y: 7}
+    m = Matrix([[x, 3 * x + 5 * y], [y**7 + x - 3, x**5]])
+    expected = m.limit(trajectory, 30, start)
+    actual = m.limit(trajectory, 30, start, reduce_content=True)
+    assert expected.as_rational() == actual.as_rational()
+    assert expected.precision() == actual.precision()
+    actual = m.limit(trajectory, 30, start, binary_splitting=True, reduce_content=True)
+    assert expected.as_rational() == actual.as_rational()
+
+
+def test_limit_precision():
+    trajectory = {x: 2, y: 3}
+    start = {x: 5, y: 7}
+    m = Matrix([[x, 3 * x + 5 * y], [y**7 + x - 3, x**5]])
+    expected = m.limit(trajectory, 30, start)
+    actual = m.limit(trajectory, 30, start, precision=50)
+    assert expected.as_float() == approx(actual.as_float(), abs=1e-45)
+    with raises(ValueError):
+        m.limit(trajectory, 30, start, reduce_content=True, precision=50)
+
+
+def test_walk_precision_symbolic():
+    m = Matrix([[x, 3 * x + 5 * y], [y**7 + x - 3, x**5]])
+    with raises(ValueError):
+        m.walk({x: 1, y: 0}, 10, {x: 1, y: y}, precision=50)
+
+
+def test_walk_vector():
+    trajectory = {x: 2, y: 3}
+    start = {x: 5, y: 7}
+    iterations = [0, 1, 2, 17]
+    m = Matrix([[x, 3 * x + 5 * y], [y**7 + x - 3, x**5]])
+    vectors = Matrix([[1, sp.Rational(1, 2)]])
+    assert [vectors * w for w in m.walk(trajectory, iterations, start)] == (
+        m.walk_vector(trajectory, iterations, start, vectors)
+    )
+
+
+def test_walk_vector_symbolic():
+    m = Matrix([[x, 3 * x + 5 * y], [y**7 + x - 3, x**5]])
+    vectors = Matrix([[1, 2]])
+    assert vectors * m.walk({x: 1, y: 0}, 3, {x: x, y: y}) == m.walk_vector(
+        {x: 1, y: 0}, 3, {x: x, y: y}, vectors
+    )
+
+
+def test_limit_vector():
+    trajectory = {n: 1}
+    start = {n: 1}
+    iterations = [10, 20]
+    m = Matrix([[0, 0, n**3], [1, 0, -(n**2)], [0, 1, 3 * n + 1 / (n + 1)]])
+    p_vectors = [Matrix([[1, 2, 3]]), Matrix([4, 5, 6])]
+    q_vectors = [Matrix([[4, 5, 6]]), Matrix([1, 2, 3])]
+    expected = m.limit(trajectory, iterations, start)
+    actual = m.limit_vector(trajectory, iterations, start)
+    for e, a in zip(expected, actual):
+        assert e.as_rational() == a.as_rational()
+        assert e.precision() == a.precision()
+        assert e.as_float() == a.as_float()
+    expected = m.limit(trajectory, 20, start)
+    expected.p_vectors = p_vectors
+    expected.q_vectors = q_vectors
+    actual = m.limit_vector(trajectory, 20, start, p_vectors, q_vectors)
+    assert expected.as_rational() == actual.as_rational()
+    assert expected.delta(1) == actual.delta(1)
+
+
 def test_charpoly():
     m = Matrix([[0, -(n**2)], [1, (3 * n + 1)]])
     assert sp.Matrix(m).charpoly() == m.charpoly(poincare=False)
@@ -368,3 +529,66 @@ def test_kamidelta_3f2():
     l1, l2 = m.limit({n: 1}, [100, 200], {n: 1})
     expected = l1.delta(l2.as_float())
     assert actual == approx(expected, abs=1e-1)  # at most 0.1 error
+
+
+def test_screen():
+    trajectory = {x: 1, y: 1}
+    starts = [{x: 1, y: 1}, {x: 5, y: 7}]
+    m = Matrix([[x, 3 * x + 5 * y], [y**2 + x - 3, x**2]])
+    limits, digits = m.screen(trajectory, [10, 20], starts)
+    assert (2, 2) == limits.shape == digits.shape
+    for i, start in enumerate(starts):
+        for j, limit in enumerate(m.limit(trajectory, [10, 20], start)):
+            p, q = limit.as_rational()
+            assert float(p / q) == approx(limits[i][j])
+    with raises(ValueError):
+        m.screen(trajectory, [10], [{x: 1, y: y}])
+
+
+def test_digest():
+    m = Matrix([[1, 1], [n**2, 1 / (n + 1)]])
+    assert m.digest() == Matrix([[1, 1], [n**2, 1 / (n + 1)]]).digest()
+    assert m.digest() != Matrix([[1, n**2], [1, 1 / (n + 1)]]).digest()
+    assert m.digest() != m.reshape(1, 4).digest()
+    assert hash(Matrix([[1, 2], [2, 1]])) != hash(Matrix([[1, 1], [2, 2]]))
+    digest = m.digest()
+    assert digest is m.digest()
+    m[0, 0] = 2
+    assert digest != m.digest()
+    assert Matrix([[2, 1], [n**2, 1 / (n + 1)]]).digest() == m.digest()
+
+
+def test_digest_in_place_modifications():
+    m = Matrix([[1, 2], [3, n]])
+    digest = m.digest()
+    m.row_swap(0, 1)
+    assert Matrix([[3, n], [1, 2]]).digest() == m.digest()
+    m.row_del(0)
+    assert Matrix([[1, 2]]).digest() == m.digest()
+    m.fill(7)
+    assert Matrix([[7, 7]]).digest() == m.digest()
+    assert digest != m.digest()
+
+
+def test_digest_stable_across_processes():
+    import os
+    import sys
+    import subprocess
+    import ramanujantools
+
+    code = "from sympy.abc import n, x; from ramanujantools import Matrix; print(Matrix([[x + n, n**2 * x], [1, x / (n + 1)]]).digest())"
+    digests = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=dict(
+                os.environ,
+                PYTHONHASHSEED=seed,
+                PYTHONPATH=os.path.dirname(os.path.dirname(ramanujantools.__file__)),
+            ),
+            check=True,
+        ).stdout.strip()
+        for seed in ["1", "2"]
+    }
+    assert {Matrix([[x + n, n**2 * x], [1, x / (n + 1)]]).digest()} == digests
@@ -0,0 +1,5 @@
+from .matrix import NumericMatrix
+from .batch import BatchMatrix
+from .modular import ModularMatrix
+
+__all__ = ["NumericMatrix", "BatchMatrix", "ModularMatrix"]
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import sympy as sp
+
+import ramanujantools as rt
+from ramanujantools import Position
+from ramanujantools.numeric_core import NumericMatrix
+
+
+def pad_coefficients(coefficients: List[List], degree: int) -> np.ndarray:
+    """
+    Converts a list of coefficient lists (from the highest degree to the free coefficient)
+    to a float64 array of shape (len(coefficients), degree + 1), padded with leading zeros.
+    """
+    result = np.zeros((len(coefficients), degree + 1), dtype=np.float64)
+    for index, polynomial in enumerate(coefficients):
+        result[index, degree + 1 - len(polynomial) :] = [float(c) for c in polynomial]
+    return result
+
+
+class BatchMatrix:
+    r"""
+    Represents a batch of equally sized matrices compiled for a lockstep numeric walk in float64 arithmetic.
+
+    Each element of the batch is a walk as in `Matrix.walk`, i.e, a matrix $M$, a trajectory and a start.
+    The cells of every element are stored as polynomials in the step index $k$,
+    as numerator and denominator coefficient arrays of shape (batch, N**2, degree + 1).
+    All elements are evaluated and multiplied together using NumPy,
+    and the products are renormalized by a power of 2 after every step to avoid overflow.
+
+    This is meant for screening many candidates quickly, before walking the promising ones exactly.
+    """
+
+    def __init__(
+        self, N: int, numerators: np.ndarray, denominators: np.ndarray
+    ) -> BatchMatrix:
+        self.N = N
+        self.numerators = numerators
+        self.denominators = denominators
+
+    def __len__(self) -> int:
+        return self.numerators.shape[0]
+
+    @staticmethod
+    def from_numeric(matrices: List[NumericMatrix]) -> BatchMatrix:
+        """
+        Stacks compiled matrices of the same size into a batch.
+        """
+        N = matrices[0].N
+        if any(matrix.N != N for matrix in matrices):
+            raise ValueError("All matrices in a batch must be of the same size")
+        degree = max(
+            len(polynomial) - 1
+            for matrix in matrices
+            for polynomial in matrix.numerators + matrix.denominators
+        )
+        numerators = np.stack(
+            [pad_coefficients(matrix.numerators, degree) for matrix in matrices]
+        )
+        denominators = np.stack(
+            [pad_coefficients(matrix.denominators, degree) for matrix in matrices]
+        )
+        return BatchMatrix(N, numerators, denominators)
+
+    @staticmethod
+    def from_sympy(
+        matrices: List[rt.Matrix], trajectories: List[Dict], starts: List[Dict]
+    ) -> BatchMatrix:
+        """
+        Compiles a batch of walks, one for every (matrix, trajectory, start) triplet.
+        """
+        return BatchMatrix.from_numeric(
+            [
+                NumericMatrix.from_sympy(matrix, trajectory, start)
+                for matrix, trajectory, start in zip(matrices, trajectories, starts)
+            ]
+        )
+
+    @staticmethod
+    def from_starts(
+        matrix: rt.Matrix, trajectory: Dict, starts: List[Dict]
+    ) -> BatchMatrix:
+        r"""
+        Compiles a batch of walks of a single matrix in a single trajectory, from many starting points.
+
+        The matrix is reduced to polynomials in the step index $k$ once, with coefficients depending on the start,
+        and the coefficients are then evaluated for all starting points at once using NumPy.
+        """
+        if not matrix.is_square():
+            raise ValueError(
+                f"BatchMatrix only supports square matrices, got a {matrix.rows}x{matrix.cols} matrix"
+            )
+        k = sp.Dummy("k")
+        trajectory = Position(trajectory)
+        symbols = sorted(trajectory.keys(), key=str)
+        placeholders = {symbol: sp.Dummy(str(symbol)) for symbol in symbols}
+        substitutions = {
+            symbol: placeholders[symbol] + k * trajectory[symbol] for symbol in symbols
+        }
+        start_values = [
+            np.array([float(start[symbol]) for start in starts], dtype=np.float64)
+            for symbol in symbols
+        ]
+
+        parts = []
+        for cell in matrix:
+            numerator, denominator = sp.fraction(sp.together(cell))
+            parts.append(
+                [
+                    sp.Poly(part.xreplace(substitutions), k).all_coeffs()
+                    for part in (numerator, denominator)
+                ]
+            )
+        degree = max(len(coefficients) - 1 for cell in parts for coefficients in cell)
+
+        def evaluate(coefficients: List[sp.Expr]) -> np.ndarray:
+            result = np.zeros((len(starts), degree + 1), dtype=np.float64)
+            function = sp.lambdify(
+                [placeholders[symbol] for symbol in symbols], coefficients, "numpy"
+            )
+            values = function(*start_values)
+            for index, value in enumerate(values):
+                result[:, degree + 1 - len(coefficients) + index] = value
+            return result
+
+        numerators = np.stack([evaluate(numerator) for numerator, _ in parts], axis=1)
+        denominators = np.stack(
+            [evaluate(denominator) for _, denominator in parts], axis=1
+        )
+        return BatchMatrix(matrix.rows, numerators, denominators)
+
+    def __call__(self, step: int) -> np.ndarray:
+        """
+        Evaluates all matrices in the batch at the `step`-th step of their walks.
+        Returns:
+            An array of shape (batch, N, N). Elements with a pole at `step` contain non-finite values.
+        """
+        numerators = np.zeros(self.numerators.shape[:2], dtype=np.float64)
+        denominators = np.zeros(self.denominators.shape[:2], dtype=np.float64)
+        for degree in range(self.numerators.shape[2]):
+            numerators = numerators * step + self.numerators[:, :, degree]
+            denominators = denominators * step + self.denominators[:, :, degree]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = numerators / denominators
+        return values.reshape(len(self), self.N, self.N)
+
+    def walk(self, iterations: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+        r"""
+        Returns the multiplication results of walking all elements of the batch in lockstep.
+
+        After every step, each product is divided by a power of 2 such that its largest element is of order 1,
+        and the exponents are accumulated separately, so the walk result is `mantissas * 2**exponents`.
+        Args:
+            iterations: The sorted amounts of multiplications to perform.
+        Returns:
+            A tuple (mantissas, exponents) of arrays of shapes (batch, len(iterations), N, N)
+            and (batch, len(iterations)) respectively.
+            Elements that hit a pole or overflow contain non-finite values from that point on.
+        """
+        checkpoints = set(iterations)
+        mantissas = []
+        exponents = []
+        values = np.broadcast_to(np.eye(self.N), (len(self), self.N, self.N)).copy()
+        scale = np.zeros(len(self), dtype=np.int64)
+        for depth in range(0, iterations[-1] + 1):
+            if depth in checkpoints:
+                mantissas.append(values)
+                exponents.append(scale)
+            if depth == iterations[-1]:
+                break
+            with np.errstate(invalid="ignore"):
+                values = values @ self(depth)
+                largest = np.max(np.abs(values), axis=(1, 2))
+            _, exponent = np.frexp(largest)
+            values = np.ldexp(values, -exponent[:, np.newaxis, np.newaxis])
+            scale = scale + exponent
+        return np.stack(mantissas, axis=1), np.stack(exponents, axis=1)
+
+    def limit(
+        self,
+        iterations: List[int],
+        p_vectors: Optional[List[rt.Matrix]] = None,
+        q_vectors: Optional[List[rt.Matrix]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        r"""
+        Returns approximations of the limits of all elements of the batch, and their convergence.
+
+        Both are defined as in `Limit`, i.e, the limit is $\frac{p}{q}$
+        with $p$ and $q$ extracted using `p_vectors` and `q_vectors`,
+        and the convergence is the amount of digits of `Limit.precision`,
+        $-\log_{10}|\frac{p_n}{q_n} - \frac{p_{n-1}}{q_{n-1}}|$.
+        Note that float64 can only show up to about 15 digits of convergence.
+        Args:
+            iterations: The sorted amounts of multiplications to perform.
+            p_vectors: The numerator extraction vectors. See `Limit`.
+            q_vectors: The denominator extraction vectors. See `Limit`.
+        Returns:
+            A tuple (limits, digits) of arrays of shape (batch, len(iterations)).
+            Digits are `inf` where the limits at the two last depths are equal,
+            and `nan` where the walk did not produce finite values.
+        """
+        if not all(depth >= 1 for depth in iterations):
+            raise ValueError(
+                f"iterations must contain only positive values, got {iterations}"
+            )
+        p_vectors = p_vectors or rt.Limit.default_p_vectors(self.N)
+        q_vectors = q_vectors or rt.Limit.default_q_vectors(self.N)
+        previous_values = [depth - 1 for depth in iterations]
+        walk_iterations = sorted(set(iterations + previous_values))
+        mantissas, _ = self.walk(walk_iterations)
+
+        def extract(vectors):
+            row, column = [
+                np.array(vector, dtype=np.float64).flatten() for vector in vectors
+            ]
+            return np.einsum("i,bdij,j->bd", row, mantissas, column)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            limits = extract(p_vectors) / extract(q_vectors)
+            current = [walk_iterations.index(depth) for depth in iterations]
+            previous = [index - 1 for index in current]
+            digits = -np.log10(np.abs(limits[:, current] - limits[:, previous]))
+        return limits[:, current], digits
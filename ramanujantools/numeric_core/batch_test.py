@@ -0,0 +1,72 @@
+from pytest import approx, raises
+
+import numpy as np
+import sympy as sp
+from sympy.abc import n, x, y
+
+from ramanujantools import Matrix
+from ramanujantools.numeric_core import NumericMatrix, BatchMatrix
+
+
+def test_from_numeric_call():
+    matrices = [
+        Matrix([[0, n**2], [1, 3 * n + 1]]),
+        Matrix([[1 / (n + 1), 2], [n**3 - 1, sp.Rational(1, 3)]]),
+    ]
+    batch = BatchMatrix.from_numeric(
+        [NumericMatrix.from_sympy(matrix, {n: 2}, {n: 1}) for matrix in matrices]
+    )
+    assert 2 == len(batch)
+    for step in range(5):
+        expected = [
+            np.array(matrix.subs({n: 1 + 2 * step}), dtype=np.float64)
+            for matrix in matrices
+        ]
+        assert np.allclose(expected, batch(step))
+
+
+def test_from_starts():
+    m = Matrix([[x, 3 * x + 5 * y], [y**2 + x - 3, x / (y + 1)]])
+    trajectory = {x: 2, y: 1}
+    starts = [{x: 1, y: 2}, {x: sp.Rational(1, 2), y: 7}]
+    expected = BatchMatrix.from_sympy([m, m], [trajectory, trajectory], starts)
+    actual = BatchMatrix.from_starts(m, trajectory, starts)
+    for step in range(5):
+        assert np.allclose(expected(step), actual(step))
+
+
+def test_walk():
+    m = Matrix([[0, -(n**2)], [1, 2 * n + 1]])
+    iterations = [1, 10, 100]
+    mantissas, exponents = BatchMatrix.from_starts(m, {n: 1}, [{n: 1}]).walk(iterations)
+    for index, expected in enumerate(m.walk({n: 1}, iterations, {n: 1})):
+        actual = np.ldexp(mantissas[0, index], exponents[0, index])
+        assert np.allclose(np.array(expected, dtype=np.float64), actual)
+        assert np.max(np.abs(mantissas[0, index])) < 1
+
+
+def test_limit():
+    m = Matrix([[x, 3 * x + 5 * y], [y**2 + x - 3, x**2]])
+    trajectory = {x: 1, y: 1}
+    starts = [{x: 1, y: 1}, {x: 3, y: 2}, {x: 5, y: 7}]
+    iterations = [3, 5]
+    limits, digits = BatchMatrix.from_starts(m, trajectory, starts).limit(iterations)
+    assert (3, 2) == limits.shape
+    for i, start in enumerate(starts):
+        for j, limit in enumerate(m.limit(trajectory, iterations, start)):
+            p, q = limit.as_rational()
+            assert float(p / q) == approx(limits[i][j])
+            assert limit.precision() == np.floor(digits[i][j])
+
+
+def test_limit_pole():
+    m = Matrix([[0, 1], [1, 1 / (n - 3)]])
+    limits, digits = BatchMatrix.from_starts(m, {n: 1}, [{n: 1}, {n: 5}]).limit([10])
+    assert np.isnan(limits[0][0])
+    assert np.isfinite(limits[1][0])
+
+
+def test_limit_nonpositive_iterations():
+    m = Matrix([[0, 1], [1, n]])
+    with raises(ValueError):
+        BatchMatrix.from_starts(m, {n: 1}, [{n: 1}]).limit([0, 10])
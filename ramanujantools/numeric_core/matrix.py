@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import math
+import gmpy2
+import mpmath as mp
+import sympy as sp
+from gmpy2 import mpz
+
+import ramanujantools as rt
+from ramanujantools import Position
+from ramanujantools.caching import cached
+from ramanujantools.parallel import segments, segment_products
+
+GUARD_DIGITS = 10
+"""Extra digits used in fixed precision walks, on top of the requested precision."""
+
+
+def horner(coefficients: List[mpz], value: int) -> mpz:
+    """
+    Evaluates a polynomial at `value` using Horner's rule.
+    Args:
+        coefficients: The polynomial coefficients, from the highest degree to the free coefficient.
+        value: The point of evaluation
+    """
+    result = mpz(0)
+    for coefficient in coefficients:
+        result = result * value + coefficient
+    return result
+
+
+def multiply(left: List[mpz], right: List[mpz], N: int) -> List[mpz]:
+    """
+    Multiplies a kxN matrix by an NxN matrix, both given as flat lists in row-major order.
+    """
+    right_cols = [right[col::N] for col in range(N)]
+    result = []
+    for row in range(len(left) // N):
+        left_row = left[row * N : (row + 1) * N]
+        for right_col in right_cols:
+            result.append(sum(a * b for a, b in zip(left_row, right_col)))
+    return result
+
+
+def identity(N: int) -> List[mpz]:
+    """
+    Returns the NxN identity matrix as a flat list.
+    """
+    return [mpz(1) if row == col else mpz(0) for row in range(N) for col in range(N)]
+
+
+class NumericMatrix:
+    r"""
+    Represents a Matrix compiled for a numeric walk.
+
+    Every cell of the original matrix is reduced to a rational function of the step index $k$,
+    where the $k$-th step of the walk is evaluated at `start + k * trajectory`.
+    Numerators and denominators are stored as integer coefficient lists and evaluated using Horner's rule,
+    and the products are calculated over flat lists of gmpy2 integers, without any sympy objects involved.
+    """
+
+    def __init__(
+        self, N: int, numerators: List[List[mpz]], denominators: List[List[mpz]]
+    ) -> NumericMatrix:
+        self.N = N
+        self.numerators = numerators
+        self.denominators = denominators
+        self.is_polynomial = all(
+            denominator == [1] for denominator in self.denominators
+        )
+        self.is_companion = self._is_companion()
+
+    def _is_companion(self) -> bool:
+        """
+        Returns true iff the compiled matrix is a companion matrix (see `Matrix.companion_form`).
+        """
+        for row in range(self.N):
+            for col in range(self.N - 1):
+                index = row * self.N + col
+                expected = [1] if row == col + 1 else [0]
+                if self.numerators[index] != expected:
+                    return False
+                if self.denominators[index] != [1]:
+                    return False
+        return True
+
+    @staticmethod
+    @cached("NumericMatrix.is_compilable", max_entries=4096)
+    def is_compilable(matrix: rt.Matrix) -> bool:
+        """
+        Returns true iff all cells of `matrix` are rational functions with rational coefficients.
+        Cached, as it is checked on every numeric walk.
+        """
+        symbols = list(matrix.free_symbols) + [sp.Dummy("k")]
+        for cell in matrix:
+            if cell.has(sp.Float):
+                return False
+            try:
+                for part in sp.fraction(sp.together(cell)):
+                    sp.Poly(part, *symbols, domain=sp.QQ)
+            except sp.polys.polyerrors.BasePolynomialError:
+                return False
+        return True
+
+    @staticmethod
+    def from_sympy(matrix: rt.Matrix, trajectory: Dict, start: Dict) -> NumericMatrix:
+        """
+        Compiles a Matrix for a walk in `trajectory` from `start`.
+        Args:
+            matrix: The matrix as ramanujantools.Matrix
+            trajectory: The trajectory of a single step in the walk. Must be rational.
+            start: The starting point of the walk. Must be rational.
+        """
+        if not matrix.is_square():
+            raise ValueError(
+                f"NumericMatrix only supports square matrices, got a {matrix.rows}x{matrix.cols} matrix"
+            )
+        k = sp.Dummy("k")
+        start = Position(start)
+        trajectory = Position(trajectory)
+        substitutions = {
+            symbol: start[symbol] + k * trajectory[symbol] for symbol in start
+        }
+        numerators = []
+        denominators = []
+        for cell in matrix:
+            numerator, denominator = [
+                sp.Poly(part.xreplace(substitutions), k, domain=sp.QQ)
+                for part in sp.fraction(sp.together(cell))
+            ]
+            coefficients = numerator.all_coeffs() + denominator.all_coeffs()
+            lcm = math.lcm(*[int(c.denominator) for c in coefficients])
+            numerators.append([mpz(int(c * lcm)) for c in numerator.all_coeffs()])
+            denominators.append([mpz(int(c * lcm)) for c in denominator.all_coeffs()])
+        return NumericMatrix(matrix.rows, numerators, denominators)
+
+    def __call__(self, step: int) -> Tuple[List[mpz], mpz]:
+        """
+        Evaluates the matrix at the `step`-th step of the walk.
+        Returns:
+            A tuple (values, denominator) such that the evaluated matrix is `values / denominator`.
+        Raises:
+            ZeroDivisionError: if the matrix has a pole at the requested step.
+        """
+        return self._evaluate(step, range(self.N**2))
+
+    def _evaluate(self, step: int, indices: Iterable[int]) -> Tuple[List[mpz], mpz]:
+        """
+        Evaluates the requested cells (as flat indices) at the `step`-th step of the walk.
+        """
+        values = [horner(self.numerators[index], step) for index in indices]
+        if self.is_polynomial:
+            return values, mpz(1)
+        denominators = [horner(self.denominators[index], step) for index in indices]
+        if 0 in denominators:
+            raise ZeroDivisionError(f"Matrix has a pole at step {step} of the walk")
+        lcm = math.lcm(*denominators)
+        values = [value * (lcm // d) for value, d in zip(values, denominators)]
+        return values, lcm
+
+    def companion_multiply(self, values: List[mpz], step: int) -> Tuple[List[mpz], mpz]:
+        r"""
+        Multiplies `values` (a kxN matrix) by the companion matrix $M(step)$ from the right.
+
+        Each row of the product is the window of the last N values of a scalar recurrence,
+        so a step only shifts the window and calculates a single dot product with the last column of $M$.
+        This costs $O(N^2)$ multiplications instead of $O(N^3)$.
+        Returns:
+            A tuple (values, denominator) such that the product is `values / denominator`.
+        """
+        N = self.N
+        column, denominator = self._evaluate(step, range(N - 1, N**2, N))
+        result = []
+        for row in range(len(values) // N):
+            window = values[row * N : (row + 1) * N]
+            if denominator == 1:
+                result += window[1:]
+            else:
+                result += [value * denominator for value in window[1:]]
+            result.append(sum(a * b for a, b in zip(window, column)))
+        return result, denominator
+
+    def to_sympy(self, values: List[mpz], denominator: mpz) -> rt.Matrix:
+        """
+        Converts an evaluated product back to a Matrix.
+        """
+        rows = len(values) // self.N
+        if denominator == 1:
+            return rt.Matrix(rows, self.N, [int(value) for value in values])
+        return rt.Matrix(
+            rows,
+            self.N,
+            [sp.Rational(int(value), int(denominator)) for value in values],
+        )
+
+    def product(self, begin: int, end: int) -> Tuple[List[mpz], mpz]:
+        r"""
+        Returns $\prod_{k=begin}^{end-1}M(k)$, calculated using binary splitting.
+
+        The range is split in half recursively and the halves are multiplied in a balanced tree,
+        so big operands are multiplied by operands of similar size and benefit from GMP's fast multiplication.
+        Returns:
+            A tuple (values, denominator) such that the product is `values / denominator`.
+        """
+        if end - begin <= 0:
+            return identity(self.N), mpz(1)
+        if end - begin == 1:
+            return self(begin)
+        middle = (begin + end) // 2
+        left_values, left_denominator = self.product(begin, middle)
+        right_values, right_denominator = self.product(middle, end)
+        return (
+            multiply(left_values, right_values, self.N),
+            left_denominator * right_denominator,
+        )
+
+    def flatten(self, initial: rt.Matrix) -> Tuple[List[mpz], mpz]:
+        """
+        Converts a rational kxN matrix to a tuple (values, denominator) such that `initial = values / denominator`.
+        """
+        if initial.cols != self.N:
+            raise ValueError(
+                f"Expected a matrix with {self.N} columns, got {initial.rows}x{initial.cols}"
+            )
+        cells = [sp.Rational(cell) for cell in initial]
+        denominator = math.lcm(*[int(cell.denominator) for cell in cells])
+        return [mpz(int(cell * denominator)) for cell in cells], mpz(denominator)
+
+    def _walk(
+        self,
+        iterations: List[int],
+        binary_splitting: bool,
+        initial: Optional[rt.Matrix],
+        period: Optional[int],
+        workers: int = 1,
+    ) -> List[Tuple[List[mpz], mpz, mpz]]:
+        """
+        Internal walk logic. Do not use directly.
+
+        Returns a tuple (values, content, denominator) for each depth, such that the product is
+        `values * content / denominator`.
+        If `period` is not None, the content of `values` is divided out every `period` steps and at every depth.
+        """
+        results = []
+        content = mpz(1)
+        if initial is None:
+            values, denominator = identity(self.N), mpz(1)
+        else:
+            values, denominator = self.flatten(initial)
+
+        def reduce_content():
+            nonlocal values, content
+            gcd = gmpy2.gcd(*values)
+            if gcd > 1:
+                values = [value // gcd for value in values]
+                content *= gcd
+
+        if binary_splitting or workers > 1:
+            checkpoints = set(iterations)
+            if 0 in checkpoints:
+                results.append((values, content, denominator))
+            walk_segments = segments(iterations, workers)
+            products = segment_products(self.product, walk_segments, workers)
+            for (_, depth), (segment_values, segment_denominator) in zip(
+                walk_segments, products
+            ):
+                values = multiply(values, segment_values, self.N)
+                denominator *= segment_denominator
+                if depth in checkpoints:
+                    if period is not None:
+                        reduce_content()
+                    results.append((values, content, denominator))
+            return results
+
+        checkpoints = set(iterations)
+        for depth in range(0, iterations[-1] + 1):
+            if period is not None and (depth in checkpoints or depth % period == 0):
+                reduce_content()
+            if depth in checkpoints:
+                results.append((values, content, denominator))
+            if depth == iterations[-1]:
+                break
+            if self.is_companion:
+                values, step_denominator = self.companion_multiply(values, depth)
+            else:
+                step_values, step_denominator = self(depth)
+                values = multiply(values, step_values, self.N)
+            denominator *= step_denominator
+        return results
+
+    def walk(
+        self,
+        iterations: List[int],
+        binary_splitting: bool = False,
+        initial: Optional[rt.Matrix] = None,
+        workers: int = 1,
+    ) -> List[rt.Matrix]:
+        r"""
+        Returns the multiplication result of walking along the compiled trajectory.
+
+        The walk operation is defined as $\prod_{k=0}^{n-1}M(k)$, where `n=iterations`.
+        Args:
+            iterations: The sorted amounts of multiplications to perform.
+            binary_splitting: if True, the product between every two consecutive depths
+                is calculated using binary splitting (see `product`). False by default.
+            initial: if given, a rational kxN matrix $V$ to multiply by from the left,
+                i.e, returns $V \cdot \prod_{k=0}^{n-1}M(k)$.
+                Only k rows are carried through the walk, which costs $O(kN^2)$ per step instead of $O(N^3)$.
+            workers: if larger than 1, the walk is cut into contiguous segments (see `parallel.segments`),
+                whose products are calculated using binary splitting in a pool of `workers` processes.
+        Returns:
+            A list of matrices, one for each value in `iterations`.
+        """
+        return [
+            self.to_sympy(values, denominator)
+            for values, _, denominator in self._walk(
+                iterations, binary_splitting, initial, None, workers
+            )
+        ]
+
+    def walk_projective(
+        self,
+        iterations: List[int],
+        period: int = 256,
+        binary_splitting: bool = False,
+    ) -> List[Tuple[rt.Matrix, sp.Rational]]:
+        r"""
+        Same as `walk`, but divides the integer content out of the accumulated product along the way.
+
+        Since limits are projective, the removed content is irrelevant for the limit itself,
+        but it makes the integers in every following multiplication smaller.
+        Args:
+            iterations: The sorted amounts of multiplications to perform.
+            period: The amount of steps between two content reductions.
+                The content is also reduced at every requested depth.
+                When `binary_splitting` is True, the content is only reduced at the requested depths.
+            binary_splitting: see `walk`.
+        Returns:
+            A list of tuples (matrix, factor), one for each value in `iterations`,
+            where `matrix` is an integer matrix with no content, and `factor * matrix` is the walk result.
+        """
+        return [
+            (
+                self.to_sympy(values, mpz(1)),
+                sp.Rational(int(content), int(denominator)),
+            )
+            for values, content, denominator in self._walk(
+                iterations, binary_splitting, None, period
+            )
+        ]
+
+    def walk_mp(self, iterations: List[int], precision: int) -> List[rt.Matrix]:
+        r"""
+        Same as `walk`, but multiplies the matrices as mpmath floating point numbers of fixed precision.
+
+        The working precision is `precision` digits,
+        plus guard digits that compensate for the rounding errors accumulated along the walk.
+        After every step, the product is renormalized by a power of 2 such that its largest element is of order 1,
+        and the scale is restored in the returned matrices.
+        Args:
+            iterations: The sorted amounts of multiplications to perform.
+            precision: The amount of decimal digits in the returned matrices.
+        Returns:
+            A list of matrices of sympy Floats, one for each value in `iterations`.
+        """
+        ctx = mp.mp.clone()
+        ctx.dps = precision + GUARD_DIGITS + len(str(iterations[-1]))
+        checkpoints = set(iterations)
+        results = []
+        values = [ctx.mpf(value) for value in identity(self.N)]
+        scale = 0
+        for depth in range(0, iterations[-1] + 1):
+            if depth in checkpoints:
+                cells = [
+                    sp.Float(ctx.ldexp(value, scale), precision) for value in values
+                ]
+                results.append(rt.Matrix(self.N, self.N, cells))
+            if depth == iterations[-1]:
+                break
+            if self.is_companion:
+                values, step_denominator = self.companion_multiply(values, depth)
+            else:
+                step_values, step_denominator = self(depth)
+                values = multiply(values, step_values, self.N)
+            exponent = max(ctx.mag(value) for value in values)
+            if exponent == ctx.ninf:  # the product is zero, nothing to renormalize
+                continue
+            exponent -= ctx.mag(step_denominator)
+            values = [
+                ctx.ldexp(value, -exponent) / step_denominator for value in values
+            ]
+            scale += exponent
+        return results
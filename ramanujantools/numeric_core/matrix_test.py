@@ -0,0 +1,136 @@
+from pytest import raises
+
+import sympy as sp
+from sympy.abc import n, x, y
+
+from ramanujantools import Matrix
+from ramanujantools.numeric_core import NumericMatrix
+
+
+def naive_walk(matrix: Matrix, trajectory, iterations, start) -> Matrix:
+    result = Matrix.eye(matrix.rows)
+    for i in range(iterations):
+        result *= matrix.subs({key: start[key] + i * trajectory[key] for key in start})
+    return result
+
+
+def test_is_compilable():
+    assert NumericMatrix.is_compilable(Matrix([[0, n**2], [1, 1 / (n + 1)]]))
+    assert NumericMatrix.is_compilable(Matrix([[0, x / 2], [1, y]]))
+    assert not NumericMatrix.is_compilable(Matrix([[0, sp.sqrt(2) * n], [1, n]]))
+    assert not NumericMatrix.is_compilable(Matrix([[0, sp.exp(n)], [1, n]]))
+    assert not NumericMatrix.is_compilable(Matrix([[0, 1.5 * n], [1, n]]))
+    hits = NumericMatrix.is_compilable.cache_info().hits
+    assert NumericMatrix.is_compilable(Matrix([[0, x / 2], [1, y]]))
+    assert hits + 1 == NumericMatrix.is_compilable.cache_info().hits
+
+
+def test_call():
+    matrix = Matrix([[0, -(n**2)], [1, 3 * n + 1]])
+    numeric = NumericMatrix.from_sympy(matrix, {n: 2}, {n: 1})
+    values, denominator = numeric(3)
+    assert matrix({n: 7}) == numeric.to_sympy(values, denominator)
+
+
+def test_call_rational():
+    matrix = Matrix([[1 / (n + 1), n / 3], [1, 1 / (2 * n)]])
+    numeric = NumericMatrix.from_sympy(matrix, {n: 1}, {n: sp.Rational(1, 2)})
+    values, denominator = numeric(2)
+    assert matrix({n: sp.Rational(5, 2)}) == numeric.to_sympy(values, denominator)
+
+
+def test_walk():
+    matrix = Matrix(
+        [
+            [1, n**2 + n, n**2 - n + 5],
+            [3 * n + 9, n**2 - 1, 1 / (n + 1)],
+            [n**2 + 7, n - 2, (n + 1) * (n - 3)],
+        ],
+    )
+    iterations = [0, 1, 5, 17]
+    numeric = NumericMatrix.from_sympy(matrix, {n: 1}, {n: 1})
+    assert [
+        naive_walk(matrix, {n: 1}, depth, {n: 1}) for depth in iterations
+    ] == numeric.walk(iterations)
+
+
+def test_walk_multi_variable():
+    matrix = Matrix([[x, 3 * x + 5 * y], [y**7 + x - 3, x**5]])
+    trajectory = {x: 2, y: -3}
+    start = {x: sp.Rational(1, 3), y: 7}
+    numeric = NumericMatrix.from_sympy(matrix, trajectory, start)
+    assert naive_walk(matrix, trajectory, 9, start) == numeric.walk([9])[0]
+
+
+def test_walk_pole():
+    matrix = Matrix([[0, 1 / (n - 3)], [1, n]])
+    numeric = NumericMatrix.from_sympy(matrix, {n: 1}, {n: 1})
+    with raises(ZeroDivisionError):
+        numeric.walk([5])
+
+
+def test_product():
+    matrix = Matrix([[0, -(n**2)], [1, 3 * n + 1 / (n + 1)]])
+    numeric = NumericMatrix.from_sympy(matrix, {n: 1}, {n: 1})
+    values, denominator = numeric.product(3, 17)
+    assert naive_walk(matrix, {n: 1}, 14, {n: 4}) == numeric.to_sympy(
+        values, denominator
+    )
+
+
+def test_walk_binary_splitting():
+    matrix = Matrix([[0, -(n**2)], [1, 3 * n + 1 / (n + 1)]])
+    iterations = [0, 1, 2, 7, 30, 31]
+    numeric = NumericMatrix.from_sympy(matrix, {n: 1}, {n: 1})
+    assert numeric.walk(iterations) == numeric.walk(iterations, binary_splitting=True)
+
+
+def test_is_companion():
+    companion = Matrix.companion_form([n**2, 1 / (n + 1), 3 * n - 1])
+    assert NumericMatrix.from_sympy(companion, {n: 1}, {n: 1}).is_companion
+    not_companion = Matrix([[0, 0, n**2], [1, 1, n], [0, 1, 3 * n - 1]])
+    assert not NumericMatrix.from_sympy(not_companion, {n: 1}, {n: 1}).is_companion
+
+
+def test_walk_companion():
+    matrix = Matrix.companion_form([n**2, 1 / (n + 1), 3 * n - 1, -(n**3)])
+    iterations = [0, 1, 2, 11]
+    assert [
+        naive_walk(matrix, {n: 1}, depth, {n: 1}) for depth in iterations
+    ] == NumericMatrix.from_sympy(matrix, {n: 1}, {n: 1}).walk(iterations)
+
+
+def test_walk_initial():
+    matrix = Matrix.companion_form([n**2, 1 / (n + 1), 3 * n - 1])
+    initial = Matrix([[1, sp.Rational(2, 3), 0], [0, 0, 5]])
+    iterations = [0, 1, 13]
+    numeric = NumericMatrix.from_sympy(matrix, {n: 1}, {n: 1})
+    expected = [initial * m for m in numeric.walk(iterations)]
+    assert expected == numeric.walk(iterations, initial=initial)
+    assert expected == numeric.walk(iterations, binary_splitting=True, initial=initial)
+
+
+def test_walk_projective():
+    matrix = Matrix([[2 * n * (n + 1), -n * (4 * n + 3)], [-(n + 1) * (4 * n + 1), 7]])
+    iterations = [0, 1, 5, 40]
+    numeric = NumericMatrix.from_sympy(matrix, {n: 1}, {n: 1})
+    expected = numeric.walk(iterations)
+    for binary_splitting in [False, True]:
+        actual = numeric.walk_projective(
+            iterations, period=4, binary_splitting=binary_splitting
+        )
+        for e, (m, factor) in zip(expected, actual):
+            assert e == factor * m
+            assert 1 == sp.gcd(list(m))
+
+
+def test_walk_mp():
+    matrix = Matrix.companion_form([n**2, 1 / (n + 1), 3 * n - 1])
+    iterations = [0, 1, 50, 200]
+    numeric = NumericMatrix.from_sympy(matrix, {n: 1}, {n: 1})
+    for expected, actual in zip(
+        numeric.walk(iterations), numeric.walk_mp(iterations, 30)
+    ):
+        for e, a in zip(expected, actual):
+            assert a.is_Float
+            assert abs(e - a) <= abs(e) * sp.Rational(1, 10**29)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import math
+import gmpy2
+import numpy as np
+from gmpy2 import mpz
+
+import ramanujantools as rt
+from ramanujantools.numeric_core import NumericMatrix
+from ramanujantools.numeric_core.matrix import horner
+
+PRIME_BITS = 30
+"""Bit size of the primes used in modular walks, such that a product of two residues fits in an int64."""
+
+
+def primes(count: int, bits: int = PRIME_BITS) -> List[int]:
+    """
+    Returns the `count` largest primes below `2**bits`, in descending order.
+    """
+    result = []
+    prime = mpz(2) ** bits
+    for _ in range(count):
+        prime = gmpy2.prev_prime(prime)
+        result.append(int(prime))
+    return result
+
+
+def crt(residues: np.ndarray, moduli: List[int]) -> List[mpz]:
+    r"""
+    Reconstructs integers from their residues using the Chinese remainder theorem.
+    Args:
+        residues: An array of shape (len(moduli), k), where `residues[i][j]` is the j-th integer modulo `moduli[i]`.
+        moduli: Pairwise coprime moduli.
+    Returns:
+        A list of k integers, each in the symmetric range $(-\frac{M}{2}, \frac{M}{2}]$,
+        where $M$ is the product of all moduli.
+    """
+    modulus = math.prod(mpz(p) for p in moduli)
+    coefficients = []
+    for p in moduli:
+        cofactor = modulus // p
+        coefficients.append(cofactor * gmpy2.invert(cofactor % p, p))
+    results = []
+    for column in residues.T:
+        value = sum(c * int(r) for c, r in zip(coefficients, column)) % modulus
+        results.append(value - modulus if 2 * value > modulus else value)
+    return results
+
+
+class ModularMatrix:
+    r"""
+    Represents a NumericMatrix walked modulo many word sized primes at once.
+
+    The walk keeps the same representation as `NumericMatrix.walk`, i.e, an integer matrix and a common denominator,
+    but only their residues are calculated, as int64 NumPy arrays with a leading axis for the primes.
+    Exact values can be reconstructed using the Chinese remainder theorem when enough primes are used,
+    and divisibility questions can be answered for the primes themselves without reconstructing anything.
+    """
+
+    def __init__(self, numeric: NumericMatrix, moduli: List[int]) -> ModularMatrix:
+        self.numeric = numeric
+        self.N = numeric.N
+        self.moduli = moduli
+        self.primes = np.array(moduli, dtype=np.int64)
+        self.numerators = self._residues(numeric.numerators)
+
+    def _residues(self, polynomials: List[List[mpz]]) -> np.ndarray:
+        """
+        Returns the coefficients of `polynomials` modulo every prime,
+        as an array of shape (primes, len(polynomials), degree + 1), padded with leading zeros.
+        """
+        degree = max(len(polynomial) - 1 for polynomial in polynomials)
+        result = np.zeros((len(self.moduli), len(polynomials), degree + 1), np.int64)
+        for i, p in enumerate(self.moduli):
+            for j, polynomial in enumerate(polynomials):
+                offset = degree + 1 - len(polynomial)
+                result[i, j, offset:] = [int(c % p) for c in polynomial]
+        return result
+
+    @staticmethod
+    def from_sympy(
+        matrix: rt.Matrix, trajectory: Dict, start: Dict, moduli: List[int]
+    ) -> ModularMatrix:
+        """
+        Compiles a Matrix for a modular walk in `trajectory` from `start`. See `NumericMatrix.from_sympy`.
+        """
+        return ModularMatrix(
+            NumericMatrix.from_sympy(matrix, trajectory, start), moduli
+        )
+
+    @staticmethod
+    def bits(numeric: NumericMatrix, depth: int) -> int:
+        r"""
+        Returns an upper bound for the bit size of all integers (numerators and denominator)
+        in the walk of `numeric` up to `depth`.
+
+        Uses $\|AB\|_{max} \le N \cdot \|A\|_{max} \cdot \|B\|_{max}$ for every step.
+        """
+        bits = 0
+        for step in range(depth):
+            values, denominator = numeric(step)
+            largest = max(max(abs(value) for value in values), denominator)
+            bits += int(largest).bit_length() + numeric.N.bit_length()
+        return bits
+
+    @staticmethod
+    def required_primes(numeric: NumericMatrix, depth: int) -> int:
+        """
+        Returns the amount of primes required to reconstruct the walk of `numeric` up to `depth` (see `bits`).
+        """
+        return (ModularMatrix.bits(numeric, depth) + 1) // (PRIME_BITS - 1) + 1
+
+    def __call__(self, step: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluates the matrix at the `step`-th step of the walk modulo every prime.
+        Returns:
+            A tuple (values, denominator) of arrays of shapes (primes, N, N) and (primes,),
+            which are the residues of the result of `NumericMatrix.__call__`.
+        """
+        k = step % self.primes
+        values = np.zeros(self.numerators.shape[:2], dtype=np.int64)
+        for degree in range(self.numerators.shape[2]):
+            values = (values * k[:, np.newaxis] + self.numerators[:, :, degree]) % (
+                self.primes[:, np.newaxis]
+            )
+        if self.numeric.is_polynomial:
+            denominator = np.ones(len(self.moduli), dtype=np.int64)
+        else:
+            denominators = [int(horner(d, step)) for d in self.numeric.denominators]
+            if 0 in denominators:
+                raise ZeroDivisionError(f"Matrix has a pole at step {step} of the walk")
+            lcm = math.lcm(*denominators)
+            multipliers = np.array(
+                [[(lcm // d) % p for d in denominators] for p in self.moduli],
+                dtype=np.int64,
+            )
+            values = (values * multipliers) % self.primes[:, np.newaxis]
+            denominator = np.array([lcm % p for p in self.moduli], dtype=np.int64)
+        return values.reshape(len(self.moduli), self.N, self.N), denominator
+
+    def multiply(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """
+        Multiplies two stacks of matrices modulo every prime.
+        The sum is reduced after every term, so no intermediate value overflows an int64.
+        """
+        primes = self.primes[:, np.newaxis, np.newaxis]
+        result = np.zeros(left.shape[:2] + right.shape[2:], dtype=np.int64)
+        for index in range(left.shape[2]):
+            product = left[:, :, index, np.newaxis] * right[:, np.newaxis, index, :]
+            result = (result + product) % primes
+        return result
+
+    def walk(self, iterations: List[int]) -> List[Tuple[np.ndarray, np.ndarray]]:
+        r"""
+        Returns the residues of the walk operation $\prod_{k=0}^{n-1}M(k)$ for every `n` in `iterations`.
+        Args:
+            iterations: The sorted amounts of multiplications to perform.
+        Returns:
+            A list of tuples (values, denominator), one for each value in `iterations`,
+            of arrays of shapes (primes, N, N) and (primes,),
+            such that the walk result is `values / denominator` modulo every prime.
+        """
+        checkpoints = set(iterations)
+        results = []
+        values = np.broadcast_to(
+            np.eye(self.N, dtype=np.int64), (len(self.moduli), self.N, self.N)
+        ).copy()
+        denominator = np.ones(len(self.moduli), dtype=np.int64)
+        for depth in range(0, iterations[-1] + 1):
+            if depth in checkpoints:
+                results.append((values, denominator))
+            if depth == iterations[-1]:
+                break
+            step_values, step_denominator = self(depth)
+            values = self.multiply(values, step_values)
+            denominator = (denominator * step_denominator) % self.primes
+        return results
+
+    def divisors(self, values: np.ndarray) -> List[int]:
+        """
+        Returns the primes that divide all entries of `values`, i.e, the primes that divide their content.
+        Args:
+            values: An array of residues with a leading axis for the primes, as returned by `walk`.
+        """
+        zero = np.all(values.reshape(len(self.moduli), -1) == 0, axis=1)
+        return [p for p, is_zero in zip(self.moduli, zero) if is_zero]
+
+    def reconstruct(self, values: np.ndarray) -> List[mpz]:
+        """
+        Reconstructs the exact integers from their residues, as returned by `walk`.
+
+        The result is only correct if the product of all primes is larger than twice the absolute value
+        of every integer (see `required_primes`).
+        Returns:
+            A flat list of integers, in row-major order for matrices.
+        """
+        return crt(values.reshape(len(self.moduli), -1), self.moduli)
+
+    def to_sympy(self, values: np.ndarray, denominator: np.ndarray) -> rt.Matrix:
+        """
+        Reconstructs the walk matrix from its residues, as returned by `walk`. See `reconstruct`.
+        """
+        (denominator,) = self.reconstruct(denominator)
+        return self.numeric.to_sympy(self.reconstruct(values), denominator)
@@ -0,0 +1,78 @@
+from pytest import raises
+
+import math
+import numpy as np
+import sympy as sp
+from sympy.abc import n
+
+from ramanujantools import Matrix
+from ramanujantools.numeric_core import NumericMatrix, ModularMatrix
+from ramanujantools.numeric_core.modular import crt, primes
+
+
+def test_primes():
+    moduli = primes(5)
+    assert 5 == len(set(moduli))
+    assert all(sp.isprime(p) and p < 2**30 for p in moduli)
+    assert moduli == sorted(moduli, reverse=True)
+
+
+def test_crt():
+    moduli = primes(4)
+    values = [0, 1, -1, 17 * 2**90 + 3, -(5**50)]
+    residues = np.array([[value % p for value in values] for p in moduli])
+    assert values == crt(residues, moduli)
+
+
+def test_call():
+    matrix = Matrix([[1 / (n + 1), n**2 - 7], [sp.Rational(1, 3), 3 * n / (n + 2)]])
+    numeric = NumericMatrix.from_sympy(matrix, {n: 2}, {n: 1})
+    moduli = primes(3)
+    modular = ModularMatrix(numeric, moduli)
+    for step in range(5):
+        expected_values, expected_denominator = numeric(step)
+        values, denominator = modular(step)
+        for index, p in enumerate(moduli):
+            assert [v % p for v in expected_values] == list(values[index].flatten())
+            assert expected_denominator % p == denominator[index]
+
+
+def test_walk():
+    matrix = Matrix([[0, -(n**6)], [1, 34 * n**3 + 51 * n**2 + 27 * n + 5]])
+    iterations = [0, 1, 10, 100]
+    numeric = NumericMatrix.from_sympy(matrix, {n: 1}, {n: 1})
+    count = ModularMatrix.required_primes(numeric, iterations[-1])
+    modular = ModularMatrix.from_sympy(matrix, {n: 1}, {n: 1}, primes(count))
+    assert numeric.walk(iterations) == [
+        modular.to_sympy(values, denominator)
+        for values, denominator in modular.walk(iterations)
+    ]
+
+
+def test_walk_rational():
+    matrix = Matrix([[1 / (n + 1), n**2], [1, 3 * n / (n + 2)]])
+    iterations = [1, 7, 30]
+    numeric = NumericMatrix.from_sympy(matrix, {n: 1}, {n: 1})
+    count = ModularMatrix.required_primes(numeric, iterations[-1])
+    modular = ModularMatrix(numeric, primes(count))
+    assert numeric.walk(iterations) == [
+        modular.to_sympy(values, denominator)
+        for values, denominator in modular.walk(iterations)
+    ]
+
+
+def test_walk_pole():
+    matrix = Matrix([[0, 1], [1, 1 / (n - 3)]])
+    modular = ModularMatrix.from_sympy(matrix, {n: 1}, {n: 1}, primes(2))
+    with raises(ZeroDivisionError):
+        modular.walk([5])
+
+
+def test_divisors():
+    matrix = Matrix([[0, -(n**2)], [1, 2 * n + 1]])
+    depth = 20
+    moduli = [2, 3, 5, 7, 11, 13, 17, 19, 23] + primes(2)
+    modular = ModularMatrix.from_sympy(matrix, {n: 1}, {n: 1}, moduli)
+    values, _ = modular.walk([depth])[0]
+    content = math.gcd(*[int(cell) for cell in matrix.walk({n: 1}, depth, {n: 1})])
+    assert [p for p in moduli if content % p == 0] == modular.divisors(values)
@@ -0,0 +1,35 @@
+from typing import Callable, List, Tuple
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+
+def segments(iterations: List[int], workers: int) -> List[Tuple[int, int]]:
+    """
+    Splits the walk range `[0, iterations[-1])` into contiguous segments `[begin, end)`.
+
+    Every depth in `iterations` is a segment boundary, such that intermediate results can be collected,
+    and the range is further cut into `workers` chunks of similar lengths, such that every worker has work to do.
+    """
+    last = iterations[-1]
+    size = max(1, math.ceil(last / workers))
+    boundaries = sorted(set([0] + list(iterations) + list(range(0, last, size))))
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def segment_products(
+    product: Callable[[int, int], object],
+    segments: List[Tuple[int, int]],
+    workers: int,
+) -> List[object]:
+    """
+    Returns `product(begin, end)` for every segment, calculated in a pool of `workers` processes.
+
+    `product` and its results must be picklable. If `workers == 1`, all products are calculated in this process.
+    """
+    begins = [begin for begin, _ in segments]
+    ends = [end for _, end in segments]
+    if workers == 1:
+        return list(map(product, begins, ends))
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(product, begins, ends))
@@ -0,0 +1,28 @@
+from ramanujantools.parallel import segments, segment_products
+
+
+def length(begin: int, end: int) -> int:
+    return end - begin
+
+
+def test_segments_contain_iterations():
+    iterations = [0, 3, 10, 11, 50]
+    result = segments(iterations, 4)
+    assert 0 == result[0][0]
+    assert 50 == result[-1][1]
+    boundaries = [end for _, end in result]
+    assert all(depth in boundaries for depth in iterations[1:])
+    assert all(end == begin for (_, end), (begin, _) in zip(result, result[1:]))
+
+
+def test_segments_workers():
+    assert [(0, 5), (5, 10)] == segments([10], 2)
+    assert [(0, 10)] == segments([10], 1)
+    assert [] == segments([0], 3)
+
+
+def test_segment_products():
+    walk_segments = segments([3, 20], 3)
+    expected = [end - begin for begin, end in walk_segments]
+    for workers in [1, 2]:
+        assert expected == segment_products(length, walk_segments, workers)
@@ -2,7 +2,7 @@ import mpmath as mp
 import sympy as sp
 from sympy.abc import n
 
-from typing import Dict, List, Collection
+from typing import Dict, List, Collection, Optional
 from multimethod import multimethod
 
 from ramanujantools import Matrix, Limit
@@ -144,7 +144,12 @@ class PCF:
         ]
 
     @multimethod
-    def walk(self, iterations: Collection[int], start: int = 0) -> List[Matrix]:
+    def walk(
+        self,
+        iterations: Collection[int],
+        start: int = 0,
+        precision: Optional[int] = None,
+    ) -> List[Matrix]:
         r"""
         Returns the matrix corresponding to calculating the PCF up to a certain depth, including $a_0$
 
@@ -154,6 +159,8 @@ class PCF:
         Args:
             iterations: The amount of multiplications to perform. Can be an integer value or a list of values.
             start: The n value of the first matrix to be multiplied (1 by default)
+            precision: if not None, calculates the walk using floating point numbers
+                of `precision` decimal digits. See `Matrix.walk`.
         Returns:
             The pcf convergence limit as defined above.
             If iterations is a list, returns a list of limits.
@@ -169,18 +176,29 @@ class PCF:
                 iterations = iterations[1:]
                 walk_results.append(Matrix.eye(2))
             actual_iterations = sorted([depth - 1 for depth in iterations])
-            current_results = self.M().walk({n: 1}, actual_iterations, {n: 1})
+            current_results = self.M().walk(
+                {n: 1}, actual_iterations, {n: 1}, precision=precision
+            )
             walk_results += [self.A() * result for result in current_results]
         else:
-            walk_results += self.M().walk({n: 1}, iterations, {n: start})
+            walk_results += self.M().walk(
+                {n: 1}, iterations, {n: start}, precision=precision
+            )
         return walk_results
 
     @multimethod
-    def walk(self, iterations: int, start: int = 0) -> Matrix:  # noqa: F811
-        return self.walk([iterations], start)[0]
+    def walk(  # noqa: F811
+        self, iterations: int, start: int = 0, precision: Optional[int] = None
+    ) -> Matrix:
+        return self.walk([iterations], start, precision)[0]
 
     @multimethod
-    def limit(self, iterations: Collection[int], start: int = 0) -> List[Limit]:
+    def limit(
+        self,
+        iterations: Collection[int],
+        start: int = 0,
+        precision: Optional[int] = None,
+    ) -> List[Limit]:
         r"""
         Returns the limit corresponding to calculating the PCF up to a certain depth, including $a_0$
 
@@ -189,19 +207,25 @@ class PCF:
         Args:
             iterations: The amount of multiplications to perform. Can be an integer value or a list of values.
             start: The n value of the first matrix to be multiplied (1 by default)
+            precision: if not None, calculates the walk using floating point numbers
+                of `precision` decimal digits. See `Matrix.walk`.
         Returns:
             The pcf convergence limit as defined above.
             If iterations is a list, returns a list of limits.
         """
 
         def walk_function(iterations):
-            return self.walk(iterations, start)
+            return self.walk(iterations, start, precision)
 
-        return Limit.walk_to_limit(iterations, walk_function)
+        return Limit.walk_to_limit(
+            iterations, walk_function, working_precision=precision
+        )
 
     @multimethod
-    def limit(self, iterations: int, start: int = 0) -> Limit:  # noqa: F811
-        return self.limit([iterations], start)[0]
+    def limit(  # noqa: F811
+        self, iterations: int, start: int = 0, precision: Optional[int] = None
+    ) -> Limit:
+        return self.limit([iterations], start, precision)[0]
 
     def delta(self, depth, limit=None):
         r"""
@@ -128,6 +128,19 @@ def test_precision_e():
     assert pcf.limit(2**10 + 1).precision() == 2642
 
 
+def test_limit_fixed_precision():
+    pcf = PCF(5 + 10 * n, 1 - 9 * n**2)
+    expected = pcf.limit(1000)
+    actual = pcf.limit(1000, precision=50)
+    assert expected.as_float() == approx(actual.as_float(), abs=1e-45)
+
+
+def test_precision_capped_by_working_precision():
+    pcf = PCF(n, n)
+    assert pcf.limit(100).precision() > 30
+    assert 30 == pcf.limit(100, precision=30).precision()
+
+
 def test_precision_phi():
     pcf = PCF(1, 1)
     assert pcf.limit(2**10 + 1).precision() == 427
@@ -3,6 +3,8 @@ from typing import Dict, Set
 
 import sympy as sp
 
+from ramanujantools.caching import digest
+
 
 class Position(dict):
     r"""
@@ -55,6 +57,19 @@ class Position(dict):
     def __hash__(self):
         return hash(frozenset(self.items()))
 
+    def digest(self) -> str:
+        """
+        Returns a deterministic digest of the position, which is stable across processes and runs.
+        """
+        return digest(
+            repr(
+                sorted(
+                    (sp.srepr(sp.sympify(key)), sp.srepr(sp.sympify(value)))
+                    for key, value in self.items()
+                )
+            )
+        )
+
     def copy(self):
         return Position(super().copy())
 
@@ -107,6 +122,12 @@ class Position(dict):
         """
         return all(sp.simplify(element).is_Integer for element in self.values())
 
+    def is_rational(self) -> bool:
+        """
+        Returns true iff all position elements are rational numbers
+        """
+        return all(sp.simplify(element).is_Rational for element in self.values())
+
     def free_symbols(self) -> Set:
         symbols = set()
         for value in self.values():
@@ -76,6 +76,13 @@ def test_is_integer():
     assert not Position({x: sp.Rational(1, 2), y: 1}).is_integer()
 
 
+def test_is_rational():
+    assert Position({x: 1, y: 7}).is_rational()
+    assert Position({x: sp.Rational(1, 2), y: 1}).is_rational()
+    assert not Position({x: 1, y: x**2 + 3 * x + 1}).is_rational()
+    assert not Position({x: sp.sqrt(2), y: 1}).is_rational()
+
+
 def test_is_polynomial():
     assert Position({x: 1, y: 7}).is_polynomial()
     assert Position({x: 1, y: x**2 + 3 * x + 1}).is_polynomial()
@@ -92,3 +99,10 @@ def test_is_denominator_lcm():
 
 def test_free_symbols():
     assert {x, z} == Position({x: 1, y: z, z: x}).free_symbols()
+
+
+def test_digest():
+    p = Position({x: 1, y: sp.Rational(1, 2), z: x + 1})
+    assert p.digest() == Position({z: x + 1, y: sp.Rational(1, 2), x: 1}).digest()
+    assert p.digest() != Position({x: 1, y: sp.Rational(1, 2), z: x + 2}).digest()
+    assert p.digest() != Position({x: 1, y: sp.Rational(1, 2)}).digest()
@@ -12,6 +12,7 @@ setup(
         "ramanujantools.cmf.ffbar",
         "ramanujantools.cmf.known_cmfs",
         "ramanujantools.flint_core",
+        "ramanujantools.numeric_core",
     ],
     install_requires=[
         "tqdm>=4.65.0",